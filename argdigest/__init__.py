@@ -13,15 +13,13 @@ except PackageNotFoundError:
     except ImportError:
         __version__ = "0.0.0+unknown"
 
-from smonitor.integrations import ensure_configured as _ensure_smonitor_configured
-from ._private.smonitor import PACKAGE_ROOT as _SMONITOR_PACKAGE_ROOT
-
-_ensure_smonitor_configured(_SMONITOR_PACKAGE_ROOT)
-
+# smonitor is configured by the first diagnostic, not here; see
+# `argdigest._private.smonitor.emitter.ensure_configured`.
 from .core.decorator import arg_digest  # noqa: E402
 from .core.registry import register_pipeline, get_pipelines  # noqa: E402
 from .core.argument_registry import argument_digest  # noqa: E402
 from .core.config import DigestConfig  # noqa: E402
+from .core.caches import cache_clear, cache_info  # noqa: E402
 from .core.normalization import (  # noqa: E402
     AliasTable,
     describe_normalization,
@@ -41,14 +39,41 @@ from .core.errors import (  # noqa: E402
     DigestError,
     DigestTypeError,
     DigestValueError,
+    DigestCopyError,
     DigestInvariantError,
     DigestNotDigestedError,
     DigestNotDigestedWarning,
 )
 
-# Register standard pipelines
+# Declare the standard pipelines; each kind's modules load on its first use.
 from . import pipelines  # noqa: E402
 
+#: Telemetry entry point -> the module defining it, imported on first access: a process
+#: that never asks for a report does not load the machinery behind it.
+_TELEMETRY = {
+    "warmup": "warmup",
+    "stats": "metrics",
+    "nested_calls": "nesting",
+    "slow_calls": "slowlog",
+    "allocations": "allocations",
+    "copies": "copies",
+    "warning_counts": "warning_counts",
+}
+
+
+def __getattr__(name):
+    module = _TELEMETRY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = globals()[name] = getattr(import_module(f"{__name__}.core.{module}"), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TELEMETRY))
+
 __all__ = [
     "arg_digest",
     "register_pipeline",
@@ -59,6 +84,7 @@ __all__ = [
     "DigestError",
     "DigestTypeError",
     "DigestValueError",
+    "DigestCopyError",
     "DigestInvariantError",
     "DigestNotDigestedError",
     "DigestNotDigestedWarning",
@@ -73,4 +99,13 @@ __all__ = [
     "AliasTable",
     "describe_normalization",
     "StandardizerContractError",
+    "cache_clear",
+    "cache_info",
+    "warmup",
+    "stats",
+    "nested_calls",
+    "slow_calls",
+    "allocations",
+    "copies",
+    "warning_counts",
 ]
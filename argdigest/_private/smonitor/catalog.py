@@ -26,6 +26,12 @@ CATALOG = {
             "category": "argument",
             "level": "ERROR",
         },
+        "DigestCopyError": {
+            "code": "ARG-ERR-COPY-001",
+            "source": "argdigest.error.copy",
+            "category": "argument",
+            "level": "ERROR",
+        },
         "DigestInvariantError": {
             "code": "ARG-ERR-INV-001",
             "source": "argdigest.error.invariant",
@@ -82,6 +88,12 @@ CATALOG = {
             "category": "dependency",
             "level": "WARNING",
         },
+        "SlowCallWarning": {
+            "code": "ARG-WARN-SLOW-001",
+            "source": "argdigest.warning.slow_call",
+            "category": "performance",
+            "level": "WARNING",
+        },
     }
 }
 
@@ -100,6 +112,13 @@ CODES = {
         "dev_message": "Value error in '{caller}' for '{argname}': {message}",
         "dev_hint": "Validate value constraints. {hint}",
     },
+    "ARG-ERR-COPY-001": {
+        "title": "Argument Copy Refused",
+        "user_message": "Argument '{argname}' would have to be copied. {message}",
+        "user_hint": "Pass the argument in the expected array type and dtype. {hint} Docs: {doc_url}",
+        "dev_message": "Copy refused in '{caller}' for '{argname}': {message}",
+        "dev_hint": "The function sets copy_limit; convert upstream or raise the limit. {hint}",
+    },
     "ARG-ERR-INV-001": {
         "title": "Argument Invariant Error",
         "user_message": "Invariant violation for argument '{argname}'. {message}",
@@ -163,13 +182,22 @@ CODES = {
         "dev_message": "type_check=True but 'beartype' is not installed in '{caller}'.",
         "dev_hint": "Install beartype or set type_check=False.",
     },
+    "ARG-WARN-SLOW-001": {
+        "title": "Digestion over its latency budget",
+        "user_message": "Validating the arguments of '{caller}' took {elapsed_ms} ms, over its budget of {budget_ms} ms.",
+        "user_hint": "Report this to the maintainers of the library. Docs: {doc_url}",
+        "dev_message": "Digestion of '{caller}' took {elapsed_ms} ms (budget {budget_ms} ms); slowest stage: {slowest_stage}. {suppressed} more slow calls since the last report.",
+        "dev_hint": "See argdigest.slow_calls() for the stage breakdown and argument types.",
+    },
 }
 
 SIGNALS = {
     "argdigest.error.type": {"extra_required": ["argname", "message", "caller"]},
     "argdigest.error.value": {"extra_required": ["argname", "message", "caller"]},
     "argdigest.error.invariant": {"extra_required": ["argname", "message", "caller"]},
+    "argdigest.error.copy": {"extra_required": ["argname", "message", "caller"]},
     "argdigest.error.missing": {"extra_required": ["argname", "message", "caller"]},
     "argdigest.warning.missing": {"extra_required": ["argname", "caller"]},
     "argdigest.warning.typecheck_skipped": {"extra_required": ["caller"]},
+    "argdigest.warning.slow_call": {"extra_required": ["caller", "elapsed_ms", "budget_ms"]},
 }
@@ -1,10 +1,77 @@
 from __future__ import annotations
 
+import sys
+import threading
+import warnings
+
 from smonitor.integrations import DiagnosticBundle
 from .catalog import CATALOG, META, PACKAGE_ROOT
 
 bundle = DiagnosticBundle(CATALOG, META, PACKAGE_ROOT)
 
-warn = bundle.warn
-warn_once = bundle.warn_once
+# smonitor is configured on the first diagnostic rather than on `import argdigest`:
+# reading profiles and environment is wasted on a run that never reports anything.
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def ensure_configured() -> None:
+    global _configured
+
+    if _configured:
+        return
+    with _configure_lock:
+        if not _configured:
+            from smonitor.integrations import ensure_configured as _ensure
+
+            _ensure(PACKAGE_ROOT)
+            _configured = True
+
+
+def _emit_warning(key: str, extra: dict) -> None:
+    from smonitor.integrations import emit_from_catalog, merge_extra
+
+    ensure_configured()
+    emit_from_catalog(CATALOG["warnings"][key], package_root=PACKAGE_ROOT,
+                      extra=merge_extra(META, extra))
+
+
+def _caller_stacklevel() -> int:
+    """The `stacklevel` naming the first frame outside ArgDigest (and smonitor, which
+    may wrap it) for a warning raised by `warn`: the call of the decorated function."""
+
+    frame = sys._getframe(2)
+    level = 2
+    while frame is not None:
+        module = frame.f_globals.get("__name__") or ""
+        if module.partition(".")[0] not in ("argdigest", "smonitor"):
+            return level
+        frame = frame.f_back
+        level += 1
+    return 2
+
+
+def warn(*args, **kwargs):
+    """Raise a catalog warning, and report its catalog event.
+
+    The Python warning is raised here, attributed to the call of the decorated function,
+    so filters and `pytest.warns` apply to the caller; the event goes through the
+    `emission` queue.
+    """
+    warning = args[0] if len(args) == 1 and not kwargs else None
+    key = getattr(warning, "catalog_key", None)
+    if not isinstance(warning, Warning) or key not in CATALOG["warnings"]:
+        ensure_configured()
+        return bundle.warn(*args, **kwargs)
+    warnings.warn(warning, stacklevel=_caller_stacklevel())
+    from ...core import emission
+
+    emission.submit(_emit_warning, key, dict(getattr(warning, "catalog_extra", None) or {}))
+
+
+def warn_once(*args, **kwargs):
+    ensure_configured()
+    return bundle.warn_once(*args, **kwargs)
+
+
 resolve = bundle.resolve
@@ -39,6 +39,76 @@ def audit_module(module_name: str):
     if not found:
         print("\nNo functions with @arg_digest found in this module.")
 
+def compile_command(module_name: str, output: str | None = None, check: bool = False) -> int:
+    """
+    Compiles the digestion plans of a package and prints what was written.
+    """
+    from .core.compiler import compile_module
+
+    try:
+        report = compile_module(module_name, output=output, check=check)
+    except (ImportError, ValueError) as e:
+        print(f"Error: Could not compile module '{module_name}': {e}")
+        return 1
+
+    for skipped in report["skipped"]:
+        print(f"  skipped {skipped}")
+    if check:
+        state = "up to date" if report["current"] else "stale"
+        print(f"{report['path']} is {state} ({report['functions']} functions)")
+        return 0 if report["current"] else 1
+    print(f"Compiled {report['functions']} functions into {report['path']}")
+    return 0
+
+def profile_import_command(module_name: str, top: int = 20, as_json: bool = False) -> int:
+    """
+    Imports a package under instrumentation and prints where decoration time went.
+    """
+    from .core.import_profile import profile_import
+
+    try:
+        report = profile_import(module_name)
+    except ImportError as e:
+        print(f"Error: Could not import module '{module_name}': {e}")
+        return 1
+
+    if as_json:
+        import json
+
+        print(json.dumps(report, indent=2))
+        return 0
+
+    functions = report["functions"]
+    print(f"\nImport Profile for module: {module_name}")
+    print("=" * (27 + len(module_name)))
+    print(f"  Import time:      {report['import_time'] * 1e3:9.2f} ms")
+    print(f"  Decoration time:  {report['decoration_time'] * 1e3:9.2f} ms "
+          f"({len(functions)} decorated functions)")
+    print(f"  Modules imported: {report['modules_imported']}")
+
+    if report["stages"]:
+        print("\nBy stage:")
+        for name, seconds in report["stages"].items():
+            print(f"  {name:<20} {seconds * 1e3:9.2f} ms")
+
+    if functions:
+        print(f"\nSlowest functions (top {min(top, len(functions))}):")
+        for record in functions[:top]:
+            stages = ", ".join(f"{name}={seconds * 1e3:.2f}"
+                               for name, seconds in sorted(record["stages"].items(),
+                                                           key=lambda item: item[1],
+                                                           reverse=True))
+            print(f"  {record['total'] * 1e3:9.2f} ms  {record['function']}")
+            if stages:
+                print(f"               {stages}")
+
+    if report["argdigest_imports"]:
+        print("\nModules imported by decoration:")
+        for name, modules in report["argdigest_imports"].items():
+            print(f"  {name}: {len(modules)} ({', '.join(modules[:5])}"
+                  f"{', ...' if len(modules) > 5 else ''})")
+    return 0
+
 def main():
     parser = argparse.ArgumentParser(prog="argdigest", description="ArgDigest CLI Tool")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -47,6 +117,18 @@ def main():
     audit_parser = subparsers.add_parser("audit", help="Audit validation rules in a module")
     audit_parser.add_argument("module", help="Module or package name to audit (e.g. mylib.api)")
 
+    # Compile command
+    compile_parser = subparsers.add_parser("compile", help="Precompile digestion plans of a package")
+    compile_parser.add_argument("--module", required=True, help="Package whose decorated functions are compiled")
+    compile_parser.add_argument("--output", default=None, help="Output file (default: <package>/_argdigest_compiled.py)")
+    compile_parser.add_argument("--check", action="store_true", help="Only report whether the compiled file is current")
+
+    # Profile-import command
+    profile_parser = subparsers.add_parser("profile-import", help="Attribute decoration cost while importing a package")
+    profile_parser.add_argument("--module", required=True, help="Package to import under instrumentation")
+    profile_parser.add_argument("--top", type=int, default=20, help="Number of slowest functions to list")
+    profile_parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+
     # Health check command
     subparsers.add_parser("health-check", help="Run ecosystem health checks")
 
@@ -64,6 +146,14 @@ def main():
 
     if args.command == "audit":
         audit_module(args.module)
+    elif args.command == "compile":
+        status = compile_command(args.module, output=args.output, check=args.check)
+        if status:
+            raise SystemExit(status)
+    elif args.command == "profile-import":
+        status = profile_import_command(args.module, top=args.top, as_json=args.json)
+        if status:
+            raise SystemExit(status)
     elif args.command == "health-check":
         report = run_health_check()
         print("ArgDigest ecosystem health check")
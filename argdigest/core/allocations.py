@@ -0,0 +1,168 @@
+"""Memory allocated by digesters and pipeline rules, behind `argdigest.allocations()`.
+
+Validation can copy what it validates: ``np.asarray`` on a list inside ``has_ndim``
+allocates a whole array only to read its ``ndim``. While enabled
+(`argdigest.allocations.enable()`), every digester and pipeline rule is measured with
+`tracemalloc` -- the memory traced before it ran, after it returned, and the peak in
+between -- and the result is aggregated per rule and per caller:
+
+- `net`: bytes still allocated when it returned, typically the value it produced;
+- `peak`: the largest amount it had allocated at once, temporaries included;
+- `flagged`: calls that returned their input unchanged and still peaked at
+  `FLAG_THRESHOLD` bytes or more. Whatever they allocated was thrown away.
+
+`enable` starts `tracemalloc` unless it is already tracing, and `disable` stops it only
+if `enable` started it. Tracing slows every allocation of the process down, so this is a
+mode for a test run or a benchmark, not for production. tracemalloc counts the whole
+process: measure on one thread, or allocations of other threads are charged to the rule
+that happens to be running.
+
+Snapshots would attribute allocations to source lines, but taking two per rule costs
+far more than the rules themselves; `get_traced_memory` and `reset_peak` are enough to
+say which rule to look at.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable
+
+ENABLED = False
+
+#: Peak bytes above which a rule returning its input unchanged is flagged.
+FLAG_THRESHOLD = 1024
+
+_lock = threading.Lock()
+_local = threading.local()
+_started = False
+# name -> [calls, net, peak, flagged, flagged bytes], for rules and for callers.
+_RULES: dict[str, list[int]] = {}
+_CALLERS: dict[str, list[int]] = {}
+
+
+class _Measure:
+    __slots__ = ("before", "peak")
+
+    def __init__(self, before: int) -> None:
+        self.before = before
+        # The highest traced memory seen while a nested measurement had reset the peak.
+        self.peak = before
+
+
+def _start() -> _Measure:
+    # tracemalloc is imported by what uses it, not by `import argdigest`.
+    import tracemalloc
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # The peak is about to be reset: keep what the enclosing measurement saw.
+        outer = stack[-1]
+        outer.peak = max(outer.peak, peak)
+    tracemalloc.reset_peak()
+    measure = _Measure(current)
+    stack.append(measure)
+    return measure
+
+
+def _finish(measure: _Measure) -> tuple[int, int]:
+    import tracemalloc
+
+    current, peak = tracemalloc.get_traced_memory()
+    stack = _local.stack
+    while stack and stack.pop() is not measure:
+        pass
+    if stack:
+        stack[-1].peak = max(stack[-1].peak, peak)
+    return current, peak
+
+
+def call(name: str, caller: str, value: Any, fn: Callable[..., Any], /, *args: Any,
+         **kwargs: Any) -> Any:
+    """Run ``fn(*args, **kwargs)``, a digester or rule given `value`, and charge what it
+    allocated to `name` and `caller`. A call that raises is not charged."""
+
+    measure = _start()
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException:
+        _finish(measure)
+        raise
+    current, peak = _finish(measure)
+    net = current - measure.before
+    peak = max(peak, measure.peak) - measure.before
+    flagged = result is value and peak >= FLAG_THRESHOLD
+    with _lock:
+        for table, key in ((_RULES, name), (_CALLERS, caller)):
+            totals = table.get(key)
+            if totals is None:
+                totals = table[key] = [0, 0, 0, 0, 0]
+            totals[0] += 1
+            totals[1] += net
+            totals[2] = max(totals[2], peak)
+            if flagged:
+                totals[3] += 1
+                totals[4] += peak
+    return result
+
+
+def _report(table: dict[str, list[int]]) -> dict[str, dict[str, int]]:
+    rows = {
+        key: {"calls": calls, "net": net, "peak": peak, "flagged": flagged,
+              "flagged_bytes": flagged_bytes}
+        for key, (calls, net, peak, flagged, flagged_bytes) in table.items()
+    }
+    return dict(sorted(rows.items(), key=lambda item: item[1]["peak"], reverse=True))
+
+
+def allocations() -> dict[str, Any]:
+    """Snapshot what was measured so far, per rule and per caller, highest peak first.
+
+    Digesters are keyed by their qualified name, pipeline rules as ``kind.rule``. `net`
+    is summed over calls, `peak` is the largest of any one call, `flagged_bytes` the sum
+    of the peaks of flagged calls.
+    """
+
+    with _lock:
+        return {"enabled": ENABLED, "rules": _report(_RULES), "callers": _report(_CALLERS)}
+
+
+def enable() -> None:
+    """Start measuring digesters and pipeline rules, and tracing if needed."""
+
+    global ENABLED, _started
+
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started = True
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stop measuring; what was collected is kept."""
+
+    global ENABLED, _started
+
+    ENABLED = False
+    if _started:
+        import tracemalloc
+
+        tracemalloc.stop()
+        _started = False
+
+
+def reset() -> None:
+    """Forget everything collected so far."""
+
+    with _lock:
+        _RULES.clear()
+        _CALLERS.clear()
+
+
+allocations.enable = enable  # type: ignore[attr-defined]
+allocations.disable = disable  # type: ignore[attr-defined]
+allocations.reset = reset  # type: ignore[attr-defined]
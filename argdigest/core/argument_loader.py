@@ -5,16 +5,18 @@ import pkgutil
 from importlib import import_module
 from types import ModuleType
 from typing import Any, Callable, Iterable
-from functools import lru_cache
 
+from .caches import memoize
 from .argument_registry import ArgumentRegistry
+from .import_profile import stage
 
 
 def resolve_standardizer(standardizer: Any) -> Callable[[str, dict[str, Any]], dict[str, Any]] | None:
     if standardizer is None:
         return None
     if callable(standardizer):
-        _check_standardizer_signature(standardizer)
+        with stage("standardizer_check"):
+            _check_standardizer_signature(standardizer)
         return standardizer
     if isinstance(standardizer, str):
         module_path, _, attr = standardizer.partition(":")
@@ -26,7 +28,8 @@ def resolve_standardizer(standardizer: Any) -> Callable[[str, dict[str, Any]], d
         fn = getattr(module, attr)
         if not callable(fn):
             raise TypeError("standardizer must resolve to a callable")
-        _check_standardizer_signature(fn)
+        with stage("standardizer_check"):
+            _check_standardizer_signature(fn)
         return fn
     raise TypeError("standardizer must be a callable, a string, or None")
 
@@ -76,7 +79,7 @@ def _merge_digesters(target: dict[str, Callable[..., Any]],
             target[name] = fn
 
 
-@lru_cache(maxsize=None)
+@memoize(maxsize=256)
 def _load_from_registry(module_path: str) -> dict[str, Callable[..., Any]]:
     module = import_module(module_path)
     digesters = getattr(module, "ARGUMENT_DIGESTERS", None)
@@ -87,7 +90,7 @@ def _load_from_registry(module_path: str) -> dict[str, Callable[..., Any]]:
     return dict(digesters)
 
 
-@lru_cache(maxsize=None)
+@memoize(maxsize=256)
 def _load_from_package(package_path: str) -> dict[str, Callable[..., Any]]:
     package = import_module(package_path)
     if not hasattr(package, "__path__"):
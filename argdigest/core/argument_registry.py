@@ -3,26 +3,31 @@ from __future__ import annotations
 import threading
 from typing import Any, Callable
 
+from .caches import invalidate
+
 
 class ArgumentRegistry:
-    # argument name -> callable
+    # argument name -> callable. Copy-on-write, like `Registry`: writers publish a new
+    # dict under the lock, readers take whichever one is published without it.
     _digesters: dict[str, Callable[..., Any]] = {}
     _lock = threading.RLock()
 
     @classmethod
     def register(cls, name: str, func: Callable[..., Any]) -> None:
         with cls._lock:
-            cls._digesters[name] = func
+            cls._digesters = {**cls._digesters, name: func}
+        # Plans built from the registry are stale now, and must not pin what it replaced.
+        invalidate()
 
     @classmethod
     def get_all(cls) -> dict[str, Callable[..., Any]]:
-        with cls._lock:
-            return dict(cls._digesters)
+        return dict(cls._digesters)
 
     @classmethod
     def clear(cls) -> None:
         with cls._lock:
-            cls._digesters.clear()
+            cls._digesters = {}
+        invalidate()
 
 
 def argument_digest(name: str):
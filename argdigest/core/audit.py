@@ -0,0 +1,159 @@
+"""Pipeline rule timings of profiled functions, in a fixed-size ring.
+
+With ``profiling=True`` every pipeline rule run by a sampled call is recorded in the
+`audit_log` of its decorated function. The log used to be a list replaced on each call:
+concurrent calls overwrote each other's, each record was a new dict, and only the last
+call was ever visible. `RuleTimings` keeps the most recent `capacity` records of every
+call instead, in preallocated arrays -- rule, caller and argument as interned ids,
+duration, thread id -- written under a lock, so recording allocates no container.
+
+Reading is where records become dicts: indexing and iterating still yield
+``{"rule": ..., "duration": ...}`` entries, with the caller, argument and thread added.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from typing import Any, Iterator
+
+#: Records kept per decorated function before the oldest are overwritten.
+DEFAULT_CAPACITY = 1024
+
+_names_lock = threading.Lock()
+# name -> id, and id -> name. Shared by every log: a rule or caller is interned once.
+_ids: dict[str, int] = {}
+_names: list[str] = []
+
+
+def intern_name(name: str) -> int:
+    """The id of a name, assigned on first sight."""
+
+    try:
+        return _ids[name]
+    except KeyError:
+        pass
+    with _names_lock:
+        if name not in _ids:
+            _ids[name] = len(_names)
+            _names.append(name)
+        return _ids[name]
+
+
+class RuleTimings:
+    """A thread-safe ring buffer of pipeline rule timings."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._rules = array("q", bytes(8 * capacity))
+        self._callers = array("q", bytes(8 * capacity))
+        self._arguments = array("q", bytes(8 * capacity))
+        self._threads = array("Q", bytes(8 * capacity))
+        self._durations = array("d", bytes(8 * capacity))
+        # Records written since the last `clear`; the slot of the next one is this
+        # modulo the capacity.
+        self._written = 0
+        self._lock = threading.Lock()
+
+    def record(self, rule: str, caller: str, argname: str, duration: float) -> None:
+        rule_id = intern_name(rule)
+        caller_id = intern_name(caller)
+        argument_id = intern_name(argname)
+        thread_id = threading.get_ident()
+        with self._lock:
+            slot = self._written % self.capacity
+            self._rules[slot] = rule_id
+            self._callers[slot] = caller_id
+            self._arguments[slot] = argument_id
+            self._threads[slot] = thread_id
+            self._durations[slot] = duration
+            self._written += 1
+
+    @property
+    def dropped(self) -> int:
+        """Records overwritten because the ring was full."""
+
+        return max(0, self._written - self.capacity)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._written = 0
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    def _rows(self) -> list[tuple[int, int, int, int, float]]:
+        with self._lock:
+            written = self._written
+            count = min(written, self.capacity)
+            first = written - count
+            return [
+                (self._rules[slot], self._callers[slot], self._arguments[slot],
+                 self._threads[slot], self._durations[slot])
+                for slot in (index % self.capacity for index in range(first, written))
+            ]
+
+    @staticmethod
+    def _entry(row: tuple[int, int, int, int, float]) -> dict[str, Any]:
+        rule_id, caller_id, argument_id, thread_id, duration = row
+        return {"rule": _names[rule_id], "duration": duration, "caller": _names[caller_id],
+                "argname": _names[argument_id], "thread": thread_id}
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Every record kept, oldest first."""
+
+        return [self._entry(row) for row in self._rows()]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.entries())
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        with self._lock:
+            written = self._written
+            count = min(written, self.capacity)
+            if index < 0:
+                index += count
+            if not 0 <= index < count:
+                raise IndexError("RuleTimings index out of range")
+            slot = (written - count + index) % self.capacity
+            row = (self._rules[slot], self._callers[slot], self._arguments[slot],
+                   self._threads[slot], self._durations[slot])
+        return self._entry(row)
+
+    def _aggregate(self, column: int) -> dict[str, dict[str, float]]:
+        totals: dict[str, dict[str, float]] = {}
+        for row in self._rows():
+            name = _names[row[column]]
+            duration = row[4]
+            total = totals.get(name)
+            if total is None:
+                totals[name] = {"count": 1, "total": duration, "max": duration}
+            else:
+                total["count"] += 1
+                total["total"] += duration
+                total["max"] = max(total["max"], duration)
+        return dict(sorted(totals.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def by_rule(self) -> dict[str, dict[str, float]]:
+        """Count, total and maximum duration per rule, slowest total first."""
+
+        return self._aggregate(0)
+
+    def by_caller(self) -> dict[str, dict[str, float]]:
+        """Count, total and maximum rule duration per caller, slowest total first."""
+
+        return self._aggregate(1)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Ids are only meaningful in this process, so records travel by name.
+        return {"capacity": self.capacity, "entries": self.entries()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["capacity"])
+        for entry in state["entries"]:
+            self.record(entry["rule"], entry["caller"], entry["argname"], entry["duration"])
+
+    def __repr__(self) -> str:
+        return f"RuleTimings({len(self)}/{self.capacity} records, {self.dropped} dropped)"
@@ -0,0 +1,232 @@
+"""Discovery caches, the generation that tracks them, and `cache_clear`.
+
+Configuration modules, digester packages and axis-1 declarations are each read once and
+memoized. Anything derived from them -- the plan templates of the decorator -- must be
+dropped when one of them is cleared, or it would keep serving what the cleared cache
+no longer holds. `memoize` is `functools.lru_cache` whose `cache_clear` also advances
+`generation()`, so a derived cache only has to compare one integer.
+
+Every cache ArgDigest keeps is registered here by name, bounded or weakly keyed, with
+what is known about it: its kind, its size and bound, and its hits, misses and
+evictions. `cache_info()` lists them all, `set_maxsize` changes a bound, and
+`cache_clear()` empties them -- all of them, one kind, or one cache by name. A
+long-lived process that keeps decorating and discarding closures never accumulates them.
+
+Kinds:
+
+- ``discovery``: configuration modules, digester packages and declarations, read once;
+- ``plans``: plan templates and compiled plans, derived from discovery;
+- ``metadata``: what is computed from a digester or a caller once -- signatures, default
+  contracts, latency budgets;
+- ``resolution``: per-plan memos of the contract and aliases that apply to each caller.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from functools import lru_cache, update_wrapper
+from typing import Any, Callable
+
+KINDS = ("discovery", "plans", "metadata", "resolution")
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+class CacheStats:
+    """Hit, miss and eviction counters, for a cache that is not an `lru_cache`.
+
+    Incremented without a lock: under contention a few counts may be lost, which a hot
+    path is better off with than a lock.
+    """
+
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def reset(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+
+@dataclass
+class _Cache:
+    kind: str
+    clear: Callable[[], None]
+    size: Callable[[], int] | None
+    stats: CacheStats | Callable[[], tuple[int, int, int | None]] | None
+    maxsize: Callable[[], int | None] | None
+    resize: Callable[[int | None], None] | None
+
+
+# name -> the cache registered under it.
+_CACHES: dict[str, _Cache] = {}
+# Names of the caches derived from discovery, emptied by `invalidate` as well.
+_DERIVED: set[str] = set()
+
+
+def register(name: str, clear: Callable[[], None], derived: bool = False, *,
+             kind: str = "metadata",
+             size: Callable[[], int] | None = None,
+             stats: CacheStats | Callable[[], tuple[int, int, int | None]] | None = None,
+             maxsize: Callable[[], int | None] | None = None,
+             resize: Callable[[int | None], None] | None = None) -> None:
+    """Make a cache known to `cache_clear` and `cache_info` under a name.
+
+    A `derived` cache holds results computed from discovery, and is emptied eagerly on
+    every `invalidate` so it never pins what discovery has let go of. `stats` is a
+    `CacheStats`, or a function returning ``(hits, misses, evictions)``; `resize` makes
+    the bound configurable through `set_maxsize`.
+    """
+
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}")
+    _CACHES[name] = _Cache(kind, clear, size, stats, maxsize, resize)
+    if derived:
+        _DERIVED.add(name)
+
+
+def register_lru(name: str, cached: Any, kind: str = "metadata", derived: bool = False) -> None:
+    """Register a `functools.lru_cache` function; its statistics come from `cache_info`."""
+
+    register(name, cached.cache_clear, derived, kind=kind,
+             size=lambda: cached.cache_info().currsize,
+             stats=lambda: _lru_stats(cached.cache_info()),
+             maxsize=lambda: cached.cache_info().maxsize)
+
+
+def _lru_stats(info: Any) -> tuple[int, int, int | None]:
+    # Every miss inserts, so what is not there anymore since the last clear was evicted.
+    return info.hits, info.misses, info.misses - info.currsize
+
+
+def _matching(kind: str | None) -> list[str]:
+    if kind is None:
+        return list(_CACHES)
+    if kind in KINDS:
+        return [name for name, cache in _CACHES.items() if cache.kind == kind]
+    if kind in _CACHES:
+        return [kind]
+    raise ValueError(f"unknown cache kind or name: {kind!r}; kinds are {KINDS}, "
+                     f"names are {sorted(_CACHES)}")
+
+
+def cache_clear(kind: str | None = None) -> None:
+    """Empty every cache ArgDigest keeps, or those of one kind, or one cache by name.
+
+    Decorated functions keep working: their plans are already built. What is rebuilt on
+    demand is discovery -- configuration modules, digester packages, declarations -- for
+    the next decoration, and the digester metadata for the next call. Clearing a
+    discovery cache also drops what was derived from it.
+    """
+
+    names = _matching(kind)
+    for name in names:
+        cache = _CACHES[name]
+        cache.clear()
+        if isinstance(cache.stats, CacheStats):
+            cache.stats.reset()
+    if kind is None or any(_CACHES[name].kind == "discovery" for name in names):
+        invalidate()
+
+
+def cache_info(kind: str | None = None) -> dict[str, dict[str, Any]]:
+    """Describe every cache, or those of one kind, or one cache by name.
+
+    Per cache: its `kind`, `size`, `maxsize` (None when unbounded or weakly keyed),
+    `hits`, `misses` and `evictions` since it was last cleared -- None where a cache
+    cannot tell -- and whether it is `resizable` with `set_maxsize`.
+    """
+
+    info = {}
+    for name in sorted(_matching(kind)):
+        cache = _CACHES[name]
+        hits = misses = evictions = None
+        if isinstance(cache.stats, CacheStats):
+            hits, misses, evictions = cache.stats.hits, cache.stats.misses, cache.stats.evictions
+        elif cache.stats is not None:
+            hits, misses, evictions = cache.stats()
+        info[name] = {
+            "kind": cache.kind,
+            "size": cache.size() if cache.size is not None else None,
+            "maxsize": cache.maxsize() if cache.maxsize is not None else None,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "resizable": cache.resize is not None,
+        }
+    return info
+
+
+def set_maxsize(name: str, maxsize: int | None) -> None:
+    """Change the bound of a cache. Entries over the new bound are dropped.
+
+    None lifts the bound of an `lru_cache`; a bounded dictionary cache needs a number.
+    """
+
+    cache = _CACHES.get(name)
+    if cache is None or cache.resize is None:
+        resizable = sorted(name for name, cache in _CACHES.items() if cache.resize)
+        raise ValueError(f"{name!r} is not a resizable cache; those are {resizable}")
+    if maxsize is not None and (not isinstance(maxsize, int) or maxsize < 0):
+        raise ValueError("maxsize must be a non-negative integer or None")
+    cache.resize(maxsize)
+
+
+def generation() -> int:
+    """A counter advanced whenever a discovery cache is cleared."""
+
+    return _generation
+
+
+def invalidate() -> None:
+    """Advance the generation, dropping every cache derived from discovery."""
+
+    global _generation
+
+    with _generation_lock:
+        _generation += 1
+    for name in list(_DERIVED):
+        _CACHES[name].clear()
+
+
+class _Memoized:
+    """`lru_cache` with the same interface, whose `cache_clear` also invalidates."""
+
+    def __init__(self, fn: Callable[..., Any], maxsize: int | None) -> None:
+        self._fn = fn
+        self._cached = lru_cache(maxsize=maxsize)(fn)
+        update_wrapper(self, fn)
+        register(f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}",
+                 lambda: self._cached.cache_clear(), kind="discovery",
+                 size=lambda: self._cached.cache_info().currsize,
+                 stats=lambda: _lru_stats(self._cached.cache_info()),
+                 maxsize=lambda: self._cached.cache_info().maxsize,
+                 resize=self._resize)
+
+    def _resize(self, maxsize: int | None) -> None:
+        # An `lru_cache` cannot be rebounded in place; what it held is discovered again.
+        self._cached = lru_cache(maxsize=maxsize)(self._fn)
+        invalidate()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._cached(*args, **kwargs)
+
+    def cache_info(self) -> Any:
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        self._cached.cache_clear()
+        invalidate()
+
+
+def memoize(maxsize: int | None = 128) -> Callable[[Callable[..., Any]], _Memoized]:
+    """Decorator: memoize a discovery function, tied to `generation()`."""
+
+    def deco(fn: Callable[..., Any]) -> _Memoized:
+        return _Memoized(fn, maxsize)
+
+    return deco
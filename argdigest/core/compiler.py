@@ -0,0 +1,441 @@
+"""Ahead-of-time compilation of digestion plans.
+
+Building a plan is discovery: the configuration is resolved, the digestion source is
+scanned module by module, and the standardizer is imported and checked. All of it is
+repeated on every import of the consumer library, although its result only changes when
+the library's declarations do.
+
+`argdigest compile --module mylib` runs that discovery once and writes what it found into
+`mylib/_argdigest_compiled.py`. A decorated function with an entry there takes its
+digesters and standardizer from it directly, by import path, instead of scanning for
+them, and the adapters of its digesters -- how each one is called -- instead of
+inspecting their signatures.
+
+An entry records the function's signature and every effective setting discovery depends
+on -- digestion source and style, standardizer, the names registered by decorator -- and
+a hash of the files of each digestion source, so editing any of those, or adding or
+removing a digester module, makes the entry stale and the function falls back to
+discovery on its own. The files are hashed once per source and process, without being
+imported. `compiled_entry` compares all of it as recorded; only an entry written by
+another version of ArgDigest is ignored and the plan fingerprinted, as a plan without an
+entry is. `argdigest compile --check` still belongs in CI, to keep the file current.
+
+A manifest (`export_manifest`, `load_manifest`) carries the same entries in a JSON file
+instead of a module, for worker processes: the parent exports what it has already
+discovered, and each worker loads it before importing the library.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import os
+import sys
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable
+
+from .caches import CacheStats, invalidate, memoize, register as _register_cache
+
+#: Name of the generated module, inside the consumer's root package.
+COMPILED_MODULE = "_argdigest_compiled"
+
+#: Bumped whenever the shape of a compiled entry changes, so an old file is ignored
+#: instead of being misread.
+COMPILED_FORMAT = 2
+
+_CODE_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+# module root -> PLANS of its compiled module, or None when there is none.
+_COMPILED: dict[str, dict[str, dict[str, Any]] | None] = {}
+_COMPILED_STATS = CacheStats()
+# One entry per root package; nothing to bound.
+_register_cache("compiler.compiled_plans", _COMPILED.clear, kind="plans",
+                size=lambda: len(_COMPILED), stats=_COMPILED_STATS)
+
+
+class NotReferenceable(ValueError):
+    """A callable that cannot be named by an import path, so it cannot be compiled."""
+
+
+def compiled_enabled() -> bool:
+    """Whether precompiled plans may be used. ``ARGDIGEST_COMPILED=0`` turns them off."""
+
+    return os.getenv("ARGDIGEST_COMPILED", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def callable_reference(obj: Any) -> str:
+    """Return ``module:qualname`` for a callable reachable by import.
+
+    A closure or a lambda has no such path: rebuilding it in another process would need
+    its enclosing call, which is exactly what a compiled plan is meant to avoid.
+    """
+
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        raise NotReferenceable(f"{obj!r} cannot be referenced by import path")
+    try:
+        if resolve_reference(f"{module}:{qualname}") is not obj:
+            raise NotReferenceable(f"{module}:{qualname} does not resolve to {obj!r}")
+    except (ImportError, AttributeError) as error:
+        raise NotReferenceable(f"{module}:{qualname} is not importable") from error
+    return f"{module}:{qualname}"
+
+
+def resolve_reference(reference: str) -> Any:
+    """Import the object named by a ``module:qualname`` reference."""
+
+    module_path, _, qualname = reference.partition(":")
+    target: Any = import_module(module_path)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _stable_token(value: Any) -> Any:
+    """A repr-stable stand-in for a configuration value.
+
+    Callables are replaced by their import path; a repr would carry a memory address and
+    no two processes would ever agree on the fingerprint.
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _stable_token(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_stable_token(item) for item in value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (type(value).__name__,) + tuple(
+            (field.name, _stable_token(getattr(value, field.name)))
+            for field in dataclasses.fields(value))
+    if isinstance(value, type) or callable(value):
+        return ("ref", callable_reference(value))
+    return ("repr", repr(value))
+
+
+def signature_token(fn: Callable[..., Any]) -> tuple[Any, ...]:
+    """Describe a function's signature from its code object, without `inspect`."""
+
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        raise NotReferenceable(f"{fn!r} has no code object")
+    count = code.co_argcount + code.co_kwonlyargcount
+    count += bool(code.co_flags & inspect.CO_VARARGS) + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+    return (
+        code.co_argcount,
+        code.co_posonlyargcount,
+        code.co_kwonlyargcount,
+        code.co_varnames[:count],
+        code.co_flags & _CODE_FLAGS,
+        len(getattr(fn, "__defaults__", None) or ()),
+        tuple(sorted(getattr(fn, "__kwdefaults__", None) or ())),
+    )
+
+
+def _plain(value: Any) -> Any:
+    """`value` with tuples as lists, as it reads back from a compiled module or JSON."""
+
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _library_version() -> str:
+    from .. import __version__
+
+    return __version__
+
+
+@memoize(maxsize=256)
+def source_contents(source: str) -> str | None:
+    """Hash of the files a digestion source is read from, or None when they cannot be read.
+
+    Paths are taken relative to the source, so the hash is the same wherever the library
+    is installed. Nothing is imported.
+    """
+
+    import hashlib
+
+    try:
+        spec = find_spec(source)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    files: dict[str, Path] = {}
+    if spec.has_location and spec.origin and not spec.submodule_search_locations:
+        files[Path(spec.origin).name] = Path(spec.origin)
+    for location in spec.submodule_search_locations or ():
+        for path in Path(location).rglob("*.py"):
+            if path.name != f"{COMPILED_MODULE}.py":
+                files[path.relative_to(location).as_posix()] = path
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        try:
+            data = files[name].read_bytes()
+        except OSError:
+            return None
+        digest.update(name.encode("utf-8") + b"\0" + data + b"\0")
+    return digest.hexdigest()[:24]
+
+
+def _settings(discovery: dict[str, Any]) -> Any:
+    """The discovery settings as recorded, with the contents of every digestion source."""
+
+    contents = None
+    if discovery.get("digestion_style") != "decorator":
+        source = discovery.get("digestion_source")
+        contents = []
+        for name in [source] if isinstance(source, str) else list(source or ()):
+            digest = source_contents(name)
+            if digest is None:
+                raise NotReferenceable(f"the digestion source {name!r} cannot be read")
+            contents.append([name, digest])
+    return _plain(_stable_token({**discovery, "source_contents": contents}))
+
+
+def plan_key(fn: Callable[..., Any], discovery: dict[str, Any]) -> dict[str, Any] | None:
+    """What a compiled entry is matched on, or None when it cannot be stable.
+
+    The function's signature and the settings discovery depends on, as they are recorded
+    in the entry, and the fingerprint of both.
+    """
+
+    import hashlib
+
+    try:
+        signature = _plain(signature_token(fn))
+        settings = _settings(discovery)
+    except NotReferenceable:
+        return None
+    material = repr((COMPILED_FORMAT, signature, settings))
+    return {"fingerprint": hashlib.sha256(material.encode("utf-8")).hexdigest()[:24],
+            "signature": signature, "discovery": settings}
+
+
+def plan_fingerprint(fn: Callable[..., Any], discovery: dict[str, Any]) -> str | None:
+    """Fingerprint of what discovery depends on, or None when it cannot be stable."""
+
+    key = plan_key(fn, discovery)
+    return None if key is None else key["fingerprint"]
+
+
+def compiled_plans(module_root: str) -> dict[str, dict[str, Any]] | None:
+    """The compiled entries of a root package, imported once and remembered."""
+
+    try:
+        plans = _COMPILED[module_root]
+    except KeyError:
+        pass
+    else:
+        _COMPILED_STATS.hits += 1
+        return plans
+    _COMPILED_STATS.misses += 1
+    plans = None
+    name = f"{module_root}.{COMPILED_MODULE}"
+    try:
+        if find_spec(name) is not None:
+            module = import_module(name)
+            if getattr(module, "COMPILED_FORMAT", None) == COMPILED_FORMAT:
+                plans = dict(getattr(module, "PLANS", {}))
+    except (ImportError, ValueError):
+        plans = None
+    _COMPILED[module_root] = plans
+    return plans
+
+
+def compiled_entry(qualified_name: str, fn: Callable[..., Any],
+                   discovery: dict[str, Any]) -> dict[str, Any] | None:
+    """The compiled entry for a function, if there is one and it is still current.
+
+    Current means written by this version of ArgDigest, for the same signature and
+    discovery settings. Both are compared as recorded, without fingerprinting: the entry
+    carries its fingerprint for the plan.
+    """
+
+    if not compiled_enabled():
+        return None
+    plans = compiled_plans(qualified_name.split(".", 1)[0])
+    if not plans:
+        return None
+    entry = plans.get(qualified_name)
+    if entry is None or entry.get("argdigest") != _library_version():
+        return None
+    try:
+        current = (entry.get("signature") == _plain(signature_token(fn))
+                   and entry.get("discovery") == _settings(discovery))
+    except NotReferenceable:
+        return None
+    return entry if current else None
+
+
+def describe_plan(plan: Any) -> dict[str, Any]:
+    """Render the discovery result of a plan as plain, importable data."""
+
+    if plan.discovery_key is None:
+        raise NotReferenceable(f"{plan.qualified_name} has no stable fingerprint")
+    return {
+        "argdigest": _library_version(),
+        **plan.discovery_key,
+        "digesters": {name: callable_reference(fn) for name, fn in plan.digesters.items()},
+        "standardizer": (None if plan.standardizer is None
+                         else callable_reference(plan.standardizer)),
+        # argname -> [value parameter, takes caller, other parameters].
+        "adapters": {name: [adapter.value_param, adapter.takes_caller,
+                            list(adapter.arguments)]
+                     for name, adapter in sorted(plan.adapters.items())},
+    }
+
+
+def _iter_modules(module_name: str) -> list[Any]:
+    import pkgutil
+
+    package = import_module(module_name)
+    modules = [package]
+    if hasattr(package, "__path__"):
+        for info in sorted(pkgutil.walk_packages(package.__path__, prefix=f"{module_name}."),
+                           key=lambda item: item.name):
+            if info.name.rsplit(".", 1)[-1] == COMPILED_MODULE:
+                continue
+            modules.append(import_module(info.name))
+    return modules
+
+
+def iter_decorated(module_name: str) -> list[Any]:
+    """Every decorated callable defined in a package, functions and methods alike."""
+
+    found: dict[int, Any] = {}
+    for module in _iter_modules(module_name):
+        for _, obj in inspect.getmembers(module):
+            if getattr(obj, "__module__", None) != module.__name__:
+                continue
+            if hasattr(obj, "digestion_plan"):
+                found.setdefault(id(obj), obj)
+            elif inspect.isclass(obj):
+                for _, member in inspect.getmembers(obj):
+                    if hasattr(member, "digestion_plan"):
+                        found.setdefault(id(member), member)
+    return list(found.values())
+
+
+def render_compiled(module_name: str) -> tuple[str, dict[str, Any], list[str]]:
+    """Generate the source of the compiled module, its entries, and what was left out."""
+
+    import pprint
+
+    plans: dict[str, dict[str, Any]] = {}
+    skipped: list[str] = []
+    for wrapper in iter_decorated(module_name):
+        plan = wrapper.digestion_plan
+        try:
+            plans[plan.qualified_name] = describe_plan(plan)
+        except NotReferenceable as error:
+            skipped.append(f"{plan.qualified_name}: {error}")
+    source = (
+        '"""Precompiled ArgDigest plans. Generated by `argdigest compile`; do not edit.\n\n'
+        "Regenerate after changing decorated signatures, configuration or declarations.\n"
+        '"""\n\n'
+        f"COMPILED_FORMAT = {COMPILED_FORMAT}\n\n"
+        f"PLANS = {pprint.pformat(dict(sorted(plans.items())), width=88, sort_dicts=True)}\n"
+    )
+    return source, plans, skipped
+
+
+def default_output(module_name: str) -> Path:
+    root = import_module(module_name.split(".", 1)[0])
+    if not hasattr(root, "__path__"):
+        raise ValueError(f"{root.__name__!r} is not a package; pass an explicit output path.")
+    return Path(list(root.__path__)[0]) / f"{COMPILED_MODULE}.py"
+
+
+def compile_module(module_name: str, output: str | Path | None = None,
+                   check: bool = False) -> dict[str, Any]:
+    """Compile the plans of every decorated function in a package.
+
+    Discovery must run for real here, so any previously compiled file is ignored while
+    the package is imported. With `check`, nothing is written and the report says
+    whether the file on disk is current.
+    """
+
+    previous = os.environ.get("ARGDIGEST_COMPILED")
+    os.environ["ARGDIGEST_COMPILED"] = "0"
+    try:
+        source, plans, skipped = render_compiled(module_name)
+    finally:
+        if previous is None:
+            os.environ.pop("ARGDIGEST_COMPILED", None)
+        else:
+            os.environ["ARGDIGEST_COMPILED"] = previous
+
+    path = Path(output) if output is not None else default_output(module_name)
+    current = path.exists() and path.read_text(encoding="utf-8") == source
+    if not check and not current:
+        path.write_text(source, encoding="utf-8")
+    _COMPILED.pop(module_name.split(".", 1)[0], None)
+    sys.modules.pop(f"{module_name.split('.', 1)[0]}.{COMPILED_MODULE}", None)
+    invalidate()
+    return {
+        "path": str(path),
+        "functions": len(plans),
+        "skipped": skipped,
+        "current": current,
+    }
+
+
+#: Bumped whenever the layout of a manifest file changes.
+MANIFEST_FORMAT = 1
+
+
+def export_manifest(path: str | Path, modules: list[str] | tuple[str, ...]) -> str:
+    """Write the plans this process has built for `modules` into a JSON manifest.
+
+    Nothing is discovered again: the entries are described from the plans the decorated
+    functions already hold. Plans that cannot be referenced by import are left out and
+    are discovered in the worker as usual.
+    """
+
+    import json
+
+    plans: dict[str, dict[str, dict[str, Any]]] = {}
+    for module_name in modules:
+        for wrapper in iter_decorated(module_name):
+            plan = wrapper.digestion_plan
+            try:
+                entry = describe_plan(plan)
+            except NotReferenceable:
+                continue
+            plans.setdefault(plan.qualified_name.split(".", 1)[0], {})[plan.qualified_name] = entry
+    payload = {"manifest_format": MANIFEST_FORMAT, "compiled_format": COMPILED_FORMAT,
+               "plans": plans}
+    Path(path).write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    return str(path)
+
+
+def load_manifest(path: str | Path) -> int:
+    """Use the entries of a manifest as compiled plans; return how many were loaded.
+
+    Meant as the `initializer` of a process pool, so it runs before the worker imports
+    the library. Entries are matched like those of a compiled module, and stand in for
+    it: the package's `_argdigest_compiled` is not read once a manifest covers it. A
+    manifest of another format is ignored.
+    """
+
+    import json
+
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if (payload.get("manifest_format") != MANIFEST_FORMAT
+            or payload.get("compiled_format") != COMPILED_FORMAT):
+        return 0
+    count = 0
+    for root, entries in payload.get("plans", {}).items():
+        # Not `compiled_plans(root)`: importing the compiled module imports the package,
+        # which would decorate everything before the manifest is in place.
+        _COMPILED[root] = {**(_COMPILED.get(root) or {}), **entries}
+        count += len(entries)
+    invalidate()
+    return count
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from importlib import import_module
 from typing import Any
-from functools import lru_cache
 from pathlib import Path
 import os
 
+from .caches import memoize
+
 
 @dataclass(frozen=True)
 class DigestConfig:
@@ -17,6 +18,15 @@ class DigestConfig:
     skip_param: str = "skip_digestion"
     puw_context: dict[str, Any] | None = None
     profiling: bool = False
+    # Which profiled calls are timed: one in `profiling_every`, or with
+    # `profiling_interval` set, the first call after that many seconds.
+    profiling_every: int = 1
+    profiling_interval: float | None = None
+    # Seconds the digestion of a call may take before it is logged as slow; a mapping
+    # gives budgets per caller or caller pattern. See `slowlog`.
+    latency_budget: float | dict[str, float] | tuple[tuple[str, float], ...] | None = None
+    # Largest copy of an argument, in bytes, a data pipeline may make; None for no limit.
+    copy_limit: int | None = None
     # Axis 1: the function argument contract.
     function_source: str | list[str] | None = None
     domain_source: str | list[str] | None = None
@@ -27,6 +37,11 @@ class DigestConfig:
     # ArgDigest must not be more permissive than the language it wraps.
     unknown_argument: str = "error"
 
+    def __post_init__(self) -> None:
+        # Configs are memoized, so a mapping is kept as pairs to stay hashable.
+        if isinstance(self.latency_budget, dict):
+            object.__setattr__(self, "latency_budget", tuple(self.latency_budget.items()))
+
 
 _DEFAULTS: DigestConfig = DigestConfig()
 
@@ -38,6 +53,7 @@ def set_defaults(config: DigestConfig | None = None, **kwargs: Any) -> None:
         if kwargs:
             raise ValueError("Cannot specify both 'config' object and keyword arguments.")
         _DEFAULTS = config
+        resolve_config.cache_clear()
         return
 
     if kwargs:
@@ -62,7 +78,7 @@ def get_env_config_module() -> str | None:
     value = value.strip()
     return value or None
 
-@lru_cache(maxsize=128)
+@memoize(maxsize=128)
 def _from_module(module_path: str) -> DigestConfig:
     module = import_module(module_path)
     return DigestConfig(
@@ -73,6 +89,10 @@ def _from_module(module_path: str) -> DigestConfig:
         skip_param=getattr(module, "SKIP_PARAM", "skip_digestion"),
         puw_context=getattr(module, "PUW_CONTEXT", None),
         profiling=getattr(module, "PROFILING", False),
+        profiling_every=getattr(module, "PROFILING_EVERY", 1),
+        profiling_interval=getattr(module, "PROFILING_INTERVAL", None),
+        latency_budget=getattr(module, "LATENCY_BUDGET", None),
+        copy_limit=getattr(module, "COPY_LIMIT", None),
         function_source=getattr(module, "FUNCTION_SOURCE", None),
         domain_source=getattr(module, "DOMAIN_SOURCE", None),
         normalization_source=getattr(module, "NORMALIZATION_SOURCE", None),
@@ -104,6 +124,10 @@ def load_from_file(path: str | Path) -> DigestConfig:
             skip_param=getattr(module, "SKIP_PARAM", "skip_digestion"),
             puw_context=getattr(module, "PUW_CONTEXT", None),
             profiling=getattr(module, "PROFILING", False),
+            profiling_every=getattr(module, "PROFILING_EVERY", 1),
+            profiling_interval=getattr(module, "PROFILING_INTERVAL", None),
+            latency_budget=getattr(module, "LATENCY_BUDGET", None),
+            copy_limit=getattr(module, "COPY_LIMIT", None),
             function_source=getattr(module, "FUNCTION_SOURCE", None),
             domain_source=getattr(module, "DOMAIN_SOURCE", None),
             normalization_source=getattr(module, "NORMALIZATION_SOURCE", None),
@@ -134,4 +158,4 @@ def resolve_config(config: Any) -> DigestConfig:
     raise TypeError("config must be a DigestConfig, a module path string, or None")
 
 # Export a cached version of resolve_config too
-resolve_config = lru_cache(maxsize=128)(resolve_config)
+resolve_config = memoize(maxsize=128)(resolve_config)
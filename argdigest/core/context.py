@@ -1,12 +1,100 @@
 from __future__ import annotations
+import reprlib
 from dataclasses import dataclass, field
 from typing import Any
 
+#: Characters of a value's repr kept in a `ValueSummary`.
+REPR_LIMIT = 120
+
+_repr = reprlib.Repr()
+_repr.maxstring = REPR_LIMIT
+_repr.maxother = REPR_LIMIT
+_repr.maxlevel = 2
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class ValueSummary:
+    """What an error remembers of an argument value, instead of the value itself.
+
+    An array keeps its shape, dtype and size, not its data; anything else a truncated
+    repr. The repr of the summary is that text, so messages and logs formatting
+    `Context.value` still read naturally.
+    """
+
+    type: str
+    shape: tuple[int, ...] | None = None
+    dtype: str | None = None
+    size: int | None = None
+    text: str = ""
+
+    def __repr__(self) -> str:
+        return self.text
+
+
+def summarize(value: Any) -> Any:
+    """A `ValueSummary` of `value`; numbers and short strings are kept as they are."""
+
+    if value is None or isinstance(value, (bool, int, float, complex)):
+        return value
+    if isinstance(value, (str, bytes)) and len(value) <= REPR_LIMIT:
+        return value
+    if isinstance(value, ValueSummary):
+        return value
+    type_name = type(value).__qualname__
+    shape = getattr(value, "shape", None)
+    if isinstance(shape, tuple):
+        # An array or a frame: its repr may be large and is slow to build; what
+        # identifies it is cheap.
+        dtype = getattr(value, "dtype", None)
+        size = getattr(value, "size", None)
+        dtype = str(dtype) if dtype is not None else None
+        size = size if isinstance(size, int) else None
+        text = f"<{type_name} shape={shape}" + (f" dtype={dtype}" if dtype else "") + ">"
+        return ValueSummary(type_name, shape, dtype, size, text)
+    try:
+        size = len(value)
+    except Exception:
+        size = None
+    try:
+        text = _repr.repr(value)
+    except Exception:
+        text = f"<{type_name}>"
+    if len(text) > REPR_LIMIT:
+        text = text[:REPR_LIMIT - 3] + "..."
+    return ValueSummary(type_name, None, None, size, text)
+
 @dataclass
 class Context:
     function_name: str
     argname: str
     value: Any
     all_args: dict[str, Any] = field(default_factory=dict)
-    audit_log: list[dict[str, Any]] | None = None
-    _profiling: bool = False
\ No newline at end of file
+    # A `RuleTimings` for a decorated call; a plain list also works, and gets dicts.
+    audit_log: Any = None
+    _profiling: bool = False
+    # `module.name` of the decorated function, when the context comes from one.
+    caller: str | None = None
+    # The `metrics.Timer` of a sampled call, which also collects rule durations.
+    _timer: Any = None
+    # The `spans.Recorder` of a call while a span sink is installed.
+    _spans: Any = None
+    # Bytes a pipeline may copy out of the argument; None for no limit. See `copies`.
+    copy_limit: int | None = None
+
+    def summarized(self) -> "Context":
+        """This context with its values summarized and its call-scoped helpers dropped.
+
+        What an error keeps: a caught or logged error must not hold the arguments of its
+        call -- possibly gigabytes of arrays -- alive. See `summarize`.
+        """
+
+        # Spelled out: `dataclasses.replace` costs more than the rest of raising an error.
+        return Context(
+            function_name=self.function_name,
+            argname=self.argname,
+            value=summarize(self.value),
+            all_args={name: summarize(value) for name, value in self.all_args.items()},
+            _profiling=self._profiling,
+            caller=self.caller,
+            copy_limit=self.copy_limit,
+        )
@@ -0,0 +1,131 @@
+"""Accounting of the arrays data pipelines copy, and the no-copy limit.
+
+``to_numpy``, ``has_ndim``, ``is_shape``, ``is_dtype`` and the ``sci`` conversions turn
+their input into an array, and whether that allocates depends on the input: an array of
+the right dtype comes back as is, a buffer may be viewed, a list or a dtype change is a
+new buffer. For a coordinate array of several gigabytes, that is the difference between
+fitting in memory or not, and nothing said which one happened.
+
+While enabled (`argdigest.copies.enable()`), every conversion is counted per rule,
+caller and argument -- as the ``same`` object, a ``view`` of the input, or a ``new``
+buffer with the bytes it took.
+
+Independently, a function decorated with ``copy_limit=N`` refuses any conversion that
+would allocate a buffer of more than N bytes from one of its arguments: the pipeline
+raises `DigestCopyError` instead. When the size is known in advance -- a dtype change of
+an array -- it raises before allocating; otherwise, as soon as the copy is made. A limit
+of 0 forbids copies altogether.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any
+
+from .errors import DigestCopyError
+
+ENABLED = False
+
+_lock = threading.Lock()
+# (rule, caller, argname) -> [same, views, new buffers, bytes copied].
+_COUNTS: dict[tuple[str, str, str], list[int]] = {}
+
+
+def _where(ctx: Any) -> tuple[str, str]:
+    if ctx is None:
+        return "-", "-"
+    return (getattr(ctx, "caller", None) or ctx.function_name), ctx.argname
+
+
+def guard(rule: str, ctx: Any, nbytes: int) -> None:
+    """Raise if the copy a rule is about to make exceeds the limit of the call."""
+
+    limit = getattr(ctx, "copy_limit", None)
+    if limit is not None and nbytes > limit:
+        raise DigestCopyError(
+            f"{rule} would copy {nbytes} bytes of '{ctx.argname}', over the limit of "
+            f"{limit} bytes",
+            context=ctx,
+            hint="Pass an array of the expected dtype, or raise copy_limit for this "
+                 "function.",
+        )
+
+
+def record(rule: str, ctx: Any, value: Any, result: Any) -> None:
+    """Account for `rule` turning `value` into `result`, and enforce the copy limit."""
+
+    if result is value:
+        kind = 0
+    else:
+        np = sys.modules.get("numpy")
+        # Only inputs exposing a buffer can be viewed; asking about a list would convert
+        # it -- a copy made by the accounting itself.
+        if (np is not None and isinstance(result, np.ndarray)
+                and (hasattr(value, "__array_interface__")
+                     or isinstance(value, (memoryview, bytes, bytearray)))
+                and np.may_share_memory(result, value)):
+            kind = 1
+        else:
+            kind = 2
+    nbytes = getattr(result, "nbytes", 0) if kind == 2 else 0
+    if kind == 2:
+        guard(rule, ctx, nbytes)
+    if not ENABLED:
+        return
+    caller, argname = _where(ctx)
+    with _lock:
+        counts = _COUNTS.get((rule, caller, argname))
+        if counts is None:
+            counts = _COUNTS[(rule, caller, argname)] = [0, 0, 0, 0]
+        counts[kind] += 1
+        counts[3] += nbytes
+
+
+def watching(ctx: Any) -> bool:
+    """Whether conversions made under `ctx` have to be recorded."""
+
+    return ENABLED or getattr(ctx, "copy_limit", None) is not None
+
+
+def copies() -> list[dict[str, Any]]:
+    """What the conversions counted so far did, most bytes copied first.
+
+    One row per rule, caller and argument: how many conversions returned the ``same``
+    object, a ``view`` of it, or a ``new`` buffer, and the ``bytes`` the new ones took.
+    """
+
+    with _lock:
+        rows = [
+            {"rule": rule, "caller": caller, "argname": argname, "same": same,
+             "view": view, "new": new, "bytes": nbytes}
+            for (rule, caller, argname), (same, view, new, nbytes) in _COUNTS.items()
+        ]
+    rows.sort(key=lambda row: (row["bytes"], row["new"]), reverse=True)
+    return rows
+
+
+def enable() -> None:
+    """Start counting conversions."""
+
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stop counting conversions; what was counted is kept."""
+
+    global ENABLED
+    ENABLED = False
+
+
+def reset() -> None:
+    """Forget everything counted so far."""
+
+    with _lock:
+        _COUNTS.clear()
+
+
+copies.enable = enable  # type: ignore[attr-defined]
+copies.disable = disable  # type: ignore[attr-defined]
+copies.reset = reset  # type: ignore[attr-defined]
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
 from functools import wraps
 import inspect
 import threading
+import time
+import weakref
 import warnings
 from typing import Any, Callable
 
 from .registry import Registry
-from .context import Context
+from .audit import RuleTimings
+from .context import REPR_LIMIT, Context, summarize
 from .utils import bind_arguments, build_call
 from .argument_loader import load_argument_digesters, resolve_standardizer
 from .function_loader import load_domains, load_function_contracts, load_normalization
@@ -15,9 +20,17 @@ from .normalization import NormalizationRegistry, apply_normalization
 from .function_contract import ContractRegistry, check_contract, default_contract
 from .argument_registry import ArgumentRegistry
 from .config import resolve_config, DigestConfig, get_env_config_module
+from .caches import CacheStats, generation, register as _register_cache
+from .compiler import compiled_enabled, compiled_entry, plan_key, resolve_reference
+from .import_profile import decoration, stage
+from . import metrics as _metrics
+from . import nesting as _nesting
+from . import spans as _spans
+from . import allocations as _allocations
 from collections.abc import Mapping
 
 from .errors import (
+    keep_values,
     ArgumentConsistencyError,
     StandardizerContractError,
     FunctionContractError,
@@ -28,7 +41,7 @@ from .errors import (
     UnknownArgumentError,
 )
 from .logger import get_logger
-from .._private.smonitor.emitter import warn
+from .._private.smonitor.emitter import ensure_configured, warn
 from smonitor import signal
 from depdigest import dep_digest
 
@@ -48,19 +61,67 @@ def _resolve_owner_module(fn: Callable[..., Any], args: tuple[Any, ...]) -> str:
     real module without requiring module-level ``__name__`` spoofing in the
     defining files. Free functions keep their defining module.
     """
+    return _owner_module(fn, type(args[0]) if args else None)
+
+
+def _owner_module(fn: Callable[..., Any], owner: type | None) -> str:
+    """`_resolve_owner_module` for a call whose first argument is an `owner` instance."""
+
     qualname = getattr(fn, "__qualname__", "") or ""
-    if args and "." in qualname and "<locals>" not in qualname:
-        owner = type(args[0])
+    if owner is not None and "." in qualname and "<locals>" not in qualname:
         if isinstance(owner, type) and hasattr(owner, fn.__name__):
             module = getattr(owner, "__module__", None)
             if isinstance(module, str) and module:
                 return module
     return fn.__module__
 
-# Global cache for digester metadata to avoid redundant inspect.signature calls
-# (fn_dig, argname) -> (sig, value_param)
-_DIGESTER_METADATA_CACHE: dict[tuple[Callable, str], tuple[inspect.Signature, str]] = {}
+
+def _caller_name(fn: Callable[..., Any], args: tuple[Any, ...]) -> str:
+    """The caller a call of the decorated `fn` reports, as digesters and contracts see it."""
+
+    return f"{_resolve_owner_module(fn, args)}.{fn.__name__}"
+
+
+def _known_callers(fn: Callable[..., Any]) -> list[str]:
+    """Every caller `fn` can report, as far as the classes defined so far tell.
+
+    A method reports the module of its instance's class, so each subclass of the class
+    defining it may give another caller; a free function has one.
+    """
+
+    qualname = getattr(fn, "__qualname__", "") or ""
+    owners: list[type] = []
+    if "." in qualname and "<locals>" not in qualname:
+        try:
+            owner = resolve_reference(f"{fn.__module__}:{qualname.rsplit('.', 1)[0]}")
+        except (ImportError, AttributeError):
+            owner = None
+        if isinstance(owner, type):
+            owners.append(owner)
+            for cls in owners:
+                owners.extend(sub for sub in cls.__subclasses__() if sub not in owners)
+    modules = [_owner_module(fn, owner) for owner in owners] or [fn.__module__]
+    return [f"{module}.{fn.__name__}" for module in dict.fromkeys(modules)]
+
+# Digester metadata, to avoid redundant inspect.signature calls:
+# fn_dig -> {argname: (sig, value_param)}. Weakly keyed, so a discarded digester -- and
+# the globals and closure it holds -- can still be collected.
+_DIGESTER_METADATA_CACHE: "weakref.WeakKeyDictionary[Callable, dict[str, tuple[inspect.Signature, str]]]" = (
+    weakref.WeakKeyDictionary())
 _DIGESTER_METADATA_LOCK = threading.RLock()
+_DIGESTER_METADATA_STATS = CacheStats()
+_register_cache("decorator.digester_metadata", _DIGESTER_METADATA_CACHE.clear,
+                size=lambda: len(_DIGESTER_METADATA_CACHE), stats=_DIGESTER_METADATA_STATS)
+
+# Every wrapper `arg_digest` has returned, for `warmup`. Weak, like the caches: a
+# discarded closure leaves it on its own. Not a cache, so `cache_clear` leaves it alone.
+_DECORATED: "weakref.WeakSet[Callable[..., Any]]" = weakref.WeakSet()
+
+
+def decorated_functions() -> list[Callable[..., Any]]:
+    """Every decorated function still alive in this process."""
+
+    return list(_DECORATED)
 
 
 def _normalize_strictness(strictness: str) -> str:
@@ -84,13 +145,53 @@ def _resolve_value_param(sig: inspect.Signature, argname: str) -> str:
     )
 
 def get_digester_metadata(fn_dig: Callable, argname: str) -> tuple[inspect.Signature, str]:
-    key = (fn_dig, argname)
     with _DIGESTER_METADATA_LOCK:
-        if key not in _DIGESTER_METADATA_CACHE:
+        try:
+            per_digester = _DIGESTER_METADATA_CACHE.get(fn_dig)
+        except TypeError:
+            # Not weakly referenceable (a builtin, say): computed every time rather than
+            # pinned forever.
+            sig_dig = inspect.signature(fn_dig)
+            return sig_dig, _resolve_value_param(sig_dig, argname)
+        if per_digester is None:
+            per_digester = _DIGESTER_METADATA_CACHE[fn_dig] = {}
+        if argname not in per_digester:
+            _DIGESTER_METADATA_STATS.misses += 1
             sig_dig = inspect.signature(fn_dig)
-            value_param = _resolve_value_param(sig_dig, argname)
-            _DIGESTER_METADATA_CACHE[key] = (sig_dig, value_param)
-        return _DIGESTER_METADATA_CACHE[key]
+            per_digester[argname] = (sig_dig, _resolve_value_param(sig_dig, argname))
+        else:
+            _DIGESTER_METADATA_STATS.hits += 1
+        return per_digester[argname]
+
+
+@dataclass(frozen=True)
+class DigesterAdapter:
+    """How one digester is called, resolved from its signature once.
+
+    Every parameter of a digester is filled from one of four sources: the value being
+    digested, the caller name, the digested value of another argument, or a constant
+    from the decorator's `digestion_params`. Which one is a property of the signature,
+    so it is decided here instead of on every call.
+    """
+
+    fn: Callable[..., Any]
+    value_param: str
+    takes_caller: bool
+    # Parameters taking another argument's digested value when the call has that
+    # argument, and the decorator's constant (or None) when it does not.
+    arguments: tuple[str, ...]
+
+
+def _digester_adapter(fn_dig: Callable[..., Any], argname: str) -> DigesterAdapter:
+    sig, value_param = get_digester_metadata(fn_dig, argname)
+    takes_caller = "caller" in sig.parameters and value_param != "caller"
+    return DigesterAdapter(
+        fn=fn_dig,
+        value_param=value_param,
+        takes_caller=takes_caller,
+        arguments=tuple(name for name in sig.parameters
+                        if name != value_param and not (takes_caller and name == "caller")),
+    )
 
 
 @dataclass
@@ -105,6 +206,13 @@ class DigestionPlan:
     standardizer: Callable[[str, dict], dict] | None = None
     enable_argument_digestion: bool = True
     profiling: bool = False
+    # Sampling of profiled calls; see `metrics.Sampler`.
+    profiling_every: int = 1
+    profiling_interval: float | None = None
+    # Normalized by `slowlog.normalize_budget`: seconds, or (pattern, seconds) pairs.
+    latency_budget: float | tuple[tuple[str, float], ...] | None = None
+    # Bytes a data pipeline may copy out of an argument; see `copies`.
+    copy_limit: int | None = None
     var_keyword_name: str | None = None
     signature: inspect.Signature | None = None
     # Axis 1: the function argument contract.
@@ -117,6 +225,68 @@ class DigestionPlan:
     # Whether calling back with `**bound` would lose part of the call. Decided once at
     # decoration time so the common signature keeps the single dict unpack it had.
     requires_call_shape: bool = False
+    puw_context: dict[str, Any] = field(default_factory=dict)
+    digestion_params: dict[str, Any] = field(default_factory=dict)
+    # `module.qualname` of the decorated function, and the fingerprint of everything the
+    # plan was built from. Together they identify the plan in a compiled module.
+    qualified_name: str = ""
+    fingerprint: str | None = None
+    # What a compiled entry is matched on; see `compiler.plan_key`.
+    discovery_key: dict[str, Any] | None = None
+    # Whether discovery was skipped because a current compiled entry was found.
+    compiled: bool = False
+    # argname -> adapter of its digester. Filled at decoration time for the function's
+    # own parameters, and on first use for names a standardizer or **kwargs introduce.
+    # Read without a lock: two threads racing on a miss store the same adapter.
+    adapters: dict[str, DigesterAdapter] = field(default_factory=dict)
+    # Parameters without a digester, found once here instead of on every call.
+    missing_digesters: frozenset[str] = frozenset()
+    # Occurrences of its deduplicated warnings, a `warning_counts.PlanWarnings` attached
+    # on the first one. Never shared: each function warns for itself.
+    warning_counts: Any = None
+
+    def __copy__(self) -> "DigestionPlan":
+        # Spelled out because `__reduce_ex__` below would otherwise answer for `copy`.
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.warning_counts = None
+        return clone
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """Pickle the plan of an importable function as a reference to it.
+
+        The receiving process imports the function, which builds its plan -- from the
+        compiled entries when there are any -- so only the name travels. A plan that is
+        not reachable by import (a closure's) is pickled by value.
+        """
+
+        if self.qualified_name and _published_plan(self.qualified_name) is self:
+            return (_restore_plan, (self.qualified_name,))
+        return super().__reduce_ex__(protocol)
+
+
+def _published_plan(qualified_name: str) -> "DigestionPlan | None":
+    """The plan of the decorated callable importable as `qualified_name`, if any."""
+
+    if "<" in qualified_name:
+        return None
+    parts = qualified_name.split(".")
+    for index in range(len(parts) - 1, 0, -1):
+        try:
+            target = resolve_reference(f"{'.'.join(parts[:index])}:{'.'.join(parts[index:])}")
+        except (ImportError, AttributeError):
+            continue
+        return getattr(target, "digestion_plan", None)
+    return None
+
+
+def _restore_plan(qualified_name: str) -> DigestionPlan:
+    plan = _published_plan(qualified_name)
+    if plan is None:
+        import pickle
+
+        raise pickle.UnpicklingError(f"{qualified_name} is not a decorated function here")
+    return plan
 
 
 def _hashable_source(source: Any) -> Any:
@@ -127,6 +297,83 @@ def _hashable_source(source: Any) -> Any:
     return source
 
 
+def _failure_code(error: BaseException) -> str:
+    """The catalog code of an ArgDigest error, or the exception type of any other."""
+
+    code = getattr(error, "code", None)
+    return code if isinstance(code, str) else type(error).__name__
+
+
+def _emit_debug(message: str, extra: dict[str, Any]) -> None:
+    """Report a failed digester or pipeline to smonitor; run by the emission queue."""
+
+    from smonitor import emit
+
+    ensure_configured()
+    emit("DEBUG", message, extra=extra)
+
+
+def _report_failure(message: str, extra: dict[str, Any], cause: BaseException) -> None:
+    """Queue the smonitor report of a failed digester or pipeline.
+
+    What is queued is plain text, built now: the exception itself would keep its
+    traceback, and through it the frames and arguments of the failed call, alive until
+    the queue is emitted. The cause is described by its type, its code, the message it
+    was raised with -- not the catalog message an ArgDigest error resolves on first
+    ``str()`` -- and a summary of the value it names.
+    """
+
+    # The emission queue, and its thread, load with the first failure to report.
+    from . import emission as _emission
+
+    payload = {**extra, "cause_exception": type(cause).__name__,
+               "cause_code": _failure_code(cause)}
+    if cause.args and isinstance(cause.args[0], str):
+        payload["cause_message"] = cause.args[0][:REPR_LIMIT]
+    context = getattr(cause, "context", None)
+    if isinstance(context, Context):
+        payload["cause_argname"] = context.argname
+        payload["cause_value"] = repr(summarize(context.value))
+    _emission.submit(_emit_debug, message, payload)
+
+
+def _plan_warnings(plan: DigestionPlan) -> Any:
+    counts = plan.warning_counts
+    if counts is None:
+        from .warning_counts import plan_warnings
+
+        counts = plan_warnings(plan)
+    return counts
+
+
+def _report_missing(plan: DigestionPlan, fn: Callable[..., Any], caller: str, argname: str,
+                    bound: dict[str, Any]) -> None:
+    """Report an argument without a digester, as the plan's strictness says."""
+
+    if plan.strictness == "error":
+        _metrics.count("missing_digesters", caller)
+        ctx_error = Context(function_name=fn.__name__, argname=argname,
+                            value=bound.get(argname), all_args=bound)
+        raise DigestNotDigestedError(f"No digester for {argname}", context=ctx_error)
+    if plan.strictness == "warn":
+        # Once per argument of this function (see `warning_counts`); later occurrences
+        # are only counted, and build nothing.
+        suppressed = _plan_warnings(plan).occurrence("DigestNotDigestedWarning", caller,
+                                                     argname)
+        if suppressed is not None:
+            from .warning_counts import repeated
+
+            # `warn` raises the standard Python warning and queues the catalog event, so
+            # ARG-WARN-MISS-001 reaches SMonitor while `pytest.warns` and user filters
+            # keep working.
+            ctx_error = Context(function_name=fn.__name__, argname=argname,
+                                value=bound.get(argname), all_args=bound)
+            warn(DigestNotDigestedWarning(
+                message=repeated(f"No digester for {argname}", suppressed),
+                context=ctx_error,
+            ))
+
+
 _CONTRACT_ERRORS = {
     "unknown_argument": UnknownArgumentError,
     "missing_argument": MissingArgumentError,
@@ -151,6 +398,47 @@ def _invoke(plan: "DigestionPlan", fn_to_wrap: Callable[..., Any],
     return fn_to_wrap(*call_args, **call_kwargs)
 
 
+def _release_frames(error: BaseException, fn: Callable[..., Any]) -> bool:
+    """Clear the ArgDigest frames in the tracebacks of a failed digestion.
+
+    Those frames -- the wrapper's, digestion's, the registry's, smonitor's around them --
+    hold every argument of the call for as long as anyone holds the error. The frames of
+    digesters and rules are the user's: they keep their locals, what they were given
+    included, for a debugger or ``--showlocals``. An error the decorated function raised
+    is left alone, with the frames of its body. True if cleared.
+    """
+
+    body = {_invoke.__code__, getattr(fn, "__code__", None)}
+    frames: dict[int, Any] = {}
+    seen: set[int] = set()
+    pending: list[BaseException | None] = [error]
+    while pending:
+        current = pending.pop()
+        tb = current.__traceback__ if current is not None else None
+        # A chained exception is followed only if it was caught inside the call: one the
+        # caller was handling when it made the call has frames of the caller's.
+        if (tb is None or id(current) in seen
+                or (current is not error and id(tb.tb_frame) not in frames)):
+            continue
+        seen.add(id(current))
+        while tb is not None:
+            if tb.tb_frame.f_code in body:
+                return False
+            frames[id(tb.tb_frame)] = tb.tb_frame
+            tb = tb.tb_next
+        pending += (current.__cause__, current.__context__)
+    for frame in frames.values():
+        module = frame.f_globals.get("__name__") or ""
+        if module.partition(".")[0] not in ("argdigest", "smonitor"):
+            continue
+        try:
+            frame.clear()
+        except RuntimeError:
+            # Still executing: the wrapper's own.
+            pass
+    return True
+
+
 def _enforce_function_contract(plan: "DigestionPlan", caller: str, fn: Callable[..., Any],
                                bound: dict[str, Any], extras: dict[str, Any],
                                supplied: set[str]) -> None:
@@ -192,24 +480,386 @@ def _enforce_function_contract(plan: "DigestionPlan", caller: str, fn: Callable[
         return
 
     for violation in violations:
-        ctx_error = Context(function_name=caller, argname=violation.keyword or "unknown",
-                            value=bound.get(violation.keyword) if violation.keyword else None,
-                            all_args=bound)
+        _metrics.count("contract_violations", violation.kind)
         # A contract naming a domain nobody registered is a declaration bug in the
         # consumer library, not a mistake by whoever made the call. Silencing it would
         # quietly weaken every check that contract was meant to perform.
+        if violation.kind != "unknown_domain":
+            if plan.unknown_argument == "ignore":
+                continue
+            if plan.unknown_argument == "warn":
+                suppressed = _plan_warnings(plan).occurrence(
+                    "FunctionContractWarning", caller, violation.keyword or violation.kind)
+                if suppressed is not None:
+                    from .warning_counts import repeated
+
+                    warn(FunctionContractWarning(
+                        message=repeated(violation.message, suppressed),
+                        context=_contract_context(caller, violation, bound),
+                        hint=violation.hint))
+                continue
+        ctx_error = _contract_context(caller, violation, bound)
         if violation.kind == "unknown_domain":
             raise FunctionContractError(violation.message, context=ctx_error, hint=violation.hint)
-        if plan.unknown_argument == "ignore":
-            continue
-        if plan.unknown_argument == "warn":
-            warn(FunctionContractWarning(
-                message=violation.message, context=ctx_error, hint=violation.hint))
-            continue
         raise _CONTRACT_ERRORS[violation.kind](
             violation.message, context=ctx_error, hint=violation.hint)
 
 
+def _contract_context(caller: str, violation: Any, bound: dict[str, Any]) -> Context:
+    return Context(function_name=caller, argname=violation.keyword or "unknown",
+                   value=bound.get(violation.keyword) if violation.keyword else None,
+                   all_args=bound)
+
+
+
+def _resolve_decorator_config(fn: Callable[..., Any], options: dict[str, Any]) -> DigestConfig:
+    """Resolve the configuration a decorated function runs under."""
+
+    eff_config = options["config"]
+    auto_module_config = None
+    env_module_config = None
+    if (eff_config is _UNSET and options["digestion_source"] is _UNSET
+            and options["digestion_style"] is _UNSET):
+        module_root = fn.__module__.split(".", 1)[0]
+        auto_module_config = f"{module_root}._argdigest"
+        env_module_config = get_env_config_module()
+        eff_config = env_module_config or auto_module_config
+
+    try:
+        return resolve_config(None if eff_config is _UNSET else eff_config)
+    except (ImportError, ModuleNotFoundError):
+        # If env config is set but unavailable, fall back to auto module config.
+        if env_module_config and auto_module_config:
+            try:
+                return resolve_config(auto_module_config)
+            except (ImportError, ModuleNotFoundError):
+                return resolve_config(None)
+        return resolve_config(None)
+
+
+# Plan templates. Decorating the same code object with the same defaults, options and
+# configuration builds the same plan, so factories that decorate a fresh closure per call
+# pay for the first one only. key -> plan, oldest first; emptied whenever a discovery
+# cache is cleared, and bounded.
+_PLAN_TEMPLATES: dict[tuple[Any, ...], DigestionPlan] = {}
+_PLAN_TEMPLATES_MAX = 1024
+_PLAN_TEMPLATES_LOCK = threading.Lock()
+_PLAN_TEMPLATES_GENERATION = generation()
+_PLAN_TEMPLATES_STATS = CacheStats()
+
+
+def _clear_plan_templates() -> None:
+    with _PLAN_TEMPLATES_LOCK:
+        _PLAN_TEMPLATES.clear()
+
+
+def _resize_plan_templates(maxsize: int | None) -> None:
+    global _PLAN_TEMPLATES_MAX
+
+    if maxsize is None:
+        raise ValueError("the plan templates need a bound")
+    with _PLAN_TEMPLATES_LOCK:
+        _PLAN_TEMPLATES_MAX = maxsize
+        while len(_PLAN_TEMPLATES) > maxsize:
+            _PLAN_TEMPLATES.pop(next(iter(_PLAN_TEMPLATES)))
+            _PLAN_TEMPLATES_STATS.evictions += 1
+
+
+_register_cache("decorator.plan_templates", _clear_plan_templates, derived=True, kind="plans",
+                size=lambda: len(_PLAN_TEMPLATES), stats=_PLAN_TEMPLATES_STATS,
+                maxsize=lambda: _PLAN_TEMPLATES_MAX, resize=_resize_plan_templates)
+
+
+def _freeze(value: Any) -> Any:
+    """A hashable stand-in for an option value; raises TypeError when there is none.
+
+    Every leaf keeps its type, so options that compare equal across types -- `1`,
+    `1.0` and `True` -- never share a template. Only values that cannot pin anything
+    are accepted: scalars, and callables defined at module level, which live as long as
+    their module anyway. A closure, a bound method or an arbitrary object would be kept
+    alive by the key long after its decorated function was discarded.
+    """
+
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(item) for item in value))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (type(value),) + tuple(
+            _freeze(getattr(value, item.name)) for item in dataclasses.fields(value))
+    if value is None or value is _UNSET or isinstance(value, (str, bytes, int, float, complex)):
+        return (type(value), value)
+    qualname = getattr(value, "__qualname__", None)
+    if (callable(value) and isinstance(qualname, str) and "<" not in qualname
+            and not inspect.ismethod(value)):
+        return (type(value), value)
+    raise TypeError(f"{type(value).__name__} cannot key a plan template")
+
+
+def _template_key(fn: Callable[..., Any], options: dict[str, Any]) -> tuple[Any, ...] | None:
+    """What a plan is built from, or None when part of it cannot be keyed."""
+
+    code = getattr(fn, "__code__", None)
+    # `inspect.signature` follows these, and they are not part of the code object.
+    if code is None or hasattr(fn, "__wrapped__") or hasattr(fn, "__signature__"):
+        return None
+    try:
+        key = (
+            code,
+            fn.__module__,
+            getattr(fn, "__qualname__", fn.__name__),
+            _freeze(fn.__defaults__),
+            _freeze(fn.__kwdefaults__),
+            _freeze(getattr(fn, "__annotations__", None)),
+            _freeze(options),
+            get_env_config_module(),
+            compiled_enabled(),
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _with_own_defaults(signature: inspect.Signature,
+                       fn: Callable[..., Any]) -> inspect.Signature:
+    """`signature` with the default objects of `fn`, which its template only equals.
+
+    Defaults are bound into every call, so two closures that each declare ``acc=[]``
+    must not end up sharing the first one's list.
+    """
+
+    defaults = fn.__defaults__ or ()
+    kwdefaults = fn.__kwdefaults__ or {}
+    positional = [p.name for p in signature.parameters.values()
+                  if p.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    own = dict(zip(positional[len(positional) - len(defaults):], defaults))
+    own.update(kwdefaults)
+    parameters = signature.parameters
+    if all(parameters[name].default is value for name, value in own.items()):
+        return signature
+    return signature.replace(parameters=[
+        parameter.replace(default=own[name]) if name in own else parameter
+        for name, parameter in parameters.items()])
+
+
+def _plan_for(fn: Callable[..., Any], options: dict[str, Any]) -> DigestionPlan:
+    """The plan of a decorated function, from its template when one matches."""
+
+    global _PLAN_TEMPLATES_GENERATION
+
+    current = generation()
+    if current != _PLAN_TEMPLATES_GENERATION:
+        _clear_plan_templates()
+        _PLAN_TEMPLATES_GENERATION = current
+
+    key = _template_key(fn, options)
+    if key is not None:
+        template = _PLAN_TEMPLATES.get(key)
+        if template is not None:
+            _PLAN_TEMPLATES_STATS.hits += 1
+            _metrics.count("cache_hits", "plan_templates")
+            plan = copy.copy(template)
+            if plan.signature is not None:
+                plan.signature = _with_own_defaults(plan.signature, fn)
+            return plan
+        _PLAN_TEMPLATES_STATS.misses += 1
+        _metrics.count("cache_misses", "plan_templates")
+
+    plan = _build_plan(fn, options)
+    if key is not None:
+        with _PLAN_TEMPLATES_LOCK:
+            if generation() == current:
+                if _PLAN_TEMPLATES and len(_PLAN_TEMPLATES) >= _PLAN_TEMPLATES_MAX:
+                    _PLAN_TEMPLATES.pop(next(iter(_PLAN_TEMPLATES)), None)
+                    _PLAN_TEMPLATES_STATS.evictions += 1
+                if _PLAN_TEMPLATES_MAX:
+                    _PLAN_TEMPLATES[key] = copy.copy(plan)
+    return plan
+
+
+def _build_plan(fn: Callable[..., Any], options: dict[str, Any]) -> DigestionPlan:
+    """Build the digestion plan of one decorated function.
+
+    This is the whole decoration-time cost: configuration, discovery of digesters and
+    declarations, and signature analysis. A current compiled entry replaces the discovery
+    part and the adapters; everything else is cheap enough to redo.
+    """
+
+    def given(name: str, fallback: Any) -> Any:
+        value = options[name]
+        return fallback if value is _UNSET else value
+
+    with stage("config"):
+        cfg = _resolve_decorator_config(fn, options)
+
+    eff_source = given("digestion_source", cfg.digestion_source)
+    eff_style = given("digestion_style", cfg.digestion_style)
+    eff_standardizer = given("standardizer", cfg.standardizer)
+    eff_strictness = _normalize_strictness(given("strictness", cfg.strictness))
+    eff_skip_param = given("skip_param", cfg.skip_param)
+    eff_profiling = given("profiling", cfg.profiling)
+    eff_profiling_every = given("profiling_every", cfg.profiling_every)
+    eff_profiling_interval = given("profiling_interval", cfg.profiling_interval)
+    if not isinstance(eff_profiling_every, int) or eff_profiling_every < 1:
+        raise ValueError("profiling_every must be a positive integer")
+    if eff_profiling_interval is not None and eff_profiling_interval <= 0:
+        raise ValueError("profiling_interval must be a positive number of seconds, or None")
+    eff_latency_budget = given("latency_budget", cfg.latency_budget)
+    if eff_latency_budget is not None:
+        from . import slowlog as _slowlog
+
+        eff_latency_budget = _slowlog.normalize_budget(eff_latency_budget)
+    eff_copy_limit = given("copy_limit", cfg.copy_limit)
+    if eff_copy_limit is not None and (not isinstance(eff_copy_limit, int)
+                                       or isinstance(eff_copy_limit, bool) or eff_copy_limit < 0):
+        raise ValueError("copy_limit must be a number of bytes, or None")
+    eff_function_source = given("function_source", cfg.function_source)
+    eff_domain_source = given("domain_source", cfg.domain_source)
+    eff_normalization_source = given("normalization_source", cfg.normalization_source)
+    eff_unknown_argument = _normalize_strictness(
+        given("unknown_argument", cfg.unknown_argument))
+
+    effective_puw_context = {**(cfg.puw_context or {}), **(options["puw_context"] or {})}
+
+    qualified_name = f"{fn.__module__}.{getattr(fn, '__qualname__', fn.__name__)}"
+    # Only what discovery depends on: policies such as strictness are recomputed from the
+    # configuration on every decoration anyway, and must not make an entry stale.
+    discovery = {
+        "digestion_source": eff_source,
+        "digestion_style": eff_style,
+        "standardizer": eff_standardizer,
+        "argument_registry": (sorted(ArgumentRegistry.get_all())
+                              if eff_style in ("auto", "decorator") else None),
+    }
+    compiled = None
+    try:
+        compiled = compiled_entry(qualified_name, fn, discovery)
+        if compiled is not None:
+            available_digesters = {name: resolve_reference(reference)
+                                   for name, reference in compiled["digesters"].items()}
+            # Checked when the entry was compiled; the entry vouches it is the same.
+            resolved_standardizer = (None if compiled["standardizer"] is None
+                                     else resolve_reference(compiled["standardizer"]))
+            compiled_adapters = {
+                name: DigesterAdapter(fn=available_digesters[name], value_param=value_param,
+                                      takes_caller=takes_caller, arguments=tuple(arguments))
+                for name, (value_param, takes_caller, arguments)
+                in compiled["adapters"].items()}
+            discovery_key = {name: compiled[name]
+                             for name in ("fingerprint", "signature", "discovery")}
+    except (ImportError, AttributeError, KeyError, TypeError, ValueError):
+        # A compiled entry pointing at something that moved is stale, whatever else it
+        # says. Discovery is always a correct answer.
+        compiled = None
+
+    if compiled is None:
+        discovery_key = plan_key(fn, discovery)
+    if discovery_key is not None and compiled_enabled():
+        _metrics.count("cache_hits" if compiled is not None else "cache_misses", "compiled_plans")
+    if compiled is None:
+        # Pre-load digesters
+        with stage("discovery"):
+            if eff_style == "decorator":
+                available_digesters = ArgumentRegistry.get_all()
+            else:
+                available_digesters = load_argument_digesters(eff_source, eff_style)
+        with stage("standardizer"):
+            resolved_standardizer = resolve_standardizer(eff_standardizer)
+
+    # Default behavior for pure pipeline usage:
+    # when users do not configure argument-centric digestion and no digesters are discovered,
+    # skip argument digestion pass to avoid non-actionable warnings.
+    explicit_argdigestion_config = any(
+        options[name] is not _UNSET
+        for name in ("digestion_source", "digestion_style", "standardizer", "strictness", "config")
+    )
+    enable_argument_digestion = not (
+        not explicit_argdigestion_config
+        and eff_style == "auto"
+        and eff_source is None
+        and not available_digesters
+        and eff_standardizer is None
+    )
+
+    # Axis 1 declarations. lru_cache needs hashable sources.
+    with stage("declarations"):
+        contracts = load_function_contracts(_hashable_source(eff_function_source))
+        domains = load_domains(_hashable_source(eff_domain_source))
+        normalization = load_normalization(_hashable_source(eff_normalization_source))
+
+    # Inspect signature once
+    with stage("signature"):
+        signature = inspect.signature(fn)
+    var_keyword_name = next((p.name for p in signature.parameters.values() if p.kind == inspect.Parameter.VAR_KEYWORD), None)
+    # `*args` has no keyword form and a positional-only parameter refuses one, so
+    # calling back with `**bound` would lose them. Only those two signatures pay for
+    # the reconstruction.
+    requires_call_shape = any(
+        p.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.POSITIONAL_ONLY)
+        for p in signature.parameters.values())
+
+    # Build pipeline targets. A copy: the caller's `map` is part of the template key.
+    pipeline_targets = dict(options["map"] or {})
+    kind = options["kind"]
+    if kind is not None:
+        for p in signature.parameters.values():
+            if p.name != "self" and p.kind not in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL):
+                if p.name not in pipeline_targets:
+                    pipeline_targets[p.name] = {"kind": kind, "rules": options["rules"] or []}
+
+    adapters: dict[str, DigesterAdapter] = {}
+    if compiled is not None and enable_argument_digestion:
+        adapters = compiled_adapters
+    elif enable_argument_digestion:
+        with stage("adapters"):
+            for name in signature.parameters:
+                fn_dig = available_digesters.get(name)
+                if fn_dig is None or name == "self":
+                    continue
+                try:
+                    adapters[name] = _digester_adapter(fn_dig, name)
+                except DigestNotDigestedError:
+                    # An ambiguous digester is only an error if a call reaches it.
+                    continue
+
+    return DigestionPlan(
+        digesters=available_digesters,
+        pipeline_targets=pipeline_targets,
+        strictness=eff_strictness,
+        skip_param=eff_skip_param,
+        standardizer=resolved_standardizer,
+        enable_argument_digestion=enable_argument_digestion,
+        profiling=bool(eff_profiling),
+        profiling_every=eff_profiling_every,
+        profiling_interval=eff_profiling_interval,
+        latency_budget=eff_latency_budget,
+        copy_limit=eff_copy_limit,
+        var_keyword_name=var_keyword_name,
+        signature=signature,
+        normalization=normalization,
+        contracts=contracts,
+        domains=domains,
+        unknown_argument=eff_unknown_argument,
+        signature_parameter_names=frozenset(
+            name for name in signature.parameters if name != var_keyword_name),
+        requires_call_shape=requires_call_shape,
+        puw_context=effective_puw_context,
+        digestion_params=options["digestion_params"],
+        qualified_name=qualified_name,
+        fingerprint=None if discovery_key is None else discovery_key["fingerprint"],
+        discovery_key=discovery_key,
+        compiled=compiled is not None,
+        adapters=adapters,
+        missing_digesters=frozenset(
+            name for name in signature.parameters
+            if name != "self" and name not in available_digesters),
+    )
+
+
 def arg_digest(
     *,
     kind: str | None = None,
@@ -228,146 +878,93 @@ def arg_digest(
     type_check: bool = False,
     puw_context: dict[str, Any] | None = None,
     profiling: bool | object = _UNSET,
+    profiling_every: int | object = _UNSET,
+    profiling_interval: float | None | object = _UNSET,
+    latency_budget: float | dict[str, float] | None | object = _UNSET,
+    copy_limit: int | None | object = _UNSET,
     **digestion_params: Any,
 ):
+    options = {
+        "kind": kind,
+        "rules": rules,
+        "map": map,
+        "digestion_source": digestion_source,
+        "digestion_style": digestion_style,
+        "standardizer": standardizer,
+        "strictness": strictness,
+        "unknown_argument": unknown_argument,
+        "function_source": function_source,
+        "normalization_source": normalization_source,
+        "domain_source": domain_source,
+        "skip_param": skip_param,
+        "config": config,
+        "puw_context": puw_context,
+        "profiling": profiling,
+        "profiling_every": profiling_every,
+        "profiling_interval": profiling_interval,
+        "latency_budget": latency_budget,
+        "copy_limit": copy_limit,
+        "digestion_params": digestion_params,
+    }
+
     @dep_digest('beartype', when={'type_check': True})
     def deco(fn: Callable[..., Any]):
-        fn_to_wrap = fn
-        if type_check:
-            try:
-                from beartype import beartype
-                fn_to_wrap = beartype(fn)
-            except ImportError:
-                try:
-                    from smonitor.integrations import emit_from_catalog, merge_extra
-                    from .._private.smonitor import CATALOG, PACKAGE_ROOT, META
-
-                    emit_from_catalog(
-                        CATALOG["warnings"]["TypeCheckSkippedWarning"],
-                        package_root=PACKAGE_ROOT,
-                        extra=merge_extra(META, {"caller": f"{fn.__module__}.{fn.__name__}"}),
-                    )
-                except Exception as exc:
-                    warnings.warn(
-                        (
-                            "type_check=True but 'beartype' is not installed. "
-                            f"Skipping in {fn.__module__}.{fn.__name__}. "
-                            f"SMonitor emission failed with: {exc!r}"
-                        ),
-                        RuntimeWarning,
-                    )
-
-        # Resolve effective parameters
-        eff_config = config
-        auto_module_config = None
-        env_module_config = None
-        if (eff_config is _UNSET and digestion_source is _UNSET and digestion_style is _UNSET):
-            module_root = fn.__module__.split(".", 1)[0]
-            auto_module_config = f"{module_root}._argdigest"
-            env_module_config = get_env_config_module()
-            eff_config = env_module_config or auto_module_config
-
-        try:
-            cfg = resolve_config(None if eff_config is _UNSET else eff_config)
-        except (ImportError, ModuleNotFoundError):
-            # If env config is set but unavailable, fall back to auto module config.
-            if env_module_config and auto_module_config:
-                try:
-                    cfg = resolve_config(auto_module_config)
-                except (ImportError, ModuleNotFoundError):
-                    cfg = resolve_config(None)
-            else:
-                cfg = resolve_config(None)
-        
-        eff_source = cfg.digestion_source if digestion_source is _UNSET else digestion_source
-        eff_style = cfg.digestion_style if digestion_style is _UNSET else digestion_style
-        eff_standardizer = cfg.standardizer if standardizer is _UNSET else standardizer
-        eff_strictness = _normalize_strictness(cfg.strictness if strictness is _UNSET else strictness)
-        eff_skip_param = cfg.skip_param if skip_param is _UNSET else skip_param
-        eff_profiling = cfg.profiling if profiling is _UNSET else profiling
-        eff_function_source = cfg.function_source if function_source is _UNSET else function_source
-        eff_domain_source = cfg.domain_source if domain_source is _UNSET else domain_source
-        eff_normalization_source = (cfg.normalization_source
-                                    if normalization_source is _UNSET
-                                    else normalization_source)
-        eff_unknown_argument = _normalize_strictness(
-            cfg.unknown_argument if unknown_argument is _UNSET else unknown_argument)
-        
-        effective_puw_context = {**(cfg.puw_context or {}), **(puw_context or {})}
+        with decoration(fn):
+            fn_to_wrap = fn
+            if type_check:
+                with stage("beartype"):
+                    try:
+                        from beartype import beartype
+                        fn_to_wrap = beartype(fn)
+                    except ImportError:
+                        try:
+                            from smonitor.integrations import emit_from_catalog, merge_extra
+                            from .._private.smonitor import CATALOG, PACKAGE_ROOT, META
+
+                            ensure_configured()
+                            emit_from_catalog(
+                                CATALOG["warnings"]["TypeCheckSkippedWarning"],
+                                package_root=PACKAGE_ROOT,
+                                extra=merge_extra(META, {"caller": f"{fn.__module__}.{fn.__name__}"}),
+                            )
+                        except Exception as exc:
+                            warnings.warn(
+                                (
+                                    "type_check=True but 'beartype' is not installed. "
+                                    f"Skipping in {fn.__module__}.{fn.__name__}. "
+                                    f"SMonitor emission failed with: {exc!r}"
+                                ),
+                                RuntimeWarning,
+                            )
 
-        # Pre-load digesters
-        if eff_style == "decorator":
-            available_digesters = ArgumentRegistry.get_all()
-        else:
-            available_digesters = load_argument_digesters(eff_source, eff_style)
-
-        # Default behavior for pure pipeline usage:
-        # when users do not configure argument-centric digestion and no digesters are discovered,
-        # skip argument digestion pass to avoid non-actionable warnings.
-        explicit_argdigestion_config = any(
-            x is not _UNSET
-            for x in (digestion_source, digestion_style, standardizer, strictness, config)
-        )
-        enable_argument_digestion = not (
-            not explicit_argdigestion_config
-            and eff_style == "auto"
-            and eff_source is None
-            and not available_digesters
-            and eff_standardizer is None
-        )
+            plan = _plan_for(fn, options)
 
-        # Axis 1 declarations. lru_cache needs hashable sources.
-        contracts = load_function_contracts(_hashable_source(eff_function_source))
-        domains = load_domains(_hashable_source(eff_domain_source))
-        normalization = load_normalization(_hashable_source(eff_normalization_source))
-
-        # Inspect signature once
-        signature = inspect.signature(fn)
-        var_keyword_name = next((p.name for p in signature.parameters.values() if p.kind == inspect.Parameter.VAR_KEYWORD), None)
-        # `*args` has no keyword form and a positional-only parameter refuses one, so
-        # calling back with `**bound` would lose them. Only those two signatures pay for
-        # the reconstruction.
-        requires_call_shape = any(
-            p.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.POSITIONAL_ONLY)
-            for p in signature.parameters.values())
-
-        # Build pipeline targets
-        pipeline_targets = map or {}
-        if kind is not None:
-            for p in signature.parameters.values():
-                if p.name != "self" and p.kind not in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL):
-                    if p.name not in pipeline_targets:
-                        pipeline_targets[p.name] = {"kind": kind, "rules": rules or []}
-
-        plan = DigestionPlan(
-            digesters=available_digesters,
-            pipeline_targets=pipeline_targets,
-            strictness=eff_strictness,
-            skip_param=eff_skip_param,
-            standardizer=resolve_standardizer(eff_standardizer),
-            enable_argument_digestion=enable_argument_digestion,
-            profiling=bool(eff_profiling),
-            var_keyword_name=var_keyword_name,
-            signature=signature,
-            normalization=normalization,
-            contracts=contracts,
-            domains=domains,
-            unknown_argument=eff_unknown_argument,
-            signature_parameter_names=frozenset(
-                name for name in signature.parameters if name != var_keyword_name),
-            requires_call_shape=requires_call_shape,
-        )
+        sampler = (_metrics.Sampler(plan.profiling_every, plan.profiling_interval)
+                   if plan.profiling else None)
 
-        @wraps(fn)
         @signal(tags=["digestion"], exception_level="DEBUG")
-        def wrapper(*args: Any, **kwargs: Any):
+        def digest_and_call(*args: Any, **kwargs: Any):
             # Fast-path check: if skip_digestion is passed in kwargs, bypass everything O(1)
             if kwargs.get(plan.skip_param, False):
                 return fn_to_wrap(*args, **kwargs)
 
             logger.debug(f"Digesting arguments for {fn.__name__}")
-            if plan.profiling:
-                wrapper.audit_log = []
+            timer = None
+            profiled = False
+            if sampler is not None:
+                # An unsampled call stops at the counter; a sampled one stands for the
+                # calls counted since the previous sample.
+                weight = sampler.tick()
+                if weight:
+                    profiled = True
+                    timer = _metrics.Timer(weight)
+            elif _metrics.ENABLED:
+                timer = _metrics.Timer()
+            if timer is None and plan.latency_budget is not None:
+                timer = _metrics.Timer(0)
+            frame = _nesting.enter() if _nesting.ENABLED else None
+            span_sink = _spans.SINK
+            recorder = _spans.Recorder(span_sink) if span_sink is not None else None
 
             
             def _run_digestion():
@@ -382,7 +979,15 @@ def arg_digest(
                 if bound.get(plan.skip_param, False):
                     return _invoke(plan, fn_to_wrap, bound)
 
-                caller = f"{_resolve_owner_module(fn, args)}.{fn.__name__}"
+                caller = _caller_name(fn, args)
+                if timer is not None:
+                    timer.caller = caller
+                    timer.mark("bind")
+                if frame is not None:
+                    frame.caller = caller
+                if recorder is not None:
+                    recorder.caller = caller
+                    recorder.mark("bind")
 
                 if plan.var_keyword_name and plan.var_keyword_name in bound:
 
@@ -394,6 +999,10 @@ def arg_digest(
 
                 if plan.normalization:
                     bound = apply_normalization(plan.normalization, caller, bound, supplied)
+                if timer is not None:
+                    timer.mark("normalization")
+                if recorder is not None:
+                    recorder.mark("normalization")
 
                 if plan.standardizer:
                     standardized = plan.standardizer(caller, bound)
@@ -408,6 +1017,10 @@ def arg_digest(
                                  "cause.",
                         )
                     bound = dict(standardized)
+                if timer is not None:
+                    timer.mark("standardizer")
+                if recorder is not None:
+                    recorder.mark("standardizer")
 
                 # Axis 1 runs here: after names are canonical, before any value is
                 # digested.
@@ -416,6 +1029,10 @@ def arg_digest(
                     positional = list(plan.signature.parameters)[:len(args)]
                     supplied.update(positional)
                 _enforce_function_contract(plan, caller, fn, bound, extras, supplied)
+                if timer is not None:
+                    timer.mark("contract")
+                if recorder is not None:
+                    recorder.mark("contract")
 
                 digested: dict[str, Any] = {}
                 visiting_path: list[str] = []
@@ -430,80 +1047,95 @@ def arg_digest(
 
                     fn_digest = plan.digesters.get(argname)
                     if fn_digest is None:
-                        ctx_error = Context(function_name=fn.__name__, argname=argname, value=bound.get(argname), all_args=bound)
-                        if plan.strictness == "error": 
-                            raise DigestNotDigestedError(f"No digester for {argname}", context=ctx_error)
-                        if plan.strictness == "warn":
-                            # `warn` emits the catalog event and raises the standard
-                            # Python warning, so ARG-WARN-MISS-001 reaches SMonitor
-                            # while `pytest.warns` and user filters keep working.
-                            warn(
-                                DigestNotDigestedWarning(
-                                    message=f"No digester for {argname}",
-                                    context=ctx_error,
-                                )
-                            )
+                        # A name a standardizer or **kwargs brought in, or a parameter
+                        # another digester asked for first.
+                        _report_missing(plan, fn, caller, argname, bound)
                         digested[argname] = bound.get(argname)
                         visiting_path.pop()
                         return
 
-                    # Fetch metadata ON DEMAND (Cached)
-                    sig, value_param = get_digester_metadata(fn_digest, argname)
-                    
-                    kwargs_for_digest = {}
-                    for p_name in sig.parameters:
-                        if p_name == value_param:
-                            kwargs_for_digest[p_name] = bound.get(argname)
-                        elif p_name == "caller":
-                            kwargs_for_digest[p_name] = caller
-                        elif p_name in bound:
+                    adapter = plan.adapters.get(argname)
+                    if adapter is None or adapter.fn is not fn_digest:
+                        adapter = plan.adapters[argname] = _digester_adapter(fn_digest, argname)
+
+                    kwargs_for_digest = {adapter.value_param: bound.get(argname)}
+                    if adapter.takes_caller:
+                        kwargs_for_digest["caller"] = caller
+                    for p_name in adapter.arguments:
+                        if p_name in bound:
                             gut(p_name)
                             kwargs_for_digest[p_name] = digested[p_name]
-                        elif p_name in digestion_params:
-                            kwargs_for_digest[p_name] = digestion_params[p_name]
                         else:
-                            kwargs_for_digest[p_name] = None
+                            kwargs_for_digest[p_name] = plan.digestion_params.get(p_name)
 
+                    started = time.time_ns() if recorder is not None else 0
                     try:
-                        digested[argname] = fn_digest(**kwargs_for_digest)
+                        if _allocations.ENABLED:
+                            digested[argname] = _allocations.call(
+                                getattr(fn_digest, "__qualname__", argname), caller,
+                                kwargs_for_digest[adapter.value_param], fn_digest,
+                                **kwargs_for_digest)
+                        else:
+                            digested[argname] = fn_digest(**kwargs_for_digest)
                     except Exception as e:
-                        # Centralized observability: report to smonitor
-                        try:
-                            from smonitor import emit
-                            emit("DEBUG", f"Digestion failed for argument '{argname}'", 
-                                 extra={
-                                     "code": "MSM-DBG-PROBE-001",
-                                     "argname": argname,
-                                     "caller": caller,
-                                     "cause_exception": type(e).__name__,
-                                     "cause_message": str(e)
-                                 })
-                        except:
-                            pass
-                        # Re-raise with cause attached
-                        if hasattr(e, 'message'): # Some custom errors might have message
-                             raise e
+                        _metrics.count("digestion_failures", _failure_code(e))
+                        if recorder is not None:
+                            recorder.child("digester", started, time.time_ns(), "ERROR",
+                                           argname=argname,
+                                           digester=getattr(fn_digest, "__qualname__", None),
+                                           **{"error.code": _failure_code(e)})
+                        # Centralized observability: report to smonitor, off the call path
+                        _report_failure(f"Digestion failed for argument '{argname}'", {
+                            "code": "MSM-DBG-PROBE-001",
+                            "argname": argname,
+                            "caller": caller,
+                        }, e)
                         raise e
 
+                    if frame is not None:
+                        frame.digested(argname, bound.get(argname), digested[argname])
+                    if recorder is not None:
+                        recorder.child("digester", started, time.time_ns(), argname=argname,
+                                       digester=getattr(fn_digest, "__qualname__", None))
                     visiting_path.pop()
 
                 if plan.enable_argument_digestion:
-                    for argname in bound:
-                        if argname != "self":
-                            gut(argname)
+                    missing = plan.missing_digesters
+                    try:
+                        for argname in bound:
+                            if argname in missing:
+                                if argname not in digested:
+                                    _report_missing(plan, fn, caller, argname, bound)
+                                    digested[argname] = bound[argname]
+                            elif argname != "self":
+                                gut(argname)
+                    except BaseException:
+                        if not keep_values():
+                            # The frames of `gut` stay in the traceback, and with them
+                            # its closure: it must not keep the arguments.
+                            del bound, digested
+                        raise
                     bound.update(digested)
+                if timer is not None:
+                    timer.mark("digestion")
+                if recorder is not None:
+                    recorder.mark("digestion")
                 for argname, cfg_pipe in plan.pipeline_targets.items():
                     if argname not in bound:
                         continue
                     # Pass the wrapper's audit_log to the context
-                    audit_log = getattr(wrapper, "audit_log", None)
+                    audit_log = wrapper.audit_log if profiled else None
                     ctx = Context(
                         function_name=fn.__name__, 
                         argname=argname, 
                         value=bound[argname], 
                         all_args=bound,
                         audit_log=audit_log,
-                        _profiling=plan.profiling
+                        _profiling=profiled or recorder is not None,
+                        caller=caller,
+                        _timer=timer if profiled else None,
+                        _spans=recorder,
+                        copy_limit=plan.copy_limit,
                     )
                     # Use the kind and rules from the specific target config
                     eff_kind = cfg_pipe.get("kind")
@@ -511,31 +1143,66 @@ def arg_digest(
                     try:
                         bound[argname] = Registry.run(eff_kind, eff_rules, bound[argname], ctx)
                     except Exception as e:
-                        try:
-                            from smonitor import emit
-                            emit("DEBUG", f"Pipeline failed for argument '{argname}'", 
-                                 extra={
-                                     "code": "MSM-DBG-PROBE-001",
-                                     "argname": argname,
-                                     "pipeline": f"{eff_kind}.{eff_rules}",
-                                     "cause_exception": type(e).__name__,
-                                     "cause_message": str(e)
-                                 })
-                        except:
-                            pass
+                        _metrics.count("pipeline_failures", _failure_code(e))
+                        _report_failure(f"Pipeline failed for argument '{argname}'", {
+                            "code": "MSM-DBG-PROBE-001",
+                            "argname": argname,
+                            "pipeline": f"{eff_kind}.{eff_rules}",
+                        }, e)
                         raise e
 
-                return _invoke(plan, fn_to_wrap, bound)
+                if recorder is not None:
+                    recorder.mark("pipelines")
+                if timer is None:
+                    return _invoke(plan, fn_to_wrap, bound)
+                timer.mark("pipelines")
+                if plan.latency_budget is not None:
+                    from . import slowlog as _slowlog
 
-            if effective_puw_context:
-                from ..contrib.pyunitwizard_support import context as puw_ctx_manager
-                with puw_ctx_manager(**effective_puw_context):
-                    return _run_digestion()
-            return _run_digestion()
+                    _slowlog.check(plan.latency_budget, timer, bound)
+                try:
+                    return _invoke(plan, fn_to_wrap, bound)
+                finally:
+                    timer.mark("body")
+
+            def _run_in_context():
+                if plan.puw_context:
+                    from ..contrib.pyunitwizard_support import context as puw_ctx_manager
+                    with puw_ctx_manager(**plan.puw_context):
+                        return _run_digestion()
+                return _run_digestion()
+
+            try:
+                result = _run_in_context() if timer is None else timer.observe(_run_in_context)
+            except BaseException as error:
+                if recorder is not None:
+                    recorder.finish(error)
+                if not keep_values():
+                    # Shared with the nested functions, whose frames are in the traceback.
+                    del args, kwargs
+                raise
+            finally:
+                if frame is not None:
+                    _nesting.leave(frame)
+            if recorder is not None:
+                recorder.finish()
+            return result
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any):
+            try:
+                return digest_and_call(*args, **kwargs)
+            except BaseException as error:
+                if not keep_values() and _release_frames(error, fn):
+                    # This frame stays in the traceback too.
+                    del args, kwargs
+                raise
 
         wrapper.digestion_plan = plan
-        wrapper.audit_log = [] if plan.profiling else None
+        wrapper.audit_log = RuleTimings() if plan.profiling else None
+        _DECORATED.add(wrapper)
         return wrapper
+
     return deco
 
 def _arg_digest_map(
@@ -543,8 +1210,14 @@ def _arg_digest_map(
     puw_context=None,
     profiling=_UNSET,
     config=_UNSET,
+    profiling_every=_UNSET,
+    profiling_interval=_UNSET,
+    latency_budget=_UNSET,
+    copy_limit=_UNSET,
     **map_config
 ):
-    return arg_digest(map=map_config, type_check=type_check, puw_context=puw_context, profiling=profiling, config=config)
+    return arg_digest(map=map_config, type_check=type_check, puw_context=puw_context, profiling=profiling, config=config,
+                      profiling_every=profiling_every, profiling_interval=profiling_interval,
+                      latency_budget=latency_budget, copy_limit=copy_limit)
 
 arg_digest.map = _arg_digest_map
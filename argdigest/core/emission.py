@@ -0,0 +1,207 @@
+"""Diagnostics emitted off the call path.
+
+A failed digester or pipeline reports a debug event to smonitor, and a missing digester,
+a contract breach under ``unknown_argument="warn"`` or a slow call a catalog event. smonitor
+formats and writes them where it is configured to, and inside the call that triggered
+them: under a burst of invalid input, the validation path was dominated by diagnostic
+I/O.
+
+Those events are now handed to `submit` and emitted by a background thread, in batches
+of up to `BATCH_SIZE`, at most `FLUSH_INTERVAL` seconds after they were queued. The queue
+holds at most `CAPACITY` events; past that, new ones are dropped and counted -- in
+`queue_info()` and in the ``dropped_diagnostics`` counter of `argdigest.stats()` -- rather
+than kept at the cost of memory. What is queued at interpreter exit is emitted by an
+`atexit` hook, and `flush()` emits it on demand, for instance before reading smonitor's
+event buffer.
+
+Only the smonitor events move: a catalog warning is still raised as a Python warning in
+the calling thread, so `pytest.warns` and warning filters see it as before, and raised
+exceptions are untouched. ``configure(background=False)`` emits everything in the calling
+thread again.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+from . import metrics as _metrics
+
+#: Events emitted together by one wake-up of the background thread.
+BATCH_SIZE = 64
+
+#: Seconds an event may wait in the queue for a batch to fill up.
+FLUSH_INTERVAL = 0.25
+
+#: Events queued before new ones are dropped.
+CAPACITY = 4096
+
+#: Whether events are emitted by the background thread at all.
+BACKGROUND = True
+
+_lock = threading.Lock()
+# Signalled when the queue gets its first event or a full batch, and when a batch is done.
+_changed = threading.Condition(_lock)
+_QUEUE: deque[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]] = deque()
+_thread: threading.Thread | None = None
+# Batches taken by the background thread and not emitted yet.
+_busy = 0
+# Bumped by `flush` and `configure`, which restart the wait for a batch.
+_epoch = 0
+_COUNTS = {"queued": 0, "emitted": 0, "failed": 0, "dropped": 0}
+
+
+def configure(*, batch_size: int | None = None, flush_interval: float | None = None,
+              capacity: int | None = None, background: bool | None = None) -> None:
+    """Change how events are queued; arguments left to None keep their value."""
+
+    global BATCH_SIZE, FLUSH_INTERVAL, CAPACITY, BACKGROUND, _epoch
+
+    for name, value in (("batch_size", batch_size), ("capacity", capacity)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int)
+                                  or value < 1):
+            raise ValueError(f"{name} must be a positive integer")
+    if flush_interval is not None and (isinstance(flush_interval, bool)
+                                       or not isinstance(flush_interval, (int, float))
+                                       or flush_interval <= 0):
+        raise ValueError("flush_interval must be a positive number of seconds")
+    if background is False:
+        # Nothing queued may be overtaken by events emitted synchronously from now on.
+        flush()
+    with _lock:
+        if batch_size is not None:
+            BATCH_SIZE = batch_size
+        if flush_interval is not None:
+            FLUSH_INTERVAL = float(flush_interval)
+        if capacity is not None:
+            CAPACITY = capacity
+        if background is not None:
+            BACKGROUND = bool(background)
+        _epoch += 1
+        _changed.notify_all()
+
+
+def submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+    """Emit ``fn(*args, **kwargs)`` in the background. False if the queue was full.
+
+    `fn` runs on another thread, later: everything it needs must be in its arguments,
+    computed now, and it must not raise for anything but a failed emission.
+    """
+
+    global _thread
+
+    if not BACKGROUND:
+        _run([(fn, args, kwargs)])
+        return True
+    with _lock:
+        if len(_QUEUE) < CAPACITY:
+            _QUEUE.append((fn, args, kwargs))
+            _COUNTS["queued"] += 1
+            if len(_QUEUE) == 1 or len(_QUEUE) >= BATCH_SIZE:
+                _changed.notify_all()
+            if _thread is None:
+                _thread = threading.Thread(target=_worker, name="argdigest-emission",
+                                           daemon=True)
+                _thread.start()
+            return True
+        _COUNTS["dropped"] += 1
+    _metrics.count("dropped_diagnostics", "queue_full")
+    return False
+
+
+def _run(batch: list[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]]) -> None:
+    emitted = failed = 0
+    for fn, args, kwargs in batch:
+        try:
+            fn(*args, **kwargs)
+            emitted += 1
+        except Exception:
+            # A diagnostic that cannot be reported is counted, never raised: there is no
+            # call left to fail.
+            failed += 1
+    with _lock:
+        _COUNTS["emitted"] += emitted
+        _COUNTS["failed"] += failed
+
+
+def _take() -> list[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]]:
+    return [_QUEUE.popleft() for _ in range(min(BATCH_SIZE, len(_QUEUE)))]
+
+
+def _worker() -> None:
+    global _busy
+
+    while True:
+        with _lock:
+            while True:
+                while not _QUEUE:
+                    _changed.wait()
+                # Wait for a full batch, or for the interval since the wait began. A flush
+                # or a new configuration starts the wait over.
+                epoch = _epoch
+                deadline = time.monotonic() + FLUSH_INTERVAL
+                while _QUEUE and len(_QUEUE) < BATCH_SIZE and epoch == _epoch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    _changed.wait(remaining)
+                if _QUEUE and epoch == _epoch:
+                    break
+            batch = _take()
+            _busy += 1
+        try:
+            _run(batch)
+        finally:
+            with _lock:
+                _busy -= 1
+                _changed.notify_all()
+
+
+def flush(timeout: float | None = None) -> bool:
+    """Emit everything queued, in the calling thread, and wait for the batch in flight.
+
+    False if the background thread was still emitting after `timeout` seconds.
+    """
+
+    global _epoch
+
+    while True:
+        with _lock:
+            batch = _take()
+            _epoch += 1
+            _changed.notify_all()
+        if not batch:
+            break
+        _run(batch)
+    with _lock:
+        return _changed.wait_for(lambda: not _busy, timeout)
+
+
+def queue_info() -> dict[str, Any]:
+    """What the queue holds and has done since the process started."""
+
+    with _lock:
+        return {**_COUNTS, "pending": len(_QUEUE), "capacity": CAPACITY,
+                "batch_size": BATCH_SIZE, "flush_interval": FLUSH_INTERVAL,
+                "background": BACKGROUND}
+
+
+def _after_fork() -> None:
+    # The thread did not survive the fork, and what the parent queued is the parent's to
+    # emit: the child starts empty.
+    global _lock, _changed, _thread, _busy
+
+    _lock = threading.Lock()
+    _changed = threading.Condition(_lock)
+    _QUEUE.clear()
+    _thread = None
+    _busy = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+atexit.register(flush, 5.0)
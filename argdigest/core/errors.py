@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable
 
 from .errors_base import ArgDigestCatalogException, ArgDigestCatalogWarning
 from .._private.smonitor.catalog import CATALOG
@@ -7,25 +9,97 @@ from .._private.smonitor.catalog import CATALOG
 if TYPE_CHECKING:
     from .context import Context
 
+# Resolution runs once per error, whichever thread renders it first.
+_RESOLVE_LOCK = threading.RLock()
+
+
+#: Whether errors keep their call's argument values for post-mortem inspection; set from
+#: ``ARGDIGEST_KEEP_VALUES=1`` at import.
+KEEP_VALUES = os.getenv("ARGDIGEST_KEEP_VALUES", "0").strip().lower() not in (
+    "", "0", "false", "no", "off")
+
+
+def keep_values() -> bool:
+    """Whether errors keep the argument values of their call, not summaries of them.
+
+    Only with `KEEP_VALUES`: anywhere else, an error stored in a log or a retry queue must
+    not keep its call's arguments -- arrays included -- alive, through its context or
+    through the frames of its traceback.
+    """
+
+    return KEEP_VALUES
+
+
+def _summarized(context: Any) -> Any:
+    summarized = getattr(context, "summarized", None)
+    return summarized() if summarized is not None else context
+
+
 class DigestError(ArgDigestCatalogException):
-    """Base class for all ArgDigest exceptions."""
-    def __init__(self, message: str, context: Context | None = None, hint: str | None = None, code: str | None = None):
-        self.raw_message = message
-        self.context = context
-        self.raw_hint = hint or ""
-        resolved_code = code or CATALOG["exceptions"][self.catalog_key]["code"]
-        self.code = resolved_code
-        self.hint = self.raw_hint
-        
-        extra = {"message": message, "hint": self.hint, "code": self.code}
-        if context:
-            extra["argname"] = context.argname
-            extra["caller"] = context.function_name
-        else:
-            extra["argname"] = "unknown"
-            extra["caller"] = "unknown"
+    """Base class for all ArgDigest exceptions.
+
+    Construction only records its arguments. The catalog entry, the smonitor message and
+    anything derived from them are resolved the first time the error is rendered --
+    ``str()``, ``repr()``, pickling, or any attribute not set here -- so an error raised
+    and caught to try another candidate input costs little more than a plain exception.
+    `message` and `hint` may be given as callables returning the text, for messages that
+    are expensive to format.
 
-        super().__init__(message=message, code=resolved_code, extra=extra)
+    `args` holds the message as given -- the code, for a message given as a callable --
+    until the error is rendered, and the catalog message afterwards.
+
+    `context` is kept with its values summarized (see `Context.summarized`), unless
+    `keep_values()`.
+    """
+    def __init__(self, message: str | Callable[[], str], context: Context | None = None,
+                 hint: str | Callable[[], str] | None = None, code: str | None = None):
+        self._message = message
+        self._hint = hint
+        self.context = context if context is None or keep_values() else _summarized(context)
+        self.code = code or CATALOG["exceptions"][self.catalog_key]["code"]
+        self._resolved = False
+        # Only the base exception's: the catalog's own initialization is what waits.
+        Exception.__init__(self, message if isinstance(message, str) else self.code)
+
+    def _resolve(self) -> None:
+        with _RESOLVE_LOCK:
+            if self._resolved:
+                return
+            message = self._message() if callable(self._message) else self._message
+            hint = self._hint() if callable(self._hint) else self._hint
+            self._message = self.raw_message = message
+            self._hint = self.raw_hint = hint or ""
+            self.hint = self.raw_hint
+
+            extra = {"message": message, "hint": self.hint, "code": self.code}
+            if self.context:
+                extra["argname"] = self.context.argname
+                extra["caller"] = self.context.function_name
+            else:
+                extra["argname"] = "unknown"
+                extra["caller"] = "unknown"
+
+            super().__init__(message=message, code=self.code, extra=extra)
+            self._resolved = True
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set yet: the ones resolution sets.
+        if name.startswith("__") or self.__dict__.get("_resolved", True):
+            raise AttributeError(name)
+        self._resolve()
+        return getattr(self, name)
+
+    def __str__(self) -> str:
+        self._resolve()
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        self._resolve()
+        return super().__repr__()
+
+    def __reduce__(self) -> Any:
+        self._resolve()
+        return super().__reduce__()
 
 class DigestTypeError(DigestError, TypeError):
     """Unexpected or inconsistent data type."""
@@ -35,6 +109,10 @@ class DigestValueError(DigestError, ValueError):
     """Invalid or out-of-domain value."""
     catalog_key = "DigestValueError"
 
+class DigestCopyError(DigestValueError):
+    """A pipeline that would copy an argument past the `copy_limit` of its function."""
+    catalog_key = "DigestCopyError"
+
 class DigestInvariantError(DigestError):
     """Semantic rule violation (e.g. invalid parent-child link)."""
     catalog_key = "DigestInvariantError"
@@ -2,18 +2,21 @@ from __future__ import annotations
 
 from smonitor.integrations import CatalogException, CatalogWarning
 from .._private.smonitor.catalog import CATALOG, META
+from .._private.smonitor.emitter import ensure_configured
 
 
 class ArgDigestCatalogException(CatalogException):
     def __init__(self, **kwargs):
         if "extra" not in kwargs:
             kwargs["extra"] = {}
-        
+        ensure_configured()
         super().__init__(catalog=CATALOG, meta=META, **kwargs)
 
 class ArgDigestCatalogWarning(CatalogWarning):
     def __init__(self, **kwargs):
         if "extra" not in kwargs:
             kwargs["extra"] = {}
-        
+        # Kept for the catalog event `emitter.warn` queues after raising the warning.
+        self.catalog_extra = kwargs["extra"]
+        ensure_configured()
         super().__init__(catalog=CATALOG, meta=META, **kwargs)
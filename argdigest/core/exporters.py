@@ -0,0 +1,176 @@
+"""Export of `argdigest.stats()` as OpenMetrics text or JSON.
+
+Nothing here needs a client library. `openmetrics()` renders the current statistics in
+the OpenMetrics text format; `write_textfile()` writes it atomically, for the textfile
+collector of node-exporter or anything else scraping a directory; `TextfileExporter`
+does so periodically from a daemon thread. `to_json()` is the same snapshot as JSON.
+
+Event counters are always there. Call counts and latency histograms exist for callers
+that were timed: while `argdigest.stats.enable()` was on, or profiled with
+``profiling=True``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from .metrics import COUNTERS, stats
+
+#: Prefix of every metric name.
+PREFIX = "argdigest"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _bound(value: float) -> str:
+    return repr(float(value))
+
+
+def _histogram(lines: list[str], name: str, buckets: list[float],
+               histogram: dict[str, Any], **labels: str) -> None:
+    cumulative = 0
+    for bound, count in zip(buckets, histogram["counts"]):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels(**labels, le=_bound(bound))} {cumulative}")
+    lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram['count']}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram['count']}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram['sum']!r}")
+
+
+def openmetrics(snapshot: dict[str, Any] | None = None) -> str:
+    """Render a statistics snapshot -- the current one by default -- as OpenMetrics."""
+
+    snapshot = stats() if snapshot is None else snapshot
+    buckets = snapshot["buckets"]
+    callers = snapshot["callers"]
+    lines: list[str] = []
+
+    for name, label in COUNTERS.items():
+        family = f"{PREFIX}_{name}"
+        lines.append(f"# TYPE {family} counter")
+        for value, total in snapshot["counters"].get(name, {}).items():
+            lines.append(f"{family}_total{_labels(**{label: value})} {total}")
+
+    for name, key in (("calls", "calls"), ("errors", "errors")):
+        family = f"{PREFIX}_{name}"
+        lines.append(f"# TYPE {family} counter")
+        for caller, record in callers.items():
+            lines.append(f"{family}_total{_labels(caller=caller)} {record[key]}")
+
+    family = f"{PREFIX}_call_duration_seconds"
+    lines.append(f"# TYPE {family} histogram")
+    lines.append(f"# UNIT {family} seconds")
+    for caller, record in callers.items():
+        _histogram(lines, family, buckets, record["total"], caller=caller)
+
+    family = f"{PREFIX}_stage_duration_seconds"
+    lines.append(f"# TYPE {family} histogram")
+    lines.append(f"# UNIT {family} seconds")
+    for caller, record in callers.items():
+        for stage, histogram in record["stages"].items():
+            if histogram["count"]:
+                _histogram(lines, family, buckets, histogram, caller=caller, stage=stage)
+
+    family = f"{PREFIX}_rule_duration_seconds"
+    lines.append(f"# TYPE {family} histogram")
+    lines.append(f"# UNIT {family} seconds")
+    for caller, record in callers.items():
+        for rule, histogram in record["rules"].items():
+            _histogram(lines, family, buckets, histogram, caller=caller, rule=rule)
+
+    family = f"{PREFIX}_overhead_ratio"
+    lines.append(f"# TYPE {family} gauge")
+    for caller, record in callers.items():
+        lines.append(f"{family}{_labels(caller=caller)} {record['overhead_share']!r}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def to_json(snapshot: dict[str, Any] | None = None, **dumps_options: Any) -> str:
+    """Render a statistics snapshot -- the current one by default -- as JSON."""
+
+    return json.dumps(stats() if snapshot is None else snapshot, **dumps_options)
+
+
+def write_textfile(path: str | Path) -> str:
+    """Write the current statistics as OpenMetrics to `path`, atomically.
+
+    The text goes to a temporary file in the same directory, renamed over `path`, so a
+    collector reading the directory never sees half a file.
+    """
+
+    path = Path(path)
+    text = openmetrics()
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.",
+                                             suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+    return str(path)
+
+
+class TextfileExporter:
+    """Rewrites an OpenMetrics text file every `interval` seconds from a daemon thread.
+
+    Use it as a context manager, or call `start` and `stop`. The file is written once
+    more on `stop`, so the last interval is not lost.
+    """
+
+    def __init__(self, path: str | Path, interval: float = 15.0) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be a positive number of seconds")
+        self.path = Path(path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                write_textfile(self.path)
+            except OSError:
+                # A full disk or a vanished directory must not kill the exporter: the
+                # next interval tries again.
+                continue
+
+    def start(self) -> "TextfileExporter":
+        if self._thread is None:
+            self._stop.clear()
+            write_textfile(self.path)
+            self._thread = threading.Thread(target=self._run, name="argdigest-textfile",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        write_textfile(self.path)
+
+    def __enter__(self) -> "TextfileExporter":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -0,0 +1,95 @@
+"""Digestion time as collapsed stacks, for flamegraph tools.
+
+cProfile sees a decorated call as anonymous ``wrapper``, ``_run_digestion`` and ``gut``
+frames, the same for every function, so ArgDigest's cost cannot be read per public
+function. `CollapsedStacks` is a span sink (see `argdigest.core.spans`) that rebuilds
+each call from its spans instead and adds its time to named stacks::
+
+    mylib.process;digestion;digest_molsys 412
+    mylib.process;pipelines;std.type_check 57
+    mylib.process;body 9120
+    mylib.process;body;mylib.helper;digestion;digest_molsys 388
+
+One line per stack, frames separated by ``;``, then the self time of the last frame in
+microseconds, summed over every call seen. The body is a stage like the others, so the
+time a function spends doing its work sits next to the time spent digesting its
+arguments; decorated calls made by the body nest under it. ``flamegraph.pl``, speedscope
+and inferno all read this format.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from pathlib import Path
+
+from .spans import Span
+
+
+def _frame(span: Span) -> str | None:
+    kind = span.name.rpartition(".")[2]
+    if kind == "call":
+        return span.attributes.get("caller")
+    if kind == "digester":
+        return span.attributes.get("digester") or span.attributes.get("argname")
+    if kind == "rule":
+        return span.attributes.get("rule")
+    return kind
+
+
+class CollapsedStacks:
+    """A span sink aggregating self time per stack of frames."""
+
+    def __init__(self) -> None:
+        # Stack -> microseconds.
+        self.stacks: Counter[str] = Counter()
+        # Parent span id -> spans emitted under it whose call has not finished. Children
+        # are emitted before their parent, so a call is complete when its root arrives.
+        self._pending: dict[str, list[Span]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        with self._lock:
+            if span.parent_id is not None:
+                self._pending.setdefault(span.parent_id, []).append(span)
+                return
+            self._fold(span, ())
+
+    def _fold(self, span: Span, stack: tuple[str, ...]) -> None:
+        children = self._pending.pop(span.span_id, [])
+        frame = _frame(span)
+        if frame is None:
+            # A call bypassed before binding: its caller is unknown.
+            for child in children:
+                self._discard(child)
+            return
+        stack = stack + (frame.replace(";", ":"),)
+        self_ns = span.end_ns - span.start_ns
+        for child in children:
+            self_ns -= child.end_ns - child.start_ns
+            self._fold(child, stack)
+        micros = max(0, self_ns) // 1000
+        if micros:
+            self.stacks[";".join(stack)] += micros
+
+    def _discard(self, span: Span) -> None:
+        for child in self._pending.pop(span.span_id, []):
+            self._discard(child)
+
+    def lines(self) -> list[str]:
+        """The collapsed stacks, heaviest first."""
+
+        with self._lock:
+            return [f"{stack} {micros}" for stack, micros in self.stacks.most_common()]
+
+    def write(self, path: str | Path) -> str:
+        """Write the collapsed stacks to `path`."""
+
+        path = Path(path)
+        path.write_text("".join(line + "\n" for line in self.lines()), encoding="utf-8")
+        return str(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stacks.clear()
+            self._pending.clear()
@@ -14,12 +14,15 @@ resolution order, enforcement, diagnostics, introspection — belongs here.
 
 from __future__ import annotations
 
-import difflib
+import threading
+import weakref
 from dataclasses import dataclass, field
 from functools import lru_cache
 from fnmatch import fnmatchcase
 from typing import Any, Callable, Iterable, Mapping, Sequence
 
+from .caches import CacheStats, register as _register_cache, register_lru
+
 #: `admits` values with a reserved meaning. Anything else names a domain.
 ADMITS_SIGNATURE = "signature"
 ADMITS_ANY = "any"
@@ -45,6 +48,8 @@ class Domain:
     depends_on: str | Sequence[str] | None = None
     by_value: Mapping[Any, Iterable[str]] | None = None
     description: str | None = None
+    # Membership set of a flat domain with static members, built on first use; see `index`.
+    _index: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         delegating = self.depends_on is not None or self.by_value is not None
@@ -90,7 +95,22 @@ class Domain:
             )
         if self.contains is not None:
             return bool(self.contains(keyword))
-        return keyword in set(self.known_members())
+        return keyword in self.index()
+
+    def index(self) -> frozenset[str]:
+        """The enumerable members as a set.
+
+        Static `members` are made a set once and kept. A callable is called each time, as
+        by `known_members`, so a domain whose names change answers with the current ones.
+        """
+
+        if callable(self.members):
+            return frozenset(self.known_members())
+        index = self._index
+        if index is None:
+            index = frozenset(self.known_members())
+            object.__setattr__(self, "_index", index)
+        return index
 
     def resolve_members(self, bound: Mapping[str, Any] | None = None
                         ) -> tuple[str, ...] | None:
@@ -196,7 +216,10 @@ class Violation:
     keyword: str | None = None
 
 
-@lru_cache(maxsize=None)
+# Keyed by caller name; bounded because callers are as many as decorated functions, and
+# a process generating closures would otherwise grow it forever. A plain lru_cache, not
+# `caches.memoize`: it sits on the call path.
+@lru_cache(maxsize=4096)
 def default_contract(caller: str, has_var_keyword: bool) -> FunctionContract:
     """The contract of a function that declared none.
 
@@ -216,6 +239,25 @@ def default_contract(caller: str, has_var_keyword: bool) -> FunctionContract:
     )
 
 
+register_lru("function_contract.default_contract", default_contract)
+
+
+# Every live registry, so their per-caller memos are one cache to `cache_info`.
+_REGISTRIES: "weakref.WeakSet[ContractRegistry]" = weakref.WeakSet()
+_RESOLVED_STATS = CacheStats()
+
+
+def _clear_resolved() -> None:
+    for registry in list(_REGISTRIES):
+        with registry._lock:
+            registry._resolved = {}
+
+
+_register_cache("function_contract.resolved", _clear_resolved, kind="resolution",
+                size=lambda: sum(len(registry._resolved) for registry in list(_REGISTRIES)),
+                stats=_RESOLVED_STATS)
+
+
 class ContractRegistry:
     """Resolves the contract that applies to a caller, most specific first.
 
@@ -226,41 +268,66 @@ class ContractRegistry:
 
     def __init__(self, contracts: Iterable[FunctionContract] = ()) -> None:
         self._exact: dict[str, FunctionContract] = {}
-        self._patterns: list[FunctionContract] = []
+        self._patterns: tuple[FunctionContract, ...] = ()
         # Resolution runs on every decorated call, and a caller that matches no pattern
         # would otherwise walk the whole pattern list each time. `None` is memoized too:
         # "nothing declared here" is the answer for most callers in a real library.
         self._resolved: dict[str, FunctionContract | None] = {}
+        self._lock = threading.Lock()
+        _REGISTRIES.add(self)
         for contract in contracts:
             self.add(contract)
 
     def add(self, contract: FunctionContract) -> None:
-        if contract.caller is not None:
-            self._exact[contract.caller] = contract
-        else:
-            self._patterns.append(contract)
-            self._patterns.sort(key=lambda item: len(item.caller_pattern or ""), reverse=True)
-        self._resolved.clear()
+        # Copy-on-write: `resolve` runs unlocked, so declarations and memo are replaced,
+        # never mutated under a reader. A resolution racing with `add` stores its answer
+        # in the memo it read, which `add` has just discarded.
+        with self._lock:
+            if contract.caller is not None:
+                self._exact = {**self._exact, contract.caller: contract}
+            else:
+                self._patterns = tuple(sorted(
+                    self._patterns + (contract,),
+                    key=lambda item: len(item.caller_pattern or ""), reverse=True))
+            self._resolved = {}
 
     def resolve(self, caller: str) -> FunctionContract | None:
+        resolved = self._resolved
         try:
-            return self._resolved[caller]
+            contract = resolved[caller]
         except KeyError:
             pass
+        else:
+            _RESOLVED_STATS.hits += 1
+            return contract
+        _RESOLVED_STATS.misses += 1
         contract = self._exact.get(caller)
         if contract is None:
             for candidate in self._patterns:
                 if fnmatchcase(caller, candidate.caller_pattern or ""):
                     contract = candidate
                     break
-        self._resolved[caller] = contract
+        resolved[caller] = contract
         return contract
 
     def declared_callers(self) -> tuple[str, ...]:
         return tuple(self._exact) + tuple(c.caller_pattern or "" for c in self._patterns)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # A plan pickled by value carries its registry; the lock and the memo stay home.
+        return {"exact": self._exact, "patterns": self._patterns}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._exact = state["exact"]
+        self._patterns = state["patterns"]
+        self._resolved = {}
+        self._lock = threading.Lock()
+        _REGISTRIES.add(self)
+
 
 def _suggest(keyword: str, candidates: Iterable[str]) -> str:
+    import difflib
+
     matches = difflib.get_close_matches(keyword, sorted(set(candidates)), n=1, cutoff=0.75)
     if not matches:
         return ""
@@ -13,11 +13,11 @@ ordering, and validation happen here.
 from __future__ import annotations
 
 import pkgutil
-from functools import lru_cache
 from importlib import import_module
 from types import ModuleType
 from typing import Iterable
 
+from .caches import memoize
 from .function_contract import ContractRegistry, Domain, FunctionContract
 from .normalization import AliasTable, NormalizationRegistry
 
@@ -74,7 +74,7 @@ def _collect_domains(module: ModuleType) -> list[Domain]:
     return collected
 
 
-@lru_cache(maxsize=None)
+@memoize(maxsize=256)
 def load_function_contracts(function_source: str | tuple[str, ...] | None) -> ContractRegistry:
     """Build the contract registry declared by a consumer."""
 
@@ -86,7 +86,7 @@ def load_function_contracts(function_source: str | tuple[str, ...] | None) -> Co
     return registry
 
 
-@lru_cache(maxsize=None)
+@memoize(maxsize=256)
 def load_domains(domain_source: str | tuple[str, ...] | None) -> dict[str, Domain]:
     """Build the domain table declared by a consumer."""
 
@@ -115,7 +115,7 @@ def _collect_alias_tables(module: ModuleType) -> list[AliasTable]:
     return collected
 
 
-@lru_cache(maxsize=None)
+@memoize(maxsize=256)
 def load_normalization(normalization_source: str | tuple[str, ...] | None
                        ) -> NormalizationRegistry:
     """Build the alias registry declared by a consumer."""
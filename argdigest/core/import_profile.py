@@ -0,0 +1,164 @@
+"""Attribution of decoration cost, for `argdigest profile-import`.
+
+Decorating a function builds its plan: configuration, digester discovery, axis-1
+declarations, signature analysis, the standardizer check and, with ``type_check=True``,
+beartype wrapping. All of it runs while the consumer library is imported. This module
+times each of those stages per decorated function, and records the modules each stage
+caused to be imported.
+
+Stages are marked in the decorator with `stage(name)`. Without an active profiler it
+returns a shared null context, so decoration outside `profile_import` pays one global
+read per stage.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from importlib import import_module
+from typing import Any, Iterator
+
+#: Stage names, in the order decoration runs them.
+STAGES = (
+    "beartype",
+    "config",
+    "discovery",
+    "standardizer",
+    "standardizer_check",
+    "declarations",
+    "signature",
+    "adapters",
+)
+
+_NULL = nullcontext()
+_ACTIVE: "DecorationProfiler | None" = None
+
+
+class DecorationProfiler:
+    """Collects per-function, per-stage decoration timings while active."""
+
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+        self._local = threading.local()
+
+    def _stack(self) -> list[dict[str, Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def decoration(self, fn: Any) -> Iterator[None]:
+        qualified_name = f"{fn.__module__}.{getattr(fn, '__qualname__', fn.__name__)}"
+        record = {"function": qualified_name, "total": 0.0,
+                  "stages": {}, "imports": {}}
+        frame = {"record": record, "children": 0.0, "modules": set()}
+        stack = self._stack()
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["total"] = time.perf_counter() - start
+            stack.pop()
+            self.records.append(record)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stack = self._stack()
+        if not stack:
+            yield
+            return
+        record = stack[-1]["record"]
+        frame = {"record": record, "children": 0.0, "modules": set()}
+        stack.append(frame)
+        modules_before = set(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            # Self time and own imports: a nested stage is reported once, under its own
+            # name, so the stages of a function add up to no more than its total.
+            new_modules = set(sys.modules) - modules_before
+            stack[-1]["children"] += elapsed
+            stack[-1]["modules"] |= new_modules
+            own = elapsed - frame["children"]
+            record["stages"][name] = record["stages"].get(name, 0.0) + own
+            own_modules = sorted(new_modules - frame["modules"])
+            if own_modules:
+                record["imports"].setdefault(name, []).extend(own_modules)
+
+
+def stage(name: str):
+    """Mark a decoration stage; a no-op unless a profiler is active."""
+
+    profiler = _ACTIVE
+    if profiler is None:
+        return _NULL
+    return profiler.stage(name)
+
+
+def decoration(fn: Any):
+    """Mark the decoration of one function; a no-op unless a profiler is active."""
+
+    profiler = _ACTIVE
+    if profiler is None:
+        return _NULL
+    return profiler.decoration(fn)
+
+
+@contextmanager
+def profiling_decoration() -> Iterator[DecorationProfiler]:
+    """Activate a fresh profiler for the duration of the block."""
+
+    global _ACTIVE
+
+    previous = _ACTIVE
+    profiler = DecorationProfiler()
+    _ACTIVE = profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE = previous
+
+
+def profile_import(module_name: str, submodules: bool = True) -> dict[str, Any]:
+    """Import a package under instrumentation and report what decoration cost.
+
+    Modules already imported are not imported again, so run this in a fresh process --
+    the CLI does. With `submodules`, every module of the package is imported, the way
+    `argdigest compile` walks it.
+    """
+
+    from .compiler import _iter_modules
+
+    modules_before = set(sys.modules)
+    with profiling_decoration() as profiler:
+        start = time.perf_counter()
+        if submodules:
+            _iter_modules(module_name)
+        else:
+            import_module(module_name)
+        elapsed = time.perf_counter() - start
+
+    stages: dict[str, float] = {}
+    imports: dict[str, list[str]] = {}
+    for record in profiler.records:
+        for name, seconds in record["stages"].items():
+            stages[name] = stages.get(name, 0.0) + seconds
+        for name, modules in record["imports"].items():
+            imports.setdefault(name, []).extend(modules)
+    decoration_total = sum(record["total"] for record in profiler.records)
+    return {
+        "module": module_name,
+        "import_time": elapsed,
+        "decoration_time": decoration_total,
+        "functions": sorted(profiler.records, key=lambda record: record["total"], reverse=True),
+        "stages": dict(sorted(stages.items(), key=lambda item: item[1], reverse=True)),
+        "argdigest_imports": imports,
+        "modules_imported": len(set(sys.modules) - modules_before),
+    }
@@ -0,0 +1,263 @@
+"""Per-stage latency of decorated calls, behind `argdigest.stats()`.
+
+A decorated call runs, in order: binding, normalization, the standardizer, the function
+contract, argument digestion, pipelines, and the body of the function. When metrics are
+enabled (`argdigest.stats.enable()`), each call is timed at the boundary of every stage
+and counted, per caller, into fixed-bucket histograms. `profiling=True` only ever saw
+pipeline rules; this sees where the rest of the overhead goes.
+
+Disabled, which is the default, a call pays one module attribute read.
+
+A function decorated with ``profiling=True`` is always measured, but can be sampled:
+with ``profiling_every=N`` one call in N is timed, with ``profiling_interval=S`` the
+first call after S seconds is. The others only increment a counter, and the sampled call
+is recorded with the number of calls it stands for as its weight, so counts and
+histograms are estimates of every call, not of the sampled ones only.
+
+Event counters -- digestion failures by catalog code, contract violations by kind,
+missing-digester warnings, calls over their latency budget, cache hits and misses -- are
+always kept: they count events
+that are off the fast path already, and `count` is one locked increment.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any, Callable
+
+#: Stages of a decorated call, in the order they run. `body` is the function itself.
+STAGES = ("bind", "normalization", "standardizer", "contract", "digestion", "pipelines", "body")
+
+#: Upper bounds of the histogram buckets, in seconds; a last bucket takes the rest.
+BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+)
+
+ENABLED = False
+
+_lock = threading.Lock()
+# caller -> its statistics.
+_CALLERS: dict[str, "_CallerStats"] = {}
+# (counter, label) -> events counted.
+_COUNTS: Counter[tuple[str, str]] = Counter()
+
+#: Event counters, with what their label holds.
+COUNTERS = {
+    "digestion_failures": "code",
+    "pipeline_failures": "code",
+    "contract_violations": "kind",
+    "missing_digesters": "caller",
+    "slow_calls": "caller",
+    "cache_hits": "cache",
+    "cache_misses": "cache",
+    "dropped_diagnostics": "reason",
+}
+
+
+# (collect, reset) pairs for counters kept elsewhere, without this module's lock.
+_COLLECTORS: list[tuple[Callable[[], Mapping[tuple[str, str], int]], Callable[[], None]]] = []
+
+
+def count(name: str, label: str) -> None:
+    """Count one event of counter `name`; see `COUNTERS`."""
+
+    with _lock:
+        _COUNTS[(name, label)] += 1
+
+
+def register_collector(collect: Callable[[], Mapping[tuple[str, str], int]],
+                       reset: Callable[[], None]) -> None:
+    """Add counts kept elsewhere to `stats()`: `collect` returns them by
+    ``(counter, label)``, and `reset` starts them over, with the rest."""
+
+    _COLLECTORS.append((collect, reset))
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float, weight: int = 1) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += weight
+        self.count += weight
+        self.sum += seconds * weight
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "counts": list(self.counts)}
+
+
+class _CallerStats:
+    __slots__ = ("calls", "sampled", "errors", "total", "stages", "rules")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.sampled = 0
+        self.errors = 0
+        self.total = _Histogram()
+        self.stages = {name: _Histogram() for name in STAGES}
+        self.rules: dict[str, _Histogram] = {}
+
+    def snapshot(self) -> dict[str, Any]:
+        body = self.stages["body"].sum
+        return {
+            "calls": self.calls,
+            "sampled": self.sampled,
+            "errors": self.errors,
+            "total": self.total.snapshot(),
+            "stages": {name: histogram.snapshot() for name, histogram in self.stages.items()},
+            "rules": {name: histogram.snapshot() for name, histogram in sorted(self.rules.items())},
+            # What share of the time spent in this function was ArgDigest's.
+            "overhead_share": (self.total.sum - body) / self.total.sum if self.total.sum else 0.0,
+        }
+
+
+class Sampler:
+    """Decides which calls of a profiled function are timed.
+
+    `tick` is called once per call and returns 0 for a call left alone, or, for a sampled
+    one, how many calls it stands for. The counter is not locked: under contention a few
+    increments may be lost, which only makes the estimate slightly low.
+    """
+
+    __slots__ = ("every", "interval", "count", "next_at")
+
+    def __init__(self, every: int = 1, interval: float | None = None) -> None:
+        self.every = every
+        self.interval = interval
+        self.count = 0
+        self.next_at = 0.0
+
+    def tick(self) -> int:
+        self.count += 1
+        if self.interval is None:
+            if self.count < self.every:
+                return 0
+        else:
+            now = time.monotonic()
+            if now < self.next_at:
+                return 0
+            self.next_at = now + self.interval
+        weight, self.count = self.count, 0
+        return weight
+
+
+class Timer:
+    """Times the stages of one call: every call while metrics are enabled, and the
+    sampled calls of a profiled function.
+
+    A weight of 0 times a call without recording it, for a latency budget alone.
+    """
+
+    __slots__ = ("caller", "weight", "start", "last", "stages", "rules")
+
+    def __init__(self, weight: int = 1) -> None:
+        # Unknown until binding is done; a call bypassed before that is not recorded.
+        self.caller: str | None = None
+        self.weight = weight
+        self.start = self.last = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.rules: list[tuple[str, float]] = []
+
+    def mark(self, stage: str) -> None:
+        """Close `stage`: everything since the previous mark is charged to it."""
+
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self.last
+        self.last = now
+
+    def rule(self, name: str, seconds: float) -> None:
+        """Record the duration of one pipeline rule of the call."""
+
+        self.rules.append((name, seconds))
+
+    def observe(self, run: Callable[[], Any]) -> Any:
+        try:
+            result = run()
+        except BaseException:
+            self._record(error=True)
+            raise
+        self._record(error=False)
+        return result
+
+    def _record(self, error: bool) -> None:
+        if self.caller is None or not self.weight:
+            return
+        total = time.perf_counter() - self.start
+        with _lock:
+            caller_stats = _CALLERS.get(self.caller)
+            if caller_stats is None:
+                caller_stats = _CALLERS[self.caller] = _CallerStats()
+            caller_stats.calls += self.weight
+            caller_stats.sampled += 1
+            caller_stats.errors += self.weight if error else 0
+            caller_stats.total.observe(total, self.weight)
+            for name, seconds in self.stages.items():
+                caller_stats.stages[name].observe(seconds, self.weight)
+            for name, seconds in self.rules:
+                histogram = caller_stats.rules.get(name)
+                if histogram is None:
+                    histogram = caller_stats.rules[name] = _Histogram()
+                histogram.observe(seconds, self.weight)
+
+
+def stats() -> dict[str, Any]:
+    """Snapshot the statistics collected so far.
+
+    Per caller: `calls` and `errors`, a `total` histogram, one histogram per stage and one
+    per pipeline rule, and `overhead_share`, the fraction of the total spent outside the
+    function body. A stage a call never reached (the body of a call rejected by its
+    contract) is not observed. `sampled` is how many calls were actually timed; with
+    sampling, the other counts are extrapolated from them. `counters` holds the event
+    counters, by label.
+    """
+
+    with _lock:
+        callers = {caller: caller_stats.snapshot()
+                   for caller, caller_stats in sorted(_CALLERS.items())}
+        counters: dict[str, dict[str, int]] = {name: {} for name in COUNTERS}
+        counts = Counter(_COUNTS)
+    for collect, _ in list(_COLLECTORS):
+        counts.update(collect())
+    for (name, label), value in sorted(counts.items()):
+        counters.setdefault(name, {})[label] = value
+    return {"enabled": ENABLED, "buckets": list(BUCKETS), "stages": list(STAGES),
+            "callers": callers, "counters": counters}
+
+
+def enable() -> None:
+    """Start timing decorated calls."""
+
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stop timing decorated calls; what was collected is kept."""
+
+    global ENABLED
+    ENABLED = False
+
+
+def reset() -> None:
+    """Forget everything collected so far."""
+
+    with _lock:
+        _CALLERS.clear()
+        _COUNTS.clear()
+    for _, reset_counts in list(_COLLECTORS):
+        reset_counts()
+
+
+stats.enable = enable  # type: ignore[attr-defined]
+stats.disable = disable  # type: ignore[attr-defined]
+stats.reset = reset  # type: ignore[attr-defined]
@@ -0,0 +1,236 @@
+"""A digester and pipeline profiler built on `sys.monitoring` (PEP 669, Python 3.12+).
+
+`profiling=True` and `argdigest.stats()` time digesters and rules from the wrapper, with
+clock reads around each one. This profiler leaves the call path alone: `start()` asks
+the interpreter to report entering and leaving the code objects ArgDigest knows about --
+the digesters in the plans of every decorated function, the pipeline rules registered
+or named in a plan -- and nothing else. Undecorated code runs uninstrumented, and
+`stop()` removes the instrumentation again.
+
+    from argdigest.core import monitoring
+
+    with monitoring.profile() as report:
+        run_workload()
+    for name, row in report().items():
+        print(name, row["calls"], row["total"])
+
+Code is selected when profiling starts: a function decorated, or a pipeline kind loaded,
+afterwards is not seen. A generator digester is timed up to its first ``yield``. A call
+that raises is timed up to the exception leaving it, and counted in ``raised`` too: that
+one event cannot be asked for per code object, so every exception unwinding a Python
+frame reaches the profiler, which ignores those of code it does not know.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from .decorator import decorated_functions
+from .registry import Registry
+
+_lock = threading.Lock()
+_local = threading.local()
+_tool: int | None = None
+# Bumped by `start`, so a thread's entries left over from a profile stopped mid-call are
+# dropped instead of matched.
+_session = 0
+# code object -> (name, "digester" or "rule"), while profiling.
+_CODES: dict[Any, tuple[str, str]] = {}
+# name -> [kind, calls, nanoseconds, raised].
+_TOTALS: dict[str, list[Any]] = {}
+
+#: Calls a thread may have in progress before its oldest entries are dropped, untimed.
+MAX_DEPTH = 1024
+
+
+def available() -> bool:
+    """Whether this interpreter has `sys.monitoring`."""
+
+    return hasattr(sys, "monitoring")
+
+
+def _label(fn: Any, code: Any) -> str:
+    module = getattr(fn, "__module__", None) or code.co_filename
+    return f"{module}.{code.co_qualname}"
+
+
+def _targets() -> dict[Any, tuple[str, str]]:
+    """The code objects of every known digester and pipeline rule.
+
+    Digesters are named by their qualified name, registered rules as ``kind.rule``, as in
+    `argdigest.allocations()`.
+    """
+
+    found: dict[Any, tuple[str, str]] = {}
+
+    def add(fn: Any, kind: str, name: str | None = None) -> None:
+        fn = getattr(fn, "func", fn)  # functools.partial
+        code = getattr(fn, "__code__", None)
+        if code is not None and code not in found:
+            found[code] = (name or _label(fn, code), kind)
+
+    for wrapper in decorated_functions():
+        plan = getattr(wrapper, "digestion_plan", None)
+        if plan is None:
+            continue
+        for digester in plan.digesters.values():
+            add(digester, "digester")
+        for target in plan.pipeline_targets.values():
+            kind = target.get("kind")
+            for rule in target.get("rules") or ():
+                if isinstance(rule, str):
+                    fn = Registry.snapshot(kind).get(rule) if kind else None
+                    if fn is not None:
+                        add(fn, "rule", f"{kind}.{rule}")
+                elif callable(rule) and not isinstance(rule, type):
+                    add(rule, "rule")
+    for kind, rules in Registry._pipelines.items():
+        for name, rule in rules.items():
+            add(rule, "rule", f"{kind}.{name}")
+    return found
+
+
+def _on_start(code: Any, offset: int) -> None:
+    stack = getattr(_local, "stack", None)
+    if stack is None or _local.session != _session:
+        stack = _local.stack = []
+        _local.session = _session
+    elif len(stack) >= MAX_DEPTH:
+        # Only a generator abandoned before its first `yield` is never popped.
+        del stack[:len(stack) - MAX_DEPTH + 1]
+    stack.append((code, time.perf_counter_ns()))
+
+
+def _finish(code: Any, raised: bool) -> None:
+    now = time.perf_counter_ns()
+    stack = getattr(_local, "stack", None)
+    if not stack or _local.session != _session:
+        return
+    # The innermost entry of `code`; what sits above it was left by calls whose end the
+    # profiler did not see, and goes with it.
+    for index in range(len(stack) - 1, -1, -1):
+        if stack[index][0] is code:
+            started = stack[index][1]
+            del stack[index:]
+            break
+    else:
+        return
+    target = _CODES.get(code)
+    if target is None:
+        return
+    name, kind = target
+    with _lock:
+        totals = _TOTALS.get(name)
+        if totals is None:
+            totals = _TOTALS[name] = [kind, 0, 0, 0]
+        totals[1] += 1
+        totals[2] += now - started
+        totals[3] += raised
+
+
+def _on_return(code: Any, offset: int, retval: Any) -> None:
+    _finish(code, False)
+
+
+def _on_unwind(code: Any, offset: int, exception: BaseException) -> None:
+    if code in _CODES:
+        _finish(code, True)
+
+
+def _claim_tool() -> int:
+    monitoring = sys.monitoring
+    for tool in (monitoring.PROFILER_ID, 3, 4):
+        if monitoring.get_tool(tool) is None:
+            monitoring.use_tool_id(tool, "argdigest")
+            return tool
+    raise RuntimeError("no sys.monitoring tool id is free: another profiler holds them")
+
+
+def start() -> int:
+    """Instrument every known digester and pipeline rule. Returns how many."""
+
+    global _tool, _session
+
+    if not available():
+        raise RuntimeError("the sys.monitoring profiler needs Python 3.12 or later")
+    if _tool is not None:
+        raise RuntimeError("the sys.monitoring profiler is already running")
+    monitoring = sys.monitoring
+    events = monitoring.events
+    tool = _claim_tool()
+    _CODES.clear()
+    _CODES.update(_targets())
+    _session += 1
+    monitoring.register_callback(tool, events.PY_START, _on_start)
+    monitoring.register_callback(tool, events.PY_RETURN, _on_return)
+    monitoring.register_callback(tool, events.PY_YIELD, _on_return)
+    monitoring.register_callback(tool, events.PY_UNWIND, _on_unwind)
+    for code in _CODES:
+        monitoring.set_local_events(tool, code,
+                                    events.PY_START | events.PY_RETURN | events.PY_YIELD)
+    monitoring.set_events(tool, events.PY_UNWIND)
+    _tool = tool
+    return len(_CODES)
+
+
+def stop() -> None:
+    """Remove the instrumentation; what was measured is kept."""
+
+    global _tool
+
+    if _tool is None:
+        return
+    monitoring = sys.monitoring
+    events = monitoring.events
+    monitoring.set_events(_tool, 0)
+    for code in _CODES:
+        monitoring.set_local_events(_tool, code, 0)
+    for event in (events.PY_START, events.PY_RETURN, events.PY_YIELD, events.PY_UNWIND):
+        monitoring.register_callback(_tool, event, None)
+    monitoring.free_tool_id(_tool)
+    _tool = None
+    _CODES.clear()
+
+
+def running() -> bool:
+    return _tool is not None
+
+
+def report() -> dict[str, dict[str, Any]]:
+    """Calls and time per digester and rule, slowest total first.
+
+    `total` and `mean` are in seconds, and include whatever the code called. `raised`
+    counts the calls, among `calls`, that ended with an exception.
+    """
+
+    with _lock:
+        rows = {
+            name: {"kind": kind, "calls": calls, "raised": raised,
+                   "total": nanoseconds / 1e9,
+                   "mean": nanoseconds / 1e9 / calls if calls else 0.0}
+            for name, (kind, calls, nanoseconds, raised) in _TOTALS.items()
+        }
+    return dict(sorted(rows.items(), key=lambda item: item[1]["total"], reverse=True))
+
+
+def reset() -> None:
+    """Forget everything measured so far."""
+
+    with _lock:
+        _TOTALS.clear()
+
+
+@contextmanager
+def profile() -> Iterator[Callable[[], dict[str, dict[str, Any]]]]:
+    """Profile the block, from a fresh report; yields `report`."""
+
+    reset()
+    start()
+    try:
+        yield report
+    finally:
+        stop()
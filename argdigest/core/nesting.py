@@ -0,0 +1,150 @@
+"""Attribution of decorated calls made inside other decorated calls.
+
+A public function of a library is decorated, and so, often, are the functions it calls:
+an argument digested at the public boundary is then digested again at every internal
+one it passes through. Each of those costs little, and together they can dominate --
+one predicate digested hundreds of times per call of the public function that received
+it once.
+
+While enabled (`argdigest.nested_calls.enable()`), every decorated call pushes a frame on
+a context variable, so the outermost decorated call of a stack -- the public one -- sees
+everything under it: how many decorated calls it made, which arguments were digested how
+many times, and which values were digested again after a call above had already
+digested them. A value is recognised by identity, and kept alive by the frame until the
+outermost call returns, so an identity is never reused within one trace.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any
+
+ENABLED = False
+
+_current: ContextVar["_Frame | None"] = ContextVar("argdigest_nested_call", default=None)
+
+_lock = threading.Lock()
+# outermost caller -> its totals over every traced call.
+_TOTALS: dict[str, "_Totals"] = {}
+
+
+class _Totals:
+    __slots__ = ("calls", "inner", "digestions", "redigested")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.inner: Counter[str] = Counter()
+        self.digestions: Counter[str] = Counter()
+        self.redigested: Counter[str] = Counter()
+
+    def snapshot(self, caller: str) -> dict[str, Any]:
+        redundant = sum(self.redigested.values())
+        return {
+            "caller": caller,
+            "calls": self.calls,
+            "inner_calls": sum(self.inner.values()),
+            "inner": dict(self.inner.most_common()),
+            "digestions": dict(self.digestions.most_common()),
+            "redigested": dict(self.redigested.most_common()),
+            "redundant": redundant,
+            "redundant_per_call": redundant / self.calls if self.calls else 0.0,
+        }
+
+
+class _Frame:
+    __slots__ = ("root", "caller", "token", "inner", "digestions", "redigested", "values")
+
+    def __init__(self, parent: "_Frame | None") -> None:
+        self.root = self if parent is None else parent.root
+        self.caller: str | None = None
+        self.token: Any = None
+        if parent is None:
+            self.inner: Counter[str] = Counter()
+            self.digestions: Counter[str] = Counter()
+            self.redigested: Counter[str] = Counter()
+            # id -> (value, the frame that digested it).
+            self.values: dict[int, tuple[Any, _Frame]] = {}
+
+    def digested(self, argname: str, value: Any, result: Any) -> None:
+        """Note that `argname` was digested here, from `value` to `result`."""
+
+        root = self.root
+        root.digestions[f"{self.caller}:{argname}"] += 1
+        if value is not None:
+            seen = root.values.get(id(value))
+            if seen is not None and seen[1] is not self:
+                root.redigested[f"{self.caller}:{argname}"] += 1
+            root.values[id(value)] = (value, self)
+        if result is not None and result is not value:
+            root.values[id(result)] = (result, self)
+
+
+def enter() -> _Frame:
+    """Push the frame of a decorated call."""
+
+    frame = _Frame(_current.get())
+    frame.token = _current.set(frame)
+    return frame
+
+
+def leave(frame: _Frame) -> None:
+    """Pop the frame of a decorated call; the outermost one files what it saw."""
+
+    _current.reset(frame.token)
+    root = frame.root
+    if frame is not root:
+        if frame.caller is not None:
+            root.inner[frame.caller] += 1
+        return
+    if frame.caller is None:
+        return
+    with _lock:
+        totals = _TOTALS.get(frame.caller)
+        if totals is None:
+            totals = _TOTALS[frame.caller] = _Totals()
+        totals.calls += 1
+        totals.inner.update(root.inner)
+        totals.digestions.update(root.digestions)
+        totals.redigested.update(root.redigested)
+
+
+def nested_calls(top: int | None = None) -> dict[str, Any]:
+    """Report, per outermost caller, what its traced calls did below it.
+
+    Callers are ranked worst first: by redundant digestions -- values digested again
+    after a call above had digested them -- then by inner decorated calls. Counters are
+    keyed ``"caller:argname"``; `inner` is keyed by caller.
+    """
+
+    with _lock:
+        callers = [totals.snapshot(caller) for caller, totals in _TOTALS.items()]
+    callers.sort(key=lambda item: (item["redundant"], item["inner_calls"]), reverse=True)
+    return {"enabled": ENABLED, "callers": callers[:top] if top is not None else callers}
+
+
+def enable() -> None:
+    """Start tracing nested decorated calls."""
+
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stop tracing; what was collected is kept."""
+
+    global ENABLED
+    ENABLED = False
+
+
+def reset() -> None:
+    """Forget everything collected so far."""
+
+    with _lock:
+        _TOTALS.clear()
+
+
+nested_calls.enable = enable  # type: ignore[attr-defined]
+nested_calls.disable = disable  # type: ignore[attr-defined]
+nested_calls.reset = reset  # type: ignore[attr-defined]
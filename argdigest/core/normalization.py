@@ -18,11 +18,14 @@ defines. A table declares only what is real.
 
 from __future__ import annotations
 
+import threading
+import weakref
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from fnmatch import fnmatchcase
 from typing import Any
 
+from .caches import CacheStats, register as _register_cache
 from .context import Context
 from .errors import ArgumentConsistencyError
 
@@ -77,29 +80,54 @@ class AliasTable:
         return all(bound.get(name) == value for name, value in self.when.items())
 
 
+# Every live registry, so their per-caller memos are one cache to `cache_info`.
+_REGISTRIES: "weakref.WeakSet[NormalizationRegistry]" = weakref.WeakSet()
+_BY_CALLER_STATS = CacheStats()
+
+
+def _clear_by_caller() -> None:
+    for registry in list(_REGISTRIES):
+        with registry._lock:
+            registry._by_caller = {}
+
+
+_register_cache("normalization.by_caller", _clear_by_caller, kind="resolution",
+                size=lambda: sum(len(registry._by_caller) for registry in list(_REGISTRIES)),
+                stats=_BY_CALLER_STATS)
+
+
 class NormalizationRegistry:
     """Resolves which alias tables apply to a caller, most specific first."""
 
     def __init__(self, tables: Iterable[AliasTable] = ()) -> None:
-        self._tables: list[AliasTable] = []
+        self._tables: tuple[AliasTable, ...] = ()
         # Which tables match a caller depends only on the caller, so it is cached; the
         # `when` guard still has to be evaluated per call, because it reads values.
         self._by_caller: dict[str, tuple[AliasTable, ...]] = {}
+        self._lock = threading.Lock()
+        _REGISTRIES.add(self)
         for table in tables:
             self.add(table)
 
     def add(self, table: AliasTable) -> None:
-        self._tables.append(table)
-        self._tables.sort(key=lambda item: item.specificity, reverse=True)
-        self._by_caller.clear()
+        # Copy-on-write, as in `ContractRegistry.add`: readers hold no lock.
+        with self._lock:
+            self._tables = tuple(sorted(self._tables + (table,),
+                                        key=lambda item: item.specificity, reverse=True))
+            self._by_caller = {}
 
     def for_caller(self, caller: str) -> tuple[AliasTable, ...]:
+        by_caller = self._by_caller
         try:
-            return self._by_caller[caller]
+            matching = by_caller[caller]
         except KeyError:
             pass
+        else:
+            _BY_CALLER_STATS.hits += 1
+            return matching
+        _BY_CALLER_STATS.misses += 1
         matching = tuple(table for table in self._tables if table.matches_caller(caller))
-        self._by_caller[caller] = matching
+        by_caller[caller] = matching
         return matching
 
     def tables(self) -> tuple[AliasTable, ...]:
@@ -108,6 +136,15 @@ class NormalizationRegistry:
     def __bool__(self) -> bool:
         return bool(self._tables)
 
+    def __getstate__(self) -> dict[str, Any]:
+        return {"tables": self._tables}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._tables = state["tables"]
+        self._by_caller = {}
+        self._lock = threading.Lock()
+        _REGISTRIES.add(self)
+
 
 def apply_normalization(registry: NormalizationRegistry, caller: str,
                         bound: dict[str, Any],
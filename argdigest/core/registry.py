@@ -1,36 +1,93 @@
 from __future__ import annotations
 import time
 import threading
+from importlib import import_module
 from typing import Callable, Any
+from . import allocations as _allocations
+from .audit import RuleTimings
 from .logger import get_logger
 from smonitor import signal
 
 logger = get_logger()
 
+
+def _audit(ctx: Any, rule_name: str, duration: float) -> None:
+    """Record the duration of a rule in the context's audit log, timer and spans."""
+
+    log = ctx.audit_log
+    if isinstance(log, RuleTimings):
+        log.record(rule_name, ctx.caller or ctx.function_name, ctx.argname, duration)
+    elif log is not None:
+        log.append({"rule": rule_name, "duration": duration})
+    timer = getattr(ctx, "_timer", None)
+    if timer is not None:
+        timer.rule(rule_name, duration)
+    recorder = getattr(ctx, "_spans", None)
+    if recorder is not None:
+        recorder.rule(rule_name, duration, ctx.argname)
+
 class Registry:
-    # kind -> name -> callable
+    # kind -> name -> callable. Copy-on-write: a registration publishes new dicts and
+    # never mutates the ones readers may hold, so lookups on the call path take no lock.
     _pipelines: dict[str, dict[str, Callable[..., Any]]] = {}
     _lock = threading.RLock()
+    # kind -> modules whose import registers its pipelines; emptied on first use.
+    _lazy: dict[str, tuple[str, ...]] = {}
+    _lazy_lock = threading.RLock()
 
     @classmethod
     def register_pipeline(cls, kind: str, name: str, func: Callable[..., Any]) -> None:
         with cls._lock:
-            cls._pipelines.setdefault(kind, {})
-            cls._pipelines[kind][name] = func
+            cls._pipelines = {**cls._pipelines,
+                              kind: {**cls._pipelines.get(kind, {}), name: func}}
+
+    @classmethod
+    def register_lazy(cls, kind: str, *modules: str) -> None:
+        """Declare the modules providing a kind, to be imported when it is first used."""
+        with cls._lazy_lock:
+            pending = cls._lazy.get(kind, ())
+            pending += tuple(module for module in modules if module not in pending)
+            cls._lazy = {**cls._lazy, kind: pending}
+
+    @classmethod
+    def _load_lazy(cls, kind: str) -> None:
+        if kind not in cls._lazy:
+            return
+        with cls._lazy_lock:
+            modules = cls._lazy.get(kind)
+            if not modules:
+                return
+            # A pipeline registered by the user before the kind was loaded replaced a
+            # built-in on purpose; loading the built-ins late must not undo that.
+            registered = cls._pipelines.get(kind, {})
+            for module in modules:
+                import_module(module)
+            with cls._lock:
+                cls._pipelines = {**cls._pipelines,
+                                  kind: {**cls._pipelines.get(kind, {}), **registered}}
+            cls._lazy = {name: pending for name, pending in cls._lazy.items() if name != kind}
+
+    @classmethod
+    def snapshot(cls, kind: str) -> dict[str, Callable[..., Any]]:
+        """The published pipelines of a kind. Shared and never mutated: do not modify."""
+        cls._load_lazy(kind)
+        return cls._pipelines.get(kind, {})
 
     @classmethod
     def get_pipelines(cls, kind: str) -> dict[str, Callable[..., Any]]:
-        with cls._lock:
-            return dict(cls._pipelines.get(kind, {}))
+        return dict(cls.snapshot(kind))
 
     @classmethod
     @signal(tags=["pipeline"])
     def run(cls, kind: str, rules: list[str | Any], value: Any, ctx: Any) -> Any:
         logger.debug(f"Starting pipelines for kind='{kind}' on argument='{ctx.argname}'")
-        pipelines = cls.get_pipelines(kind)
+        pipelines = cls.snapshot(kind)
         current = value
         
         do_profile = getattr(ctx, "_profiling", False)
+        # Set while `argdigest.allocations()` is measuring: the caller to charge.
+        measured = ((getattr(ctx, "caller", None) or ctx.function_name)
+                    if _allocations.ENABLED else None)
 
         for rule in rules or []:
             fn = None
@@ -45,10 +102,13 @@ class Registry:
                 logger.debug(f"Running rule '{rule_name}' on argument='{ctx.argname}'")
                 
                 start = time.perf_counter() if do_profile else 0
-                current = fn(current, ctx)
+                if measured is None:
+                    current = fn(current, ctx)
+                else:
+                    current = _allocations.call(rule_name, measured, current, fn, current, ctx)
                 if do_profile:
                     duration = time.perf_counter() - start
-                    ctx.audit_log.append({"rule": rule_name, "duration": duration})
+                    _audit(ctx, rule_name, duration)
                 continue
 
             # 2. If it's a Pydantic Model (duck typing)
@@ -57,10 +117,14 @@ class Registry:
                 logger.debug(f"Running Pydantic model '{rule.__name__}' on argument='{ctx.argname}'")
                 try:
                     start = time.perf_counter() if do_profile else 0
-                    current = rule.model_validate(current)
+                    if measured is None:
+                        current = rule.model_validate(current)
+                    else:
+                        current = _allocations.call(rule_name, measured, current,
+                                                    rule.model_validate, current)
                     if do_profile:
                         duration = time.perf_counter() - start
-                        ctx.audit_log.append({"rule": rule_name, "duration": duration})
+                        _audit(ctx, rule_name, duration)
                 except Exception as e:
                     raise ValueError(f"Validation failed for argument '{ctx.argname}' against model {rule.__name__}: {e}") from e
                 continue
@@ -70,10 +134,13 @@ class Registry:
                 rule_name = getattr(rule, "__name__", "anonymous_callable")
                 logger.debug(f"Running callable rule '{rule_name}' on argument='{ctx.argname}'")
                 start = time.perf_counter() if do_profile else 0
-                current = rule(current, ctx)
+                if measured is None:
+                    current = rule(current, ctx)
+                else:
+                    current = _allocations.call(rule_name, measured, current, rule, current, ctx)
                 if do_profile:
                     duration = time.perf_counter() - start
-                    ctx.audit_log.append({"rule": rule_name, "duration": duration})
+                    _audit(ctx, rule_name, duration)
                 continue
             
             logger.warning(f"Unknown rule type {type(rule)} for argument='{ctx.argname}'. Skipping.")
@@ -0,0 +1,171 @@
+"""Latency budgets and the slow-call log.
+
+A function with a ``latency_budget`` has the digestion part of every call timed -- binding
+through pipelines, not its body. A call that takes longer than the budget is recorded in
+a bounded log, `argdigest.slow_calls()`, with its caller, the time of each stage, the type
+(and shape or length) of every argument and the thread, and reported through the
+``ARG-WARN-SLOW-001`` catalog event. Events are rate limited per caller: at most one every
+`EMIT_INTERVAL` seconds, carrying how many slow calls were left unreported since the
+previous one. The log and the ``slow_calls`` counter of `argdigest.stats()` see them all.
+
+A budget is a number of seconds for every function it applies to, or a mapping from
+callers to seconds. Keys are exact callers or `fnmatch` patterns; the most specific
+match wins, as with ``caller_pattern`` in function contracts.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Any
+
+from . import emission as _emission
+from . import metrics as _metrics
+from .caches import register_lru
+from .._private.smonitor.emitter import ensure_configured
+
+#: Slow calls kept before the oldest are dropped.
+CAPACITY = 256
+
+#: Seconds between two catalog events about the same caller.
+EMIT_INTERVAL = 60.0
+
+_lock = threading.Lock()
+_LOG: deque[dict[str, Any]] = deque(maxlen=CAPACITY)
+# caller -> (monotonic time of the last event, slow calls not reported since).
+_EMITTED: dict[str, tuple[float, int]] = {}
+
+
+def normalize_budget(value: Any) -> "float | tuple[tuple[str, float], ...] | None":
+    """Validate a ``latency_budget`` option into the form plans hold.
+
+    A mapping, or the pairs `DigestConfig` keeps of one, becomes a tuple of
+    ``(pattern, seconds)`` pairs, most specific first: patterns without wildcards, then
+    longer ones.
+    """
+
+    if value is None:
+        return None
+    if isinstance(value, (Mapping, tuple, list)):
+        pairs = value.items() if isinstance(value, Mapping) else value
+        budgets = []
+        for pattern, seconds in pairs:
+            if not isinstance(pattern, str):
+                raise ValueError("latency_budget keys must be caller names or patterns")
+            budgets.append((pattern, _seconds(seconds)))
+        budgets.sort(key=lambda item: (any(c in item[0] for c in "*?["), -len(item[0])))
+        return tuple(budgets)
+    return _seconds(value)
+
+
+def _seconds(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ValueError("latency_budget must be a positive number of seconds, a mapping "
+                         "of callers to one, or None")
+    return float(value)
+
+
+@lru_cache(maxsize=1024)
+def budget_for(budget: "float | tuple[tuple[str, float], ...]", caller: str) -> float | None:
+    """The budget of `caller` under a normalized ``latency_budget``."""
+
+    if isinstance(budget, float):
+        return budget
+    for pattern, seconds in budget:
+        if fnmatchcase(caller, pattern):
+            return seconds
+    return None
+
+
+register_lru("slowlog.budget_for", budget_for)
+
+
+def _describe(value: Any) -> dict[str, Any]:
+    description: dict[str, Any] = {"type": type(value).__qualname__}
+    shape = getattr(value, "shape", None)
+    if isinstance(shape, tuple):
+        description["shape"] = shape
+    elif isinstance(value, (list, tuple, dict, set, frozenset)):
+        description["len"] = len(value)
+    return description
+
+
+def check(budget: "float | tuple[tuple[str, float], ...]", timer: Any,
+          arguments: Mapping[str, Any]) -> None:
+    """Log the call timed by `timer` if its digestion so far exceeds the budget."""
+
+    caller = timer.caller
+    if caller is None:
+        return
+    elapsed = timer.last - timer.start
+    limit = budget_for(budget, caller)
+    if limit is None or elapsed <= limit:
+        return
+
+    entry = {
+        "caller": caller,
+        "elapsed": elapsed,
+        "budget": limit,
+        "stages": dict(timer.stages),
+        "arguments": {name: _describe(value) for name, value in arguments.items()},
+        "thread": threading.current_thread().name,
+        "time": time.time(),
+    }
+    _metrics.count("slow_calls", caller)
+    now = time.monotonic()
+    with _lock:
+        _LOG.append(entry)
+        last, suppressed = _EMITTED.get(caller, (None, 0))
+        if last is not None and now - last < EMIT_INTERVAL:
+            _EMITTED[caller] = (last, suppressed + 1)
+            return
+        _EMITTED[caller] = (now, 0)
+    _emit(entry, suppressed)
+
+
+def _emit(entry: dict[str, Any], suppressed: int) -> None:
+    # Queued: the event is reported by the emission thread, not inside the slow call.
+    _emission.submit(_emit_event, {
+        "caller": entry["caller"],
+        "elapsed_ms": round(entry["elapsed"] * 1e3, 3),
+        "budget_ms": round(entry["budget"] * 1e3, 3),
+        "slowest_stage": max(entry["stages"], key=entry["stages"].get, default="-"),
+        "suppressed": suppressed,
+    })
+
+
+def _emit_event(extra: dict[str, Any]) -> None:
+    from smonitor.integrations import emit_from_catalog, merge_extra
+    from .._private.smonitor import CATALOG, PACKAGE_ROOT, META
+
+    ensure_configured()
+    emit_from_catalog(
+        CATALOG["warnings"]["SlowCallWarning"],
+        package_root=PACKAGE_ROOT,
+        extra=merge_extra(META, extra),
+    )
+
+
+def slow_calls(caller: str | None = None) -> list[dict[str, Any]]:
+    """The slow calls logged so far, oldest first, optionally of one caller only."""
+
+    with _lock:
+        entries = list(_LOG)
+    if caller is not None:
+        entries = [entry for entry in entries if entry["caller"] == caller]
+    return entries
+
+
+def reset() -> None:
+    """Forget the logged calls and the rate limits."""
+
+    with _lock:
+        _LOG.clear()
+        _EMITTED.clear()
+
+
+slow_calls.reset = reset  # type: ignore[attr-defined]
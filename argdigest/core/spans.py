@@ -0,0 +1,224 @@
+"""Structured spans for the stages of decorated calls.
+
+With a sink installed (`set_sink`), every decorated call produces a tree of spans:
+
+    argdigest.call
+      argdigest.bind, argdigest.normalization, argdigest.standardizer, argdigest.contract
+      argdigest.digestion
+        argdigest.digester            one per argument digested
+      argdigest.pipelines
+        argdigest.rule                one per pipeline rule
+      argdigest.body                  decorated calls made by the body nest under it
+
+Each span has start and end timestamps in Unix nanoseconds, the caller and argument
+names, and, on failure, an ``ERROR`` status with the catalog code of the error. The
+shape follows OpenTelemetry's -- trace id, span id, parent id, attributes, status -- so a
+sink can forward spans to it, but nothing here requires it.
+
+All spans of a call share a trace id: the request id of `request()` when one is active,
+a fresh one per outermost call otherwise. Without a sink, a call reads one module
+attribute.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .metrics import STAGES
+
+SINK: "Callable[[Span], None] | None" = None
+
+# Stage -> the stage in progress once it is closed.
+_NEXT = dict(zip(STAGES, STAGES[1:] + ("body",)))
+
+_request_id: ContextVar[str | None] = ContextVar("argdigest_request_id", default=None)
+_active: ContextVar["Recorder | None"] = ContextVar("argdigest_active_span", default=None)
+_ids = itertools.count(1)
+
+
+def _new_id() -> str:
+    return f"{next(_ids):016x}"
+
+
+@dataclass
+class Span:
+    """One timed stage of a decorated call."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "OK"
+
+    @property
+    def duration(self) -> float:
+        """Seconds."""
+
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        """The span as plain data, with OpenTelemetry's field names."""
+
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "attributes": dict(self.attributes),
+            "status": self.status,
+        }
+
+
+class ListSink:
+    """Keeps every span in `spans`."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+class JsonlSink:
+    """Appends every span to a file, one JSON object per line."""
+
+    def __init__(self, path: str | Path) -> None:
+        import json
+
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._dumps = json.dumps
+
+    def __call__(self, span: Span) -> None:
+        line = self._dumps(span.to_dict(), default=repr)
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+
+def set_sink(sink: Callable[[Span], None] | None) -> None:
+    """Deliver spans to `sink`: a `ListSink`, a `JsonlSink`, or any callable taking a
+    `Span`. None stops producing them."""
+
+    global SINK
+    SINK = sink
+
+
+@contextmanager
+def sink(target: Callable[[Span], None]) -> Iterator[Callable[[Span], None]]:
+    """Deliver spans to `target` for the duration of the block."""
+
+    previous = SINK
+    set_sink(target)
+    try:
+        yield target
+    finally:
+        set_sink(previous)
+
+
+def _trace_id() -> str:
+    # 128 random bits, as a uuid4 has, without importing `uuid` (and `platform`).
+    return os.urandom(16).hex()
+
+
+@contextmanager
+def request(request_id: str | None = None) -> Iterator[str]:
+    """Correlate every span produced in the block under one trace id."""
+
+    value = request_id or _trace_id()
+    token = _request_id.set(value)
+    try:
+        yield value
+    finally:
+        _request_id.reset(token)
+
+
+def current_request_id() -> str | None:
+    return _request_id.get()
+
+
+class Recorder:
+    """Produces the spans of one decorated call, marked at the end of each stage."""
+
+    __slots__ = ("sink", "trace_id", "call_id", "parent_id", "start_ns", "last_ns",
+                 "stage_id", "pending", "caller", "token")
+
+    def __init__(self, target: Callable[[Span], None]) -> None:
+        self.sink = target
+        outer = _active.get()
+        if outer is not None:
+            self.trace_id = outer.trace_id
+            self.parent_id: str | None = outer.stage_id
+        else:
+            self.trace_id = _request_id.get() or _trace_id()
+            self.parent_id = None
+        self.call_id = _new_id()
+        # The id of the stage in progress, so the spans inside it can point at it before
+        # it is emitted.
+        self.stage_id = _new_id()
+        self.pending = STAGES[0]
+        self.start_ns = self.last_ns = time.time_ns()
+        self.caller: str | None = None
+        self.token = _active.set(self)
+
+    def _emit(self, name: str, span_id: str, parent_id: str | None, start_ns: int,
+              end_ns: int, attributes: dict[str, Any], status: str = "OK") -> None:
+        attributes["caller"] = self.caller
+        try:
+            self.sink(Span(name, self.trace_id, span_id, parent_id, start_ns, end_ns,
+                           attributes, status))
+        except Exception:
+            # A failing sink must not fail the call it observes.
+            pass
+
+    def mark(self, stage: str, **attributes: Any) -> None:
+        """Close `stage` as a span running from the previous mark until now."""
+
+        now = time.time_ns()
+        self._emit(f"argdigest.{stage}", self.stage_id, self.call_id, self.last_ns, now,
+                   attributes)
+        self.stage_id = _new_id()
+        self.pending = _NEXT[stage]
+        self.last_ns = now
+
+    def child(self, name: str, start_ns: int, end_ns: int, status: str = "OK",
+              **attributes: Any) -> None:
+        """A span inside the stage in progress: a digester, a rule."""
+
+        self._emit(f"argdigest.{name}", _new_id(), self.stage_id, start_ns, end_ns,
+                   attributes, status)
+
+    def rule(self, name: str, seconds: float, argname: str | None = None) -> None:
+        end = time.time_ns()
+        self.child("rule", end - int(seconds * 1e9), end, rule=name, argname=argname)
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Close the stage in progress -- the one that failed, on error -- and the call."""
+
+        _active.reset(self.token)
+        now = time.time_ns()
+        status = "OK"
+        attributes: dict[str, Any] = {}
+        if error is not None:
+            status = "ERROR"
+            code = getattr(error, "code", None)
+            attributes = {"error.type": type(error).__name__,
+                          "error.code": code if isinstance(code, str) else None}
+        self._emit(f"argdigest.{self.pending}", self.stage_id, self.call_id, self.last_ns,
+                   now, dict(attributes), status)
+        self._emit("argdigest.call", self.call_id, self.parent_id, self.start_ns, now,
+                   attributes, status)
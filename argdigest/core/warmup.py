@@ -0,0 +1,83 @@
+"""Building ahead of time what decorated calls would otherwise build on first use.
+
+A plan is built when its function is decorated, but part of what a call needs is only
+filled in by the first call: the contract and the alias tables resolved for its caller,
+the membership set of an enumerable domain, the adapters of digesters, the modules of a
+pipeline kind. In a server that forks workers, each worker pays for them again on its
+first requests, and writes them into pages it no longer shares with the parent.
+
+`warmup` fills all of it in the parent. With `freeze=True` it then moves every object
+alive to the permanent generation of the garbage collector, so the collector in a
+forked worker does not touch -- and copy -- the pages holding them.
+"""
+
+from __future__ import annotations
+
+import gc
+from typing import Any, Iterable
+
+from .compiler import _iter_modules
+from .decorator import _digester_adapter, _known_callers, decorated_functions
+from .errors import DigestNotDigestedError
+from .function_contract import default_contract
+from .registry import Registry
+
+
+def warmup(modules: str | Iterable[str] | None = None, freeze: bool = False) -> dict[str, Any]:
+    """Prebuild the per-caller state of every decorated function; return what was built.
+
+    `modules` are imported first, with every submodule, so functions a server would only
+    import lazily are decorated too. Without them, the functions already decorated are
+    warmed. Call it before forking; `freeze=True` also runs `gc.freeze()`.
+    """
+
+    if isinstance(modules, str):
+        modules = (modules,)
+    for module_name in modules or ():
+        _iter_modules(module_name)
+
+    functions = decorated_functions()
+    domains: dict[int, Any] = {}
+    adapters = 0
+    kinds: set[str] = set()
+    for wrapper in functions:
+        plan = wrapper.digestion_plan
+        # `wraps` copied the name, qualified name and module the decorator reports.
+        for caller in _known_callers(wrapper):
+            if plan.contracts is not None and plan.contracts.resolve(caller) is None:
+                default_contract(caller, plan.var_keyword_name is not None)
+            if plan.normalization:
+                plan.normalization.for_caller(caller)
+        for domain in plan.domains.values():
+            if (not domain.is_delegating and domain.contains is None
+                    and not callable(domain.members)):
+                domains.setdefault(id(domain), domain).index()
+        # The function's own parameters, as when the plan was built: the other digesters
+        # of its source are only reached through a standardizer or **kwargs.
+        parameters = plan.signature.parameters if plan.signature is not None else ()
+        for argname in parameters if plan.enable_argument_digestion else ():
+            fn_digest = plan.digesters.get(argname)
+            if fn_digest is None or argname == "self" or argname in plan.adapters:
+                continue
+            try:
+                plan.adapters[argname] = _digester_adapter(fn_digest, argname)
+            except (DigestNotDigestedError, TypeError, ValueError):
+                # Ambiguous or without a signature: the call reports it, in context.
+                continue
+            adapters += 1
+        for target in plan.pipeline_targets.values():
+            if target.get("kind"):
+                kinds.add(target["kind"])
+    for kind in sorted(kinds):
+        Registry.snapshot(kind)
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return {
+        "functions": len(functions),
+        "domains": len(domains),
+        "adapters": adapters,
+        "pipeline_kinds": sorted(kinds),
+        "frozen": freeze,
+    }
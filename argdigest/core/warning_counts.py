@@ -0,0 +1,230 @@
+"""Repeated warnings, raised once and counted, behind `argdigest.warning_counts()`.
+
+Under ``strictness="warn"`` an argument without a digester used to build a context and a
+`DigestNotDigestedWarning` and go through the warnings machinery and smonitor on every
+call: in a loop, the same warning millions of times. The same held for
+`FunctionContractWarning` under ``unknown_argument="warn"``.
+
+Each decorated function now warns once per argument -- per contract rule for contract
+warnings -- and only counts later occurrences. With `REPEAT_INTERVAL` set to a number of
+seconds, the warning is raised again at most that often, saying how many occurrences it
+stands for. The counts are kept in the plan of each function, so two functions sharing a
+name do not silence each other, and `warning_counts()` reports them all.
+
+Counting takes no lock: each thread counts in a table of its own, and the tables are
+added up when read. A plan's lock is only taken to decide whether to raise -- once, or
+once per interval -- and by a thread counting for the first time. The occurrences of
+missing digesters are the ``missing_digesters`` counter of `argdigest.stats()`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from . import metrics as _metrics
+
+#: Seconds before a warning already raised is raised again; None for never.
+REPEAT_INTERVAL: float | None = None
+
+# Attaches the counts to a plan that had none.
+_lock = threading.Lock()
+
+
+class PlanWarnings:
+    """The occurrences of the deduplicated warnings of one plan.
+
+    Keys are ``(warning, caller, argname)``. The counts only grow; a reset moves a
+    baseline instead, one for `warning_counts` and one for the statistics, so each can
+    be reset without the other.
+    """
+
+    __slots__ = ("_lock", "_local", "_tables", "_retired", "_raised", "_reported",
+                 "_counted")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # (thread, its table) for every thread that counted, until it ends.
+        self._tables: list[tuple[threading.Thread, dict[tuple[str, str, str], int]]] = []
+        # What the threads that ended had counted.
+        self._retired: Counter[tuple[str, str, str]] = Counter()
+        # key -> [times raised, monotonic time last raised, occurrences then].
+        self._raised: dict[tuple[str, str, str], list[Any]] = {}
+        # Occurrences when `warning_counts` and the statistics were last reset.
+        self._reported: dict[tuple[str, str, str], int] = {}
+        self._counted: dict[tuple[str, str, str], int] = {}
+
+    def __reduce__(self) -> Any:
+        # Counts are the process's own: a plan pickled by value starts from none.
+        return (PlanWarnings, ())
+
+    def occurrence(self, warning: str, caller: str, argname: str) -> int | None:
+        """Count one occurrence of a warning.
+
+        Returns None when the warning was raised recently enough to stay silent, otherwise
+        how many occurrences went unreported since it last was.
+        """
+
+        key = (warning, caller, argname)
+        table = getattr(self._local, "table", None)
+        if table is None:
+            table = self._register()
+        table[key] = table.get(key, 0) + 1
+        state = self._raised.get(key)
+        if state is not None and (REPEAT_INTERVAL is None
+                                  or time.monotonic() - state[1] < REPEAT_INTERVAL):
+            return None
+        with self._lock:
+            state = self._raised.get(key)
+            now = time.monotonic()
+            total = self._total(key)
+            if state is None:
+                self._raised[key] = [1, now, total]
+                return total - self._reported.get(key, 0) - 1
+            if REPEAT_INTERVAL is None or now - state[1] < REPEAT_INTERVAL:
+                return None
+            suppressed = total - state[2] - 1
+            state[0] += 1
+            state[1] = now
+            state[2] = total
+            return suppressed
+
+    def _register(self) -> dict[tuple[str, str, str], int]:
+        table: dict[tuple[str, str, str], int] = {}
+        with self._lock:
+            # A thread pool replacing its threads must not grow the list forever.
+            alive = []
+            for thread, counts in self._tables:
+                if thread.is_alive():
+                    alive.append((thread, counts))
+                else:
+                    self._retired.update(counts)
+            alive.append((threading.current_thread(), table))
+            self._tables = alive
+        self._local.table = table
+        return table
+
+    def _total(self, key: tuple[str, str, str]) -> int:
+        return self._retired.get(key, 0) + sum(counts.get(key, 0) for _, counts in self._tables)
+
+    def totals(self) -> Counter[tuple[str, str, str]]:
+        """Occurrences per key, across threads."""
+
+        totals = Counter(self._retired)
+        for _, counts in list(self._tables):
+            totals.update(counts.copy())
+        return totals
+
+    def rows(self) -> list[tuple[tuple[str, str, str], int, int]]:
+        """``(key, occurrences, times raised)`` since `warning_counts` was last reset."""
+
+        with self._lock:
+            totals = self.totals()
+            rows = []
+            for key, total in totals.items():
+                occurrences = total - self._reported.get(key, 0)
+                if occurrences:
+                    state = self._raised.get(key)
+                    rows.append((key, occurrences, state[0] if state else 0))
+            return rows
+
+    def reset(self) -> None:
+        """Forget the occurrences: each warning is raised again on its next one."""
+
+        with self._lock:
+            self._reported = dict(self.totals())
+            self._raised.clear()
+
+    def counted(self, warning: str) -> Counter[str]:
+        """Occurrences of `warning` per caller since the statistics were last reset."""
+
+        with self._lock:
+            by_caller: Counter[str] = Counter()
+            for key, total in self.totals().items():
+                if key[0] == warning:
+                    by_caller[key[1]] += total - self._counted.get(key, 0)
+            return +by_caller
+
+    def reset_counted(self) -> None:
+        with self._lock:
+            self._counted = dict(self.totals())
+
+
+def plan_warnings(plan: Any) -> PlanWarnings:
+    """The counts of `plan`, attached on its first warning."""
+
+    counts = plan.warning_counts
+    if counts is None:
+        with _lock:
+            counts = plan.warning_counts
+            if counts is None:
+                counts = plan.warning_counts = PlanWarnings()
+    return counts
+
+
+def occurrence(plan: Any, warning: str, caller: str, argname: str) -> int | None:
+    """Count one occurrence of a warning of `plan`; see `PlanWarnings.occurrence`."""
+
+    return plan_warnings(plan).occurrence(warning, caller, argname)
+
+
+def repeated(message: str, suppressed: int) -> str:
+    """`message`, saying how many occurrences a repeated warning stands for."""
+
+    if not suppressed:
+        return message
+    return f"{message} ({suppressed} more occurrences since last reported)"
+
+
+def _counts() -> list[PlanWarnings]:
+    from .decorator import decorated_functions
+
+    plans = (getattr(fn, "digestion_plan", None) for fn in decorated_functions())
+    return [plan.warning_counts for plan in plans
+            if plan is not None and plan.warning_counts is not None]
+
+
+def warning_counts(caller: str | None = None) -> list[dict[str, Any]]:
+    """How often each deduplicated warning occurred, most frequent first.
+
+    One row per warning, caller and argument (or contract rule): the ``occurrences``, and
+    how many times it was actually ``raised``.
+    """
+
+    rows = [
+        {"warning": warning, "caller": key_caller, "argname": argname,
+         "occurrences": occurrences, "raised": raised}
+        for counts in _counts()
+        for (warning, key_caller, argname), occurrences, raised in counts.rows()
+        if caller is None or key_caller == caller
+    ]
+    rows.sort(key=lambda row: row["occurrences"], reverse=True)
+    return rows
+
+
+def reset() -> None:
+    """Forget every count: each warning is raised again on its next occurrence."""
+
+    for counts in _counts():
+        counts.reset()
+
+
+def _missing_digesters() -> dict[tuple[str, str], int]:
+    totals: Counter[tuple[str, str]] = Counter()
+    for counts in _counts():
+        for caller, occurrences in counts.counted("DigestNotDigestedWarning").items():
+            totals[("missing_digesters", caller)] += occurrences
+    return totals
+
+
+def _reset_missing_digesters() -> None:
+    for counts in _counts():
+        counts.reset_counted()
+
+
+_metrics.register_collector(_missing_digesters, _reset_missing_digesters)
+
+warning_counts.reset = reset  # type: ignore[attr-defined]
@@ -1 +1,33 @@
-from . import base, coercers, validators, data, science
+"""Built-in pipelines.
+
+Each kind is registered as a stub naming the modules that provide it; the first lookup of
+the kind imports them. `import argdigest` therefore loads no pipeline module -- and no
+NumPy -- until a decorated call actually runs a rule of that kind.
+"""
+
+from importlib import import_module
+
+from ..core.registry import Registry
+
+#: kind -> submodules whose import registers its pipelines.
+BUILTIN_KINDS = {
+    "feature": ("base",),
+    "std": ("coercers", "validators"),
+    "data": ("data",),
+    "sci": ("science",),
+}
+
+_SUBMODULES = frozenset(module for modules in BUILTIN_KINDS.values() for module in modules)
+
+for _kind, _modules in BUILTIN_KINDS.items():
+    Registry.register_lazy(_kind, *(f"{__name__}.{module}" for module in _modules))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
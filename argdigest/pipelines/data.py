@@ -4,13 +4,14 @@ Pipelines for data science structures (Numpy, Pandas, etc.).
 from __future__ import annotations
 from typing import Any, Callable, Tuple, List
 from ..core.registry import register_pipeline
+from importlib.util import find_spec
 from ..core.errors import DigestTypeError, DigestValueError
+from ..core import copies as _copies
 
-try:
-    import numpy as np
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
+#: NumPy is looked up, not imported: this module is itself only loaded when a ``data``
+#: pipeline is first requested, and even then a pandas-only rule must not pay for NumPy.
+HAS_NUMPY = find_spec('numpy') is not None
+np = None
 
 #: Pandas is heavy -- it pulls a large dependency tree of its own -- and only two
 #: pipelines need it. Importing it here made every consumer pay for it just by decorating
@@ -39,18 +40,34 @@ def _pandas(ctx: Any = None):
 def has_pandas():
     """Whether pandas is available, without importing it."""
 
-    from importlib.util import find_spec
-
     return pd is not None or find_spec('pandas') is not None
 
 
 def _require_numpy(ctx: Any = None):
+    """Return NumPy, importing it on first use, or fail with the usual diagnostic."""
+
+    global np
+
     if not HAS_NUMPY:
         raise DigestTypeError(
             "Optional dependency 'numpy' is not installed. Install it to use data pipelines.",
             context=ctx,
         )
+    if np is None:
+        import numpy
+
+        np = numpy
+    return np
+
+
 
+def _as_array(value: Any, ctx: Any, rule: str) -> Any:
+    """The value as an array, accounted for in `copies` when the call asks for it."""
+
+    arr = value if isinstance(value, np.ndarray) else np.asarray(value)
+    if _copies.watching(ctx):
+        _copies.record(rule, ctx, value, arr)
+    return arr
 
 
 # --- Coercers ---
@@ -60,11 +77,15 @@ def to_numpy(value: Any, ctx: Any = None) -> Any:
     """Coerces input to a numpy array."""
     _require_numpy(ctx)
     if isinstance(value, np.ndarray):
-        return value
-    try:
-        return np.asarray(value)
-    except Exception as e:
-        raise DigestTypeError(f"Cannot convert to numpy array: {e}", context=ctx) from e
+        arr = value
+    else:
+        try:
+            arr = np.asarray(value)
+        except Exception as e:
+            raise DigestTypeError(f"Cannot convert to numpy array: {e}", context=ctx) from e
+    if _copies.watching(ctx):
+        _copies.record("data.to_numpy", ctx, value, arr)
+    return arr
 
 
 @register_pipeline(kind="data", name="to_dataframe")
@@ -84,7 +105,7 @@ def has_ndim(n: int) -> Callable[[Any, Any], Any]:
     """Factory: Validates number of dimensions."""
     def pipeline_ndim(value: Any, ctx: Any) -> Any:
         _require_numpy(ctx)
-        arr = value if isinstance(value, np.ndarray) else np.asarray(value)
+        arr = _as_array(value, ctx, "data.has_ndim")
         if arr.ndim != n:
             raise DigestValueError(f"Expected {n} dimensions, got {arr.ndim}", context=ctx)
         return value
@@ -98,7 +119,7 @@ def is_shape(shape: Tuple[int | None, ...]) -> Callable[[Any, Any], Any]:
     """
     def pipeline_shape(value: Any, ctx: Any) -> Any:
         _require_numpy(ctx)
-        arr = value if isinstance(value, np.ndarray) else np.asarray(value)
+        arr = _as_array(value, ctx, "data.is_shape")
         if len(arr.shape) != len(shape):
              raise DigestValueError(f"Expected ndim={len(shape)}, got {len(arr.shape)}", context=ctx)
         
@@ -113,7 +134,7 @@ def is_dtype(dtype: Any) -> Callable[[Any, Any], Any]:
     """Factory: Validates numpy dtype."""
     def pipeline_dtype(value: Any, ctx: Any) -> Any:
         _require_numpy(ctx)
-        arr = value if isinstance(value, np.ndarray) else np.asarray(value)
+        arr = _as_array(value, ctx, "data.is_dtype")
         target_dtype = np.dtype(dtype)
         if arr.dtype != target_dtype:
             raise DigestTypeError(f"Expected dtype {target_dtype}, got {arr.dtype}", context=ctx)
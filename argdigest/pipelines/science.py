@@ -1,6 +1,7 @@
 from typing import Any, Optional
 import numpy as np
 from ..core.registry import register_pipeline
+from ..core import copies as _copies
 
 @register_pipeline(kind="sci", name="to_quantity_array")
 def to_quantity_array(value: Any, ctx: Any = None, unit: Optional[str] = None, dtype: Any = np.float64) -> Any:
@@ -20,12 +21,18 @@ def to_quantity_array(value: Any, ctx: Any = None, unit: Optional[str] = None, d
             val = get_value(value, to_unit=unit)
         else:
             val = get_value(value)
-        
+
+    # Accounted from the magnitude on: a copy made by `get_value` is pyunitwizard's.
+    magnitude = val
+    watching = _copies.watching(ctx)
     if not isinstance(val, np.ndarray):
         val = np.asarray(val, dtype=dtype)
     elif val.dtype != dtype:
+        if watching:
+            _copies.guard("sci.to_quantity_array", ctx, val.size * np.dtype(dtype).itemsize)
         val = val.astype(dtype)
-        
+    if watching:
+        _copies.record("sci.to_quantity_array", ctx, magnitude, val)
     return val
 
 @register_pipeline(kind="sci", name="to_float64_array")
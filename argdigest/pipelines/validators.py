@@ -7,14 +7,14 @@ from ..core.errors import DigestValueError, DigestTypeError
 def is_positive(value: Any, ctx: Any = None) -> Any:
     """Validates that value is > 0."""
     if not (value > 0):
-        raise DigestValueError(f"Value must be positive, got {value}", context=ctx)
+        raise DigestValueError(lambda: f"Value must be positive, got {value}", context=ctx)
     return value
 
 @register_pipeline(kind="std", name="is_non_negative")
 def is_non_negative(value: Any, ctx: Any = None) -> Any:
     """Validates that value is >= 0."""
     if not (value >= 0):
-        raise DigestValueError(f"Value must be non-negative, got {value}", context=ctx)
+        raise DigestValueError(lambda: f"Value must be non-negative, got {value}", context=ctx)
     return value
 
 @register_pipeline(kind="std", name="is_file")
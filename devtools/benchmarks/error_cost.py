@@ -0,0 +1,70 @@
+"""Cost of raising and catching an ArgDigest error, against a plain exception.
+
+    python devtools/benchmarks/error_cost.py --iterations 20000
+    python devtools/benchmarks/error_cost.py --budget 10e-6
+
+Code that tries candidate inputs and catches ArgDigest errors pays for every error it
+discards, so constructing one must not resolve its catalog entry. The report gives the
+best of `--repeat` runs per raise and catch, for a `DigestValueError` with a context and
+for a `ValueError`. With `--budget`, the script exits with status 1 when the ArgDigest
+error costs more than that many seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from argdigest.core.context import Context
+from argdigest.core.errors import DigestValueError
+
+
+def _best(make, iterations: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            try:
+                raise make()
+            except Exception:
+                pass
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+def measure(iterations: int, repeat: int) -> dict:
+    """Seconds per raise and catch, best of `repeat` runs."""
+
+    ctx = Context(function_name="f", argname="x", value=-1, all_args={})
+    return {
+        "python": sys.version.split()[0],
+        "digest_error": _best(lambda: DigestValueError("Value must be positive", context=ctx),
+                              iterations, repeat),
+        "plain_error": _best(lambda: ValueError("Value must be positive"), iterations, repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Fail when a DigestValueError costs more seconds than this")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = measure(args.iterations, args.repeat)
+    if args.json:
+        print(json.dumps(report))
+    else:
+        print(f"Python {report['python']}")
+        print(f"DigestValueError {report['digest_error'] * 1e6:8.2f} us")
+        print(f"ValueError       {report['plain_error'] * 1e6:8.2f} us")
+    if args.budget is not None and report["digest_error"] > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Throughput of digested calls as the number of threads grows.
+
+    python devtools/benchmarks/thread_scaling.py --threads 1 2 4 8 16 --calls 20000
+    python devtools/benchmarks/thread_scaling.py --interpreters python3.13 python3.13t
+
+Each thread makes `--calls` calls to a function with three digested arguments, one of
+them depending on another's digested value. The report gives calls per second and the
+scaling efficiency, throughput(N) / (N * throughput(1)).
+
+On a regular build the GIL serializes Python code, so throughput stays roughly flat and
+the efficiency falls as 1/N; what the benchmark guards there is that it does not *drop*,
+which is what lock contention on the call path looks like. On a free-threaded build
+(`python3.13t`) throughput should grow with the thread count. `--interpreters` runs the
+same measurement under each interpreter given and prints the results side by side.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+
+from argdigest import arg_digest, argument_digest
+
+
+@argument_digest("count")
+def digest_count(count, caller=None):
+    return int(count)
+
+
+@argument_digest("scale")
+def digest_scale(scale, caller=None):
+    return float(scale)
+
+
+@argument_digest("total")
+def digest_total(total, count, scale, caller=None):
+    return total if total is not None else count * scale
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def measure(count, scale=1.0, total=None):
+    return total
+
+
+def _run(threads: int, calls: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for index in range(calls):
+            measure(index, scale="2")
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+def measure_scaling(threads: list[int], calls: int) -> dict:
+    """Throughput and efficiency per thread count, in this interpreter."""
+
+    _run(1, min(calls, 1000))  # warm up caches and adapters
+    rows = []
+    baseline = None
+    for count in threads:
+        throughput = _run(count, calls)
+        if baseline is None:
+            baseline = throughput / count
+        rows.append({"threads": count, "calls_per_second": throughput,
+                     "efficiency": throughput / (count * baseline)})
+    return {
+        "python": sys.version.split()[0],
+        "build": "GIL" if getattr(sys, "_is_gil_enabled", lambda: True)() else "free-threaded",
+        "rows": rows,
+    }
+
+
+def _print(report: dict) -> None:
+    print(f"Python {report['python']} ({report['build']})")
+    print(f"{'threads':>8} {'calls/s':>12} {'efficiency':>11}")
+    for row in report["rows"]:
+        print(f"{row['threads']:>8} {row['calls_per_second']:>12.0f} {row['efficiency']:>10.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--interpreters", nargs="+", default=None,
+                        help="Run under each of these interpreters instead of this one")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if not args.interpreters:
+        report = measure_scaling(args.threads, args.calls)
+        if args.json:
+            print(json.dumps(report))
+        else:
+            _print(report)
+        return
+
+    for interpreter in args.interpreters:
+        command = [interpreter, __file__, "--json", "--calls", str(args.calls),
+                   "--threads", *map(str, args.threads)]
+        proc = subprocess.run(command, capture_output=True, text=True)
+        if proc.returncode:
+            print(f"{interpreter}: failed\n{proc.stderr.strip()}")
+        else:
+            _print(json.loads(proc.stdout.strip().splitlines()[-1]))
+        print()
+
+
+if __name__ == "__main__":
+    main()
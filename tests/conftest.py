@@ -11,3 +11,35 @@ def _clear_argument_registry():
     yield
     ArgumentRegistry.clear()
     set_defaults(DigestConfig())
+
+
+@pytest.fixture(params=["discovered", "compiled"])
+def plan_mode(request, monkeypatch):
+    """Run a test with plans from discovery, and again with plans from compiled entries.
+
+    In compiled mode every plan that can be compiled is described as `argdigest compile`
+    would, and built a second time from that entry: both modes must behave the same.
+    """
+
+    if request.param == "compiled":
+        from argdigest.core import compiler, decorator
+
+        build = decorator._build_plan
+
+        def build_from_entry(fn, options):
+            plan = build(fn, options)
+            try:
+                entry = compiler.describe_plan(plan)
+            except compiler.NotReferenceable:
+                return plan
+            root = plan.qualified_name.split(".", 1)[0]
+            monkeypatch.setitem(compiler._COMPILED, root,
+                                {**(compiler._COMPILED.get(root) or {}),
+                                 plan.qualified_name: entry})
+            compiled = build(fn, options)
+            assert compiled.compiled, plan.qualified_name
+            return compiled
+
+        monkeypatch.setenv("ARGDIGEST_COMPILED", "1")
+        monkeypatch.setattr(decorator, "_build_plan", build_from_entry)
+    return request.param
@@ -82,6 +82,8 @@ def test_collective_error_path_emits_contract_signal_and_dependency_hints():
 
         with pytest.raises(argdigest.DigestValueError):
             _accept_distance(wrong_distance)
+        # Failure events are emitted by the background queue.
+        importlib.import_module("argdigest.core.emission").flush()
 
         recent = manager.recent_events()[start:]
         assert any((event.get("code") or "").startswith(("ARG-", "PUW-")) for event in recent)
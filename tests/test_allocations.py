@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+import argdigest
+from argdigest import arg_digest, argument_digest, register_pipeline
+
+
+@register_pipeline(kind="alloc", name="wasteful_check")
+def _wasteful_check(value, ctx):
+    scratch = bytearray(64 * 1024)
+    assert len(scratch) > len(value)
+    return value
+
+
+@register_pipeline(kind="alloc", name="to_list")
+def _to_list(value, ctx):
+    return [float(item) for item in value] * 100
+
+
+@argument_digest("alloc_items")
+def digest_alloc_items(alloc_items, caller=None):
+    return tuple(alloc_items)
+
+
+@arg_digest.map(alloc_items={"kind": "alloc", "rules": ["wasteful_check", "to_list"]})
+def _measured(alloc_items):
+    return alloc_items
+
+
+@pytest.fixture
+def measuring():
+    argdigest.allocations.reset()
+    argdigest.allocations.enable()
+    yield
+    argdigest.allocations.disable()
+    argdigest.allocations.reset()
+
+
+def test_rules_and_digesters_are_charged_per_rule_and_caller(measuring):
+    _measured([1, 2, 3])
+
+    report = argdigest.allocations()
+    rules = report["rules"]
+    assert rules["alloc.wasteful_check"]["calls"] == 1
+    assert rules["alloc.wasteful_check"]["peak"] >= 64 * 1024
+    assert rules["alloc.wasteful_check"]["flagged"] == 1
+    assert rules["alloc.to_list"]["net"] > 0
+    assert rules["alloc.to_list"]["flagged"] == 0
+    assert "digest_alloc_items" in rules
+    assert report["callers"][f"{__name__}._measured"]["calls"] == 3
+
+
+def test_nothing_is_measured_while_disabled():
+    argdigest.allocations.reset()
+    _measured([1])
+    assert argdigest.allocations()["rules"] == {}
+
+
+def test_tracing_started_elsewhere_is_left_running():
+    tracemalloc.start()
+    try:
+        argdigest.allocations.enable()
+        argdigest.allocations.disable()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
@@ -19,6 +19,7 @@ EXPECTED_PUBLIC_API = [
     "DigestError",
     "DigestTypeError",
     "DigestValueError",
+    "DigestCopyError",
     "DigestInvariantError",
     "DigestNotDigestedError",
     "DigestNotDigestedWarning",
@@ -33,6 +34,15 @@ EXPECTED_PUBLIC_API = [
     "AliasTable",
     "describe_normalization",
     "StandardizerContractError",
+    "cache_clear",
+    "cache_info",
+    "warmup",
+    "stats",
+    "nested_calls",
+    "slow_calls",
+    "allocations",
+    "copies",
+    "warning_counts",
 ]
 
 
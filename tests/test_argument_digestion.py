@@ -9,6 +9,8 @@ from argdigest import (
 )
 from argdigest.core.config import DigestConfig, set_defaults
 
+pytestmark = pytest.mark.usefixtures("plan_mode")
+
 
 def test_argument_digest_basic():
     @argument_digest("a")
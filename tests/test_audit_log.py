@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from argdigest import arg_digest, register_pipeline
+from argdigest.core.audit import RuleTimings
+
+
+@register_pipeline(kind="audited", name="inc")
+def _inc(value, ctx):
+    return value + 1
+
+
+def test_concurrent_profiled_calls_all_reach_the_log():
+    @arg_digest.map(profiling=True, val={"kind": "audited", "rules": ["inc"]})
+    def audited(val):
+        return val
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(audited, range(400)))
+
+    assert results == list(range(1, 401))
+    log = audited.audit_log
+    assert isinstance(log, RuleTimings)
+    assert len(log) == 400
+    assert log.by_rule()["audited.inc"]["count"] == 400
+    assert log.by_caller()[f"{__name__}.audited"]["count"] == 400
+    entry = log[0]
+    assert entry["rule"] == "audited.inc"
+    assert entry["argname"] == "val"
+    assert entry["duration"] >= 0.0
+
+
+def test_the_ring_keeps_the_most_recent_records():
+    log = RuleTimings(capacity=3)
+    for index in range(5):
+        log.record(f"kind.r{index}", "pkg.f", "x", float(index))
+
+    assert len(log) == 3
+    assert log.dropped == 2
+    assert [entry["rule"] for entry in log] == ["kind.r2", "kind.r3", "kind.r4"]
+    assert log[-1]["duration"] == 4.0
+    with pytest.raises(IndexError):
+        log[3]
+    assert log.by_rule()["kind.r4"] == {"count": 1, "total": 4.0, "max": 4.0}
+
+    log.clear()
+    assert len(log) == 0 and log.dropped == 0
+
+
+def test_the_log_survives_pickling():
+    log = RuleTimings(capacity=4)
+    log.record("kind.r", "pkg.f", "x", 0.5)
+
+    restored = pickle.loads(pickle.dumps(log))
+    restored.record("kind.r", "pkg.f", "x", 0.25)
+    assert [entry["duration"] for entry in restored] == [0.5, 0.25]
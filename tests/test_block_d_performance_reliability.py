@@ -96,6 +96,89 @@ def test_import_time_is_lightweight_and_does_not_load_optional_stacks():
     assert payload["pyunitwizard_loaded"] is False
 
 
+def test_import_startup_budget_defers_pipelines_and_numpy():
+    snippet = (
+        "import json, sys, time;"
+        "t=time.perf_counter();"
+        "import argdigest;"
+        "elapsed=time.perf_counter()-t;"
+        "print(json.dumps({"
+        "'elapsed': elapsed,"
+        "'loaded': sorted(m for m in ('numpy', 'argdigest.pipelines.base',"
+        " 'argdigest.pipelines.coercers', 'argdigest.pipelines.validators',"
+        " 'argdigest.pipelines.data', 'argdigest.pipelines.science') if m in sys.modules)"
+        "}))"
+    )
+    timings = []
+    for _ in range(3):
+        proc = subprocess.run(
+            [sys.executable, "-c", snippet],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        payload = json.loads(proc.stdout.strip().splitlines()[-1])
+        assert payload["loaded"] == []
+        timings.append(payload["elapsed"])
+
+    # Best of three, so a busy CI worker does not fail the budget on one slow start.
+    assert min(timings) < 0.5
+
+
+def test_import_leaves_telemetry_unloaded_until_first_used():
+    telemetry = ("argdigest.core.slowlog", "argdigest.core.emission",
+                 "argdigest.core.warning_counts", "argdigest.core.copies",
+                 "argdigest.core.exporters", "argdigest.core.flamegraph",
+                 "argdigest.core.monitoring", "argdigest.core.warmup",
+                 "tracemalloc", "uuid", "json", "pickle", "hashlib", "pprint")
+    # No json here: it is one of the modules watched.
+    snippet = (
+        "import sys;"
+        "import argdigest;"
+        f"print([m for m in {telemetry!r} if m in sys.modules]);"
+        "argdigest.slow_calls;"
+        "print('argdigest.core.slowlog' in sys.modules)"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", snippet],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded, first_use = proc.stdout.strip().splitlines()[-2:]
+
+    assert loaded == "[]"
+    assert first_use == "True"
+
+
+def test_pipeline_kind_loads_on_first_use_and_keeps_user_overrides(tmp_path, monkeypatch):
+    kind = f"lazy_kind_{uuid.uuid4().hex}"
+    module = f"lazy_pipelines_{uuid.uuid4().hex}"
+    (tmp_path / f"{module}.py").write_text(
+        "from argdigest import register_pipeline\n"
+        f"@register_pipeline({kind!r}, name='double')\n"
+        "def double(value, ctx=None):\n"
+        "    return value * 2\n"
+        f"@register_pipeline({kind!r}, name='shadowed')\n"
+        "def shadowed(value, ctx=None):\n"
+        "    return 'builtin'\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        Registry.register_lazy(kind, module)
+        Registry.register_pipeline(kind, "shadowed", lambda value, ctx=None: "user")
+        assert module not in sys.modules
+
+        pipelines = Registry.get_pipelines(kind)
+        assert module in sys.modules
+        assert pipelines["double"](2) == 4
+        assert pipelines["shadowed"](None) == "user"
+        assert kind not in Registry._lazy
+    finally:
+        sys.modules.pop(module, None)
+
+
 def test_registry_and_digestion_are_read_safe_under_threads():
     kind = f"thread_kind_{uuid.uuid4().hex}"
 
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+import argdigest
+from argdigest import arg_digest, argument_digest
+from argdigest.core import argument_loader, caches
+from argdigest.core import decorator as decorator_mod
+from argdigest.core.argument_registry import ArgumentRegistry
+
+
+def _make_decorated():
+    payload = bytearray(1 << 20)
+
+    @argument_digest("leak_value")
+    def digest_leak_value(leak_value, caller=None):
+        return int(leak_value) + len(payload)
+
+    def scale(leak_value, factor=2):
+        return leak_value * factor
+
+    decorated = arg_digest(digestion_style="decorator", strictness="ignore")(scale)
+    assert decorated("1") == 2 * (1 + len(payload))
+    return weakref.ref(decorated), weakref.ref(digest_leak_value)
+
+
+def test_discarded_decorated_function_and_its_digester_are_collected():
+    decorated_ref, digester_ref = _make_decorated()
+    # The digester stays registered until the registry lets it go, as a notebook does
+    # when it re-runs a cell or a service resets between requests.
+    ArgumentRegistry.clear()
+    gc.collect()
+
+    assert decorated_ref() is None
+    assert digester_ref() is None
+
+
+def test_template_keys_refuse_closures_and_arbitrary_objects():
+    def local_rule(value, ctx):
+        return value
+
+    def f(value):
+        return value
+
+    options = {"map": {"value": {"kind": "std", "rules": [local_rule]}}}
+    assert decorator_mod._template_key(f, options) is None
+    assert decorator_mod._template_key(f, {"token": object()}) is None
+    assert decorator_mod._template_key(f, {"token": 3, "rule": caches.cache_clear}) is not None
+
+
+def test_plan_templates_are_bounded(monkeypatch):
+    monkeypatch.setattr(decorator_mod, "_PLAN_TEMPLATES_MAX", 4)
+    for index in range(10):
+        arg_digest(digestion_style="decorator", strictness="ignore", index=index)(
+            lambda value: value)
+
+    assert len(decorator_mod._PLAN_TEMPLATES) <= 4
+
+
+def test_cache_clear_empties_every_registered_cache():
+    @argument_digest("cleared")
+    def digest_cleared(cleared, caller=None):
+        return cleared
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def f(cleared):
+        return cleared
+
+    assert f(1) == 1
+    argument_loader._load_from_registry("argdigest.core.config")
+    assert digest_cleared in decorator_mod._DIGESTER_METADATA_CACHE
+    assert argument_loader._load_from_registry.cache_info().currsize >= 1
+
+    before = caches.generation()
+    argdigest.cache_clear()
+
+    assert len(decorator_mod._DIGESTER_METADATA_CACHE) == 0
+    assert decorator_mod._PLAN_TEMPLATES == {}
+    assert argument_loader._load_from_registry.cache_info().currsize == 0
+    assert caches.generation() > before
+    assert f(2) == 2
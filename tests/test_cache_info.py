@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+
+import argdigest
+from argdigest import FunctionContract, arg_digest, argument_digest
+from argdigest.core import caches
+from argdigest.core import decorator as decorator_mod
+from argdigest.core.function_contract import ContractRegistry
+
+
+@argument_digest("info_value")
+def digest_info_value(info_value, caller=None):
+    return info_value
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _hot(info_value):
+    return info_value
+
+
+def test_every_registered_cache_is_listed_with_its_kind():
+    # Telemetry modules load, and register their caches, on first use.
+    import argdigest.core.slowlog  # noqa: F401
+
+    info = argdigest.cache_info()
+
+    for name in ("decorator.digester_metadata", "decorator.plan_templates",
+                 "compiler.compiled_plans", "function_contract.default_contract",
+                 "function_contract.resolved", "normalization.by_caller",
+                 "config.resolve_config", "slowlog.budget_for"):
+        assert name in info
+    assert all(row["kind"] in caches.KINDS for row in info.values())
+    assert set(argdigest.cache_info("resolution")) == {
+        "function_contract.resolved", "normalization.by_caller"}
+    assert info["decorator.plan_templates"]["maxsize"] == decorator_mod._PLAN_TEMPLATES_MAX
+
+
+def test_a_hot_path_hits_its_caches():
+    _hot.digestion_plan.contracts = ContractRegistry(
+        [FunctionContract(caller=f"{__name__}._hot", admits="signature")])
+    _hot(1)
+    before = argdigest.cache_info("function_contract.resolved")["function_contract.resolved"]
+    _hot(2)
+    _hot(3)
+    after = argdigest.cache_info("function_contract.resolved")["function_contract.resolved"]
+
+    assert after["misses"] == before["misses"]
+    assert after["hits"] >= before["hits"] + 2
+    assert after["size"] >= 1
+
+
+def test_clear_one_kind_keeps_the_others():
+    _hot(1)
+    argdigest.cache_clear("resolution")
+
+    info = argdigest.cache_info()
+    assert info["function_contract.resolved"]["size"] == 0
+    assert info["function_contract.resolved"]["hits"] == 0
+    assert info["normalization.by_caller"]["size"] == 0
+    before = caches.generation()
+    argdigest.cache_clear("function_contract.resolved")
+    assert caches.generation() == before
+
+    argdigest.cache_clear("discovery")
+    assert caches.generation() > before
+    assert decorator_mod._PLAN_TEMPLATES == {}
+
+
+def test_unknown_kinds_are_rejected():
+    with pytest.raises(ValueError):
+        argdigest.cache_clear("nonexistent")
+    with pytest.raises(ValueError):
+        caches.set_maxsize("function_contract.resolved", 10)
+
+
+def test_plan_templates_can_be_resized(monkeypatch):
+    monkeypatch.setattr(decorator_mod, "_PLAN_TEMPLATES_MAX", decorator_mod._PLAN_TEMPLATES_MAX)
+    argdigest.cache_clear("plans")
+    for index in range(6):
+        arg_digest(digestion_style="decorator", strictness="ignore", index=index)(
+            lambda value: value)
+
+    caches.set_maxsize("decorator.plan_templates", 2)
+    info = argdigest.cache_info("decorator.plan_templates")["decorator.plan_templates"]
+    assert (info["size"], info["maxsize"], info["misses"], info["evictions"]) == (2, 2, 6, 4)
+
+
+def test_discovery_bounds_can_be_resized():
+    name = "config.resolve_config"
+    original = argdigest.cache_info(name)[name]["maxsize"]
+    try:
+        caches.set_maxsize(name, 8)
+        assert argdigest.cache_info(name)[name]["maxsize"] == 8
+    finally:
+        caches.set_maxsize(name, original)
@@ -13,6 +13,8 @@ import pytest
 from argdigest import arg_digest, argument_digest
 from argdigest.core.utils import bind_arguments, build_call
 
+pytestmark = pytest.mark.usefixtures("plan_mode")
+
 # --- var-positional ---------------------------------------------------------------
 
 def test_var_positional_survives_a_positional_call():
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from textwrap import dedent
+
+import pytest
+
+from argdigest.cli import main
+from argdigest.core import argument_loader, compiler, decorator
+
+
+def _write_package(root, name="compiledpkg"):
+    pkg_dir = root / name
+    (pkg_dir / "digestion").mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text("", encoding="utf-8")
+    (pkg_dir / "digestion" / "__init__.py").write_text("", encoding="utf-8")
+    (pkg_dir / "digestion" / "count.py").write_text(
+        dedent(
+            """
+            def digest_count(count, caller=None):
+                return int(count)
+            """
+        ),
+        encoding="utf-8",
+    )
+    (pkg_dir / "_argdigest.py").write_text(
+        dedent(
+            f"""
+            DIGESTION_SOURCE = "{name}.digestion"
+            DIGESTION_STYLE = "package"
+            STRICTNESS = "ignore"
+            """
+        ),
+        encoding="utf-8",
+    )
+    (pkg_dir / "api.py").write_text(
+        dedent(
+            """
+            from argdigest import arg_digest
+
+            @arg_digest()
+            def scale(count, factor=2):
+                return count * factor
+
+            class Counter:
+                @arg_digest()
+                def add(self, count):
+                    return count + 1
+            """
+        ),
+        encoding="utf-8",
+    )
+    return pkg_dir
+
+
+def _purge(name):
+    for module in [m for m in sys.modules if m == name or m.startswith(f"{name}.")]:
+        del sys.modules[module]
+    compiler._COMPILED.pop(name, None)
+    argument_loader._load_from_package.cache_clear()
+    compiler.source_contents.cache_clear()
+    importlib.invalidate_caches()
+
+
+def _reimport(name):
+    _purge(name)
+    return importlib.import_module(f"{name}.api")
+
+
+@pytest.fixture
+def compiled_package(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    pkg_dir = _write_package(tmp_path)
+    yield pkg_dir
+    _purge("compiledpkg")
+
+
+def test_compiled_plans_are_picked_up_when_fingerprint_matches(compiled_package):
+    report = compiler.compile_module("compiledpkg")
+    assert report["functions"] == 2
+    assert (compiled_package / "_argdigest_compiled.py").exists()
+
+    api = _reimport("compiledpkg")
+    assert api.scale.digestion_plan.compiled is True
+    assert api.Counter.add.digestion_plan.compiled is True
+    assert api.scale("3") == 6
+    assert api.Counter().add("4") == 5
+
+
+def test_compiled_and_uncompiled_modes_agree(compiled_package, monkeypatch):
+    compiler.compile_module("compiledpkg")
+    compiled_api = _reimport("compiledpkg")
+    compiled_result = compiled_api.scale("5", factor=3)
+
+    monkeypatch.setenv("ARGDIGEST_COMPILED", "0")
+    plain_api = _reimport("compiledpkg")
+    assert plain_api.scale.digestion_plan.compiled is False
+    assert plain_api.scale("5", factor=3) == compiled_result
+    assert (plain_api.scale.digestion_plan.fingerprint
+            == compiled_api.scale.digestion_plan.fingerprint)
+
+
+def test_stale_fingerprint_falls_back_to_discovery(compiled_package):
+    compiler.compile_module("compiledpkg")
+    api_path = compiled_package / "api.py"
+    api_path.write_text(
+        api_path.read_text(encoding="utf-8").replace("factor=2", "factor=2, offset=0"),
+        encoding="utf-8",
+    )
+
+    api = _reimport("compiledpkg")
+    assert api.scale.digestion_plan.compiled is False
+    assert api.scale("3") == 6
+
+
+def test_a_current_entry_is_used_without_fingerprinting(compiled_package, monkeypatch):
+    compiler.compile_module("compiledpkg")
+    compiled = _reimport("compiledpkg").scale.digestion_plan
+
+    def refuse(*args, **kwargs):
+        raise AssertionError("a current compiled entry was fingerprinted")
+
+    monkeypatch.setattr(compiler, "plan_key", refuse)
+    monkeypatch.setattr(decorator, "plan_key", refuse)
+    monkeypatch.setattr(decorator, "get_digester_metadata", refuse)
+    api = _reimport("compiledpkg")
+    plan = api.scale.digestion_plan
+    assert plan.compiled is True
+    assert plan.fingerprint == compiled.fingerprint
+    assert plan.adapters["count"].value_param == "count"
+    assert plan.adapters["count"].takes_caller is True
+    assert api.scale("3") == 6
+
+
+def test_an_entry_of_another_version_falls_back_to_discovery(compiled_package):
+    compiler.compile_module("compiledpkg")
+    path = compiled_package / "_argdigest_compiled.py"
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(
+            repr(compiler._library_version()), repr("0.0.0+elsewhere")),
+        encoding="utf-8",
+    )
+
+    api = _reimport("compiledpkg")
+    assert api.scale.digestion_plan.compiled is False
+    assert api.scale.digestion_plan.fingerprint is not None
+    assert api.scale("3") == 6
+
+
+def test_adding_a_digester_module_makes_the_entry_stale(compiled_package):
+    compiler.compile_module("compiledpkg")
+    (compiled_package / "digestion" / "factor.py").write_text(
+        "def digest_factor(factor, caller=None):\n"
+        "    if factor < 0:\n"
+        "        raise ValueError('negative factor')\n"
+        "    return factor\n",
+        encoding="utf-8",
+    )
+
+    api = _reimport("compiledpkg")
+    assert api.scale.digestion_plan.compiled is False
+    assert "factor" in api.scale.digestion_plan.digesters
+    with pytest.raises(ValueError):
+        api.scale("3", factor=-1)
+
+
+def test_removing_a_digester_module_makes_the_entry_stale(compiled_package):
+    compiler.compile_module("compiledpkg")
+    (compiled_package / "digestion" / "count.py").unlink()
+
+    api = _reimport("compiledpkg")
+    assert api.scale.digestion_plan.compiled is False
+    assert api.scale.digestion_plan.digesters == {}
+    assert api.scale(3) == 6
+
+
+def test_compile_check_reports_stale_file(compiled_package, capsys, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["argdigest", "compile", "--module", "compiledpkg"])
+    main()
+    assert "Compiled 2 functions" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["argdigest", "compile", "--module", "compiledpkg", "--check"])
+    main()
+    assert "is up to date" in capsys.readouterr().out
+
+    (compiled_package / "digestion" / "label.py").write_text(
+        "def digest_label(label, caller=None):\n    return str(label)\n", encoding="utf-8")
+    _purge("compiledpkg")
+    with pytest.raises(SystemExit):
+        main()
+    assert "is stale" in capsys.readouterr().out
+
+
+def test_callable_reference_refuses_closures():
+    def local_digester(value):
+        return value
+
+    with pytest.raises(compiler.NotReferenceable):
+        compiler.callable_reference(local_digester)
+    assert compiler.callable_reference(compiler.resolve_reference) == (
+        "argdigest.core.compiler:resolve_reference")
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import argdigest
+from argdigest import DigestCopyError, arg_digest
+
+
+@pytest.fixture
+def counting():
+    argdigest.copies.reset()
+    argdigest.copies.enable()
+    yield
+    argdigest.copies.disable()
+    argdigest.copies.reset()
+
+
+def _row(rule, argname):
+    return next(row for row in argdigest.copies()
+                if row["rule"] == rule and row["argname"] == argname)
+
+
+def test_conversions_are_counted_as_same_view_or_new(counting):
+    @arg_digest.map(arr={"kind": "data", "rules": ["to_numpy"]})
+    def f(arr):
+        return arr
+
+    f(np.zeros(4))
+    f(memoryview(bytearray(8)))
+    f([1.0, 2.0, 3.0])
+
+    row = _row("data.to_numpy", "arr")
+    assert row["caller"] == f"{__name__}.f"
+    assert (row["same"], row["view"], row["new"]) == (1, 1, 1)
+    assert row["bytes"] == 3 * 8
+
+
+def test_validators_count_the_array_they_build(counting):
+    from argdigest.pipelines.data import has_ndim
+
+    @arg_digest.map(arr={"kind": "data", "rules": [has_ndim(1)]})
+    def f(arr):
+        return arr
+
+    f([1, 2, 3])
+    f(np.arange(3))
+
+    row = _row("data.has_ndim", "arr")
+    assert (row["same"], row["new"]) == (1, 1)
+
+
+def test_copy_limit_refuses_a_copy_over_it():
+    @arg_digest.map(copy_limit=16, arr={"kind": "data", "rules": ["to_numpy"]})
+    def f(arr):
+        return arr
+
+    small = [1.0, 2.0]
+    assert f(small).tolist() == small
+    array = np.zeros(1000)
+    assert f(array) is array
+
+    with pytest.raises(DigestCopyError) as excinfo:
+        f([0.0] * 1000)
+    assert excinfo.value.code == "ARG-ERR-COPY-001"
+
+
+def test_copy_limit_refuses_a_dtype_change_before_making_it():
+    @arg_digest.map(copy_limit=0, arr={"kind": "sci", "rules": ["to_float64_array"]})
+    def f(arr):
+        return arr
+
+    array = np.zeros(10, dtype=np.float64)
+    assert f(array) is array
+    with pytest.raises(DigestCopyError):
+        f(np.zeros(10, dtype=np.float32))
+
+
+def test_invalid_copy_limit_is_rejected():
+    with pytest.raises(ValueError):
+        @arg_digest(copy_limit=-1)
+        def f(x):
+            return x
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from argdigest import AliasTable, FunctionContract
+from argdigest.core.argument_registry import ArgumentRegistry
+from argdigest.core.function_contract import ContractRegistry
+from argdigest.core.normalization import NormalizationRegistry
+from argdigest.core.registry import Registry
+
+
+def test_pipeline_snapshots_are_never_mutated_by_registration():
+    kind = f"cow_kind_{uuid.uuid4().hex}"
+    Registry.register_pipeline(kind, "a", lambda value, ctx=None: value)
+    before = Registry.snapshot(kind)
+
+    Registry.register_pipeline(kind, "b", lambda value, ctx=None: value)
+
+    assert set(before) == {"a"}
+    assert set(Registry.snapshot(kind)) == {"a", "b"}
+    assert Registry.snapshot(kind) is Registry.snapshot(kind)
+
+
+def test_argument_registry_readers_keep_their_snapshot():
+    ArgumentRegistry.register("first", lambda first: first)
+    published = ArgumentRegistry._digesters
+
+    ArgumentRegistry.register("second", lambda second: second)
+
+    assert set(published) == {"first"}
+    assert set(ArgumentRegistry.get_all()) == {"first", "second"}
+
+
+def test_contract_memo_is_replaced_when_a_contract_is_added():
+    registry = ContractRegistry()
+    assert registry.resolve("pkg.api.get") is None
+    stale_memo = registry._resolved
+
+    contract = FunctionContract(caller="pkg.api.get", admits=("a",))
+    registry.add(contract)
+
+    assert registry.resolve("pkg.api.get") is contract
+    assert registry._resolved is not stale_memo
+    # A resolution that read the old memo can only write into the discarded dict.
+    stale_memo["pkg.api.get"] = None
+    assert registry.resolve("pkg.api.get") is contract
+
+
+def test_normalization_memo_is_replaced_when_a_table_is_added():
+    registry = NormalizationRegistry()
+    assert registry.for_caller("pkg.api.get") == ()
+
+    table = AliasTable(aliases={"residue_index": "group_index"})
+    registry.add(table)
+
+    assert registry.for_caller("pkg.api.get") == (table,)
+
+
+def test_resolution_under_concurrent_declarations_converges():
+    registry = ContractRegistry()
+    callers = [f"pkg.api.f{index}" for index in range(64)]
+    start = threading.Barrier(9)
+
+    def reader():
+        start.wait()
+        for _ in range(200):
+            for caller in callers:
+                registry.resolve(caller)
+
+    def writer():
+        start.wait()
+        for caller in callers:
+            registry.add(FunctionContract(caller=caller, admits=("a",)))
+
+    with ThreadPoolExecutor(max_workers=9) as executor:
+        futures = [executor.submit(reader) for _ in range(8)] + [executor.submit(writer)]
+        for future in futures:
+            future.result()
+
+    assert all(registry.resolve(caller).caller == caller for caller in callers)
@@ -1,6 +1,10 @@
+import pytest
+
 from argdigest import arg_digest, register_pipeline
 from argdigest.core.config import DigestConfig
 
+pytestmark = pytest.mark.usefixtures("plan_mode")
+
 # Use a concrete config to avoid auto-discovery of tests._argdigest
 cfg_decorator = DigestConfig(digestion_style="decorator", strictness="ignore")
 
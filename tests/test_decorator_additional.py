@@ -8,6 +8,8 @@ from argdigest import arg_digest
 from argdigest.core.decorator import get_digester_metadata
 from argdigest.core.errors import DigestNotDigestedError
 
+pytestmark = pytest.mark.usefixtures("plan_mode")
+
 
 def test_get_digester_metadata_ambiguous_value_param_raises():
     def digest_a(x, y, caller=None):
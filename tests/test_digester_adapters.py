@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from argdigest import DigestNotDigestedError, arg_digest, argument_digest
+from argdigest.core import decorator as decorator_mod
+
+pytestmark = pytest.mark.usefixtures("plan_mode")
+
+
+class _CountingLock:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.acquired = 0
+
+    def __enter__(self):
+        self.acquired += 1
+        return self._lock.__enter__()
+
+    def __exit__(self, *exc):
+        return self._lock.__exit__(*exc)
+
+
+def test_adapters_are_resolved_into_the_plan_at_decoration():
+    @argument_digest("count")
+    def digest_count(count, caller=None):
+        return int(count)
+
+    @argument_digest("total")
+    def digest_total(total, count, factor, missing, caller=None):
+        return (total, count, factor, missing, caller)
+
+    @arg_digest(digestion_style="decorator", strictness="ignore", factor=3)
+    def f(count, total=None):
+        return total
+
+    adapters = f.digestion_plan.adapters
+    assert set(adapters) == {"count", "total"}
+    assert adapters["total"].value_param == "total"
+    assert adapters["total"].takes_caller is True
+    assert adapters["total"].arguments == ("count", "factor", "missing")
+
+    value, count, factor, missing, caller = f("4", total="t")
+    assert (value, count, factor, missing) == ("t", 4, 3, None)
+    assert caller.endswith(".f")
+
+
+def test_calls_take_no_lock_once_decorated(monkeypatch):
+    @argument_digest("a")
+    def digest_a(a, caller=None):
+        return int(a)
+
+    @argument_digest("b")
+    def digest_b(b, a, caller=None):
+        return int(b) + a
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def f(a, b):
+        return a, b
+
+    lock = _CountingLock()
+    monkeypatch.setattr(decorator_mod, "_DIGESTER_METADATA_LOCK", lock)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: f(str(i), "1"), range(400)))
+
+    assert results[5] == (5, 6)
+    assert lock.acquired == 0
+
+
+def test_ambiguous_digester_only_fails_when_called():
+    @argument_digest("a")
+    def digest_a(x, y, caller=None):
+        return x
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def f(a):
+        return a
+
+    assert "a" not in f.digestion_plan.adapters
+    with pytest.raises(DigestNotDigestedError, match="Cannot determine value parameter"):
+        f(1)
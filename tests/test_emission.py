@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import gc
+import threading
+import weakref
+
+import pytest
+
+from argdigest import arg_digest, argument_digest
+from argdigest._private.smonitor import emitter
+from argdigest.core import emission
+from argdigest.core.errors import DigestNotDigestedWarning
+
+
+@pytest.fixture(autouse=True)
+def _default_queue():
+    emission.flush()
+    saved = (emission.BATCH_SIZE, emission.FLUSH_INTERVAL, emission.CAPACITY,
+             emission.BACKGROUND)
+    yield
+    emission.flush()
+    batch_size, flush_interval, capacity, background = saved
+    emission.configure(batch_size=batch_size, flush_interval=flush_interval,
+                       capacity=capacity, background=background)
+
+
+def test_events_are_emitted_by_the_background_thread():
+    threads = []
+    emission.submit(lambda: threads.append(threading.current_thread().name))
+    assert emission.flush(timeout=5.0)
+    assert threads in (["argdigest-emission"], [threading.current_thread().name])
+    assert emission.queue_info()["pending"] == 0
+
+
+def test_a_full_queue_drops_and_counts():
+    # A batch that never fills and an interval that never ends keep events queued.
+    emission.configure(batch_size=100, flush_interval=60.0, capacity=2)
+    emitted = []
+    before = emission.queue_info()["dropped"]
+    assert emission.submit(emitted.append, 1)
+    assert emission.submit(emitted.append, 2)
+    assert not emission.submit(emitted.append, 3)
+    assert emission.queue_info()["dropped"] == before + 1
+
+    emission.flush()
+    assert emitted == [1, 2]
+
+
+def test_a_failing_emission_is_counted_not_raised():
+    def broken():
+        raise RuntimeError("smonitor is down")
+
+    before = emission.queue_info()["failed"]
+    emission.submit(broken)
+    emission.flush(timeout=5.0)
+    assert emission.queue_info()["failed"] == before + 1
+
+
+def test_synchronous_mode_emits_in_the_calling_thread():
+    emission.configure(background=False)
+    threads = []
+    emission.submit(lambda: threads.append(threading.current_thread()))
+    assert threads == [threading.current_thread()]
+
+
+def test_warning_is_raised_now_and_its_event_queued(monkeypatch):
+    events = []
+    monkeypatch.setattr(emitter, "_emit_warning", lambda key, extra: events.append((key, extra)))
+    # Keep the event queued until the explicit flush.
+    emission.configure(batch_size=100, flush_interval=60.0)
+
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def f(a):
+        return a
+
+    with pytest.warns(DigestNotDigestedWarning):
+        f(1)
+    assert events == []
+
+    emission.flush()
+    (key, extra), = events
+    assert key == "DigestNotDigestedWarning"
+    assert extra["argname"] == "a"
+
+
+def test_the_warning_points_at_the_decorated_call():
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def f(a):
+        return a
+
+    with pytest.warns(DigestNotDigestedWarning) as record:
+        f(1)
+    assert record[0].filename == __file__
+
+
+def test_a_queued_failure_does_not_keep_the_exception_alive():
+    class Doomed(ValueError):
+        pass
+
+    emission.configure(batch_size=100, flush_interval=60.0)
+
+    @argument_digest("doomed")
+    def digest_doomed(doomed, caller=None):
+        raise Doomed("not today")
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def f(doomed):
+        return doomed
+
+    try:
+        f([1, 2, 3])
+    except ValueError as error:
+        caught = weakref.ref(error)
+    gc.collect()
+    assert caught() is None
+
+    _, args, _ = emission._QUEUE[-1]
+    message, payload = args
+    assert payload["cause_exception"] == "Doomed"
+    assert payload["cause_message"] == "not today"
+    emission.flush()
+
+
+def test_configure_rejects_nonsense():
+    with pytest.raises(ValueError):
+        emission.configure(batch_size=0)
+    with pytest.raises(ValueError):
+        emission.configure(flush_interval=-1)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+import pytest
+
+from argdigest import arg_digest, argument_digest, register_pipeline
+from argdigest.core import errors
+from argdigest.core.context import Context, ValueSummary, summarize
+from argdigest.core.errors import DigestValueError
+
+
+class Frame:
+    """Stands in for a large array: shape, dtype and size, and weakly referenceable."""
+
+    shape = (1_000_000, 3)
+    dtype = "float64"
+    size = 3_000_000
+
+
+def test_an_error_does_not_keep_its_arguments_alive():
+    frame = Frame()
+    ref = weakref.ref(frame)
+    ctx = Context(function_name="f", argname="frame", value=frame,
+                  all_args={"frame": frame, "name": "x" * 10_000, "count": 3})
+    error = DigestValueError("bad frame", context=ctx)
+    del frame, ctx
+    gc.collect()
+    assert ref() is None
+
+    value = error.context.value
+    assert isinstance(value, ValueSummary)
+    assert (value.type, value.shape, value.dtype, value.size) == (
+        "Frame", (1_000_000, 3), "float64", 3_000_000)
+    assert repr(value) == "<Frame shape=(1000000, 3) dtype=float64>"
+    name = error.context.all_args["name"]
+    assert name.size == 10_000 and len(repr(name)) <= 120
+    assert error.context.all_args["count"] == 3
+    assert error.context.argname == "frame"
+
+
+def test_short_values_are_kept_as_they_are():
+    assert summarize("short") == "short"
+    assert summarize(1.5) == 1.5
+    assert summarize(None) is None
+    assert summarize([1, 2, 3]).text == "[1, 2, 3]"
+
+
+def test_keep_values_keeps_full_values(monkeypatch):
+    monkeypatch.setattr(errors, "KEEP_VALUES", True)
+    frame = Frame()
+    error = DigestValueError("bad frame",
+                             context=Context(function_name="f", argname="frame", value=frame))
+    assert error.context.value is frame
+
+
+def _failing_call():
+    @argument_digest("frame")
+    def digest_frame(frame, caller=None):
+        checked = True  # noqa: F841
+        raise DigestValueError("bad frame")
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def analyze(frame, label="x"):
+        return frame
+
+    return analyze
+
+
+def _innermost_locals(error):
+    tb = error.__traceback__
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return tb.tb_frame.f_locals
+
+
+def test_a_caught_error_does_not_keep_the_call_arguments_alive():
+    analyze = _failing_call()
+    label = Frame()
+    ref = weakref.ref(label)
+    try:
+        analyze(Frame(), label=label)
+    except DigestValueError as caught:
+        error = caught
+    del label
+    gc.collect()
+    assert ref() is None
+    assert error.__traceback__ is not None
+
+
+def test_a_digester_frame_keeps_its_locals():
+    analyze = _failing_call()
+    try:
+        analyze(Frame())
+    except DigestValueError as caught:
+        error = caught
+    local_names = _innermost_locals(error)
+    assert local_names["checked"] is True
+    assert isinstance(local_names["frame"], Frame)
+
+
+def test_a_failed_pipeline_clears_only_the_argdigest_frames():
+    @register_pipeline(kind="error_context", name="reject")
+    def reject(value, ctx):
+        raise DigestValueError("rejected", context=ctx)
+
+    @arg_digest(digestion_style="decorator", strictness="ignore",
+                map={"frame": {"kind": "error_context", "rules": ["reject"]}})
+    def analyze(frame):
+        return frame
+
+    try:
+        analyze(Frame())
+    except DigestValueError as caught:
+        error = caught
+    assert error.context.argname == "frame"
+    # The rule keeps what it was given; the registry and the wrapper do not.
+    assert isinstance(_innermost_locals(error)["value"], Frame)
+    tb = error.__traceback__
+    internal = []
+    while tb is not None:
+        if tb.tb_frame.f_globals["__name__"].startswith("argdigest."):
+            internal.append(tb.tb_frame.f_locals)
+        tb = tb.tb_next
+    assert internal
+    assert not any(name in names for names in internal
+                   for name in ("args", "kwargs", "bound", "ctx", "value"))
+
+
+def test_keep_values_keeps_the_traceback_frames(monkeypatch):
+    monkeypatch.setattr(errors, "KEEP_VALUES", True)
+    analyze = _failing_call()
+    frame = Frame()
+    ref = weakref.ref(frame)
+    try:
+        analyze(frame)
+    except DigestValueError as caught:
+        error = caught
+    del frame
+    gc.collect()
+    assert ref() is not None
+    assert _innermost_locals(error)["checked"] is True
+    del error
+
+
+def test_an_error_of_the_function_itself_keeps_its_frames():
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def broken(frame):
+        raise RuntimeError("broken body")
+
+    with pytest.raises(RuntimeError) as info:
+        broken(Frame())
+    tb = info.value.__traceback__
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    assert isinstance(tb.tb_frame.f_locals["frame"], Frame)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import argdigest
+from argdigest import DigestValueError, FunctionContract, arg_digest, argument_digest
+from argdigest.core import exporters, metrics
+from argdigest.core.function_contract import ContractRegistry
+
+
+@pytest.fixture
+def enabled_stats():
+    argdigest.stats.reset()
+    argdigest.stats.enable()
+    yield
+    argdigest.stats.disable()
+    argdigest.stats.reset()
+
+
+def test_events_are_counted_by_code_and_kind(enabled_stats):
+    @argument_digest("export_value")
+    def digest_export_value(export_value, caller=None):
+        raise DigestValueError("not accepted")
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def failing(export_value):
+        return export_value
+
+    @arg_digest(strictness="ignore")
+    def closed(x):
+        return x
+
+    closed.digestion_plan.contracts = ContractRegistry(
+        [FunctionContract(caller=f"{__name__}.closed", requires_any_of=("y",))])
+
+    with pytest.raises(DigestValueError):
+        failing(1)
+    with pytest.raises(argdigest.MissingArgumentError):
+        closed(1)
+
+    counters = argdigest.stats()["counters"]
+    assert counters["digestion_failures"] == {"ARG-ERR-VAL-001": 1}
+    assert counters["contract_violations"] == {"missing_argument": 1}
+    assert set(counters) == set(metrics.COUNTERS)
+
+
+def test_redecoration_counts_as_a_template_hit(enabled_stats):
+    def factory():
+        @arg_digest(strictness="ignore")
+        def made(x):
+            return x
+
+        return made
+
+    factory()
+    factory()
+
+    counters = argdigest.stats()["counters"]
+    assert counters["cache_hits"]["plan_templates"] >= 1
+
+
+def test_openmetrics_text(enabled_stats):
+    @arg_digest(strictness="ignore")
+    def exported(x):
+        return x
+
+    for _ in range(3):
+        exported(1)
+
+    text = exporters.openmetrics()
+    caller = f"{__name__}.exported"
+    assert text.endswith("# EOF\n")
+    assert f'argdigest_calls_total{{caller="{caller}"}} 3' in text
+    assert f'argdigest_call_duration_seconds_bucket{{caller="{caller}",le="+Inf"}} 3' in text
+    assert f'argdigest_stage_duration_seconds_count{{caller="{caller}",stage="body"}} 3' in text
+    assert "# TYPE argdigest_contract_violations counter" in text
+
+    assert json.loads(exporters.to_json())["callers"][caller]["calls"] == 3
+
+
+def test_label_values_are_escaped():
+    snapshot = {"buckets": [], "callers": {}, "counters": {"digestion_failures": {'a"b\\c': 1}}}
+
+    assert 'argdigest_digestion_failures_total{code="a\\"b\\\\c"} 1' in exporters.openmetrics(snapshot)
+
+
+def test_textfile_is_written_atomically_and_periodically(tmp_path, enabled_stats):
+    path = tmp_path / "argdigest.prom"
+
+    exporters.write_textfile(path)
+    assert path.read_text(encoding="utf-8").endswith("# EOF\n")
+    assert [p.name for p in tmp_path.iterdir()] == ["argdigest.prom"]
+
+    path.unlink()
+    with exporters.TextfileExporter(path, interval=0.01):
+        assert path.exists()
+    assert path.read_text(encoding="utf-8").endswith("# EOF\n")
+    assert [p.name for p in tmp_path.iterdir()] == ["argdigest.prom"]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from argdigest import arg_digest, argument_digest
+from argdigest.core import spans
+from argdigest.core.flamegraph import CollapsedStacks
+from argdigest.core.spans import Span
+
+
+class Molsys:
+    pass
+
+
+@argument_digest("flame_molsys")
+def digest_flame_molsys(flame_molsys, caller=None):
+    return flame_molsys
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _inner(flame_molsys):
+    return flame_molsys
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _outer(flame_molsys):
+    return _inner(flame_molsys)
+
+
+def _span(name, span_id, parent_id, start_us, end_us, **attributes):
+    return Span(f"argdigest.{name}", "t", span_id, parent_id, start_us * 1000, end_us * 1000,
+                attributes)
+
+
+def test_self_time_is_folded_into_named_stacks():
+    stacks = CollapsedStacks()
+    # Children first, as a recorder emits them.
+    stacks(_span("digester", "d1", "s1", 10, 40, digester="digest_molsys"))
+    stacks(_span("digestion", "s1", "c1", 0, 50))
+    stacks(_span("rule", "r1", "s2", 50, 60, rule="std.type_check"))
+    stacks(_span("pipelines", "s2", "c1", 50, 60))
+    stacks(_span("digestion", "s3", "c2", 70, 80))
+    stacks(_span("call", "c2", "s4", 70, 80, caller="lib.helper"))
+    stacks(_span("body", "s4", "c1", 60, 200))
+    stacks(_span("call", "c1", None, 0, 200, caller="lib.process"))
+
+    assert dict(stacks.stacks) == {
+        "lib.process;digestion": 20,
+        "lib.process;digestion;digest_molsys": 30,
+        "lib.process;pipelines;std.type_check": 10,
+        "lib.process;body": 130,
+        "lib.process;body;lib.helper;digestion": 10,
+    }
+    assert stacks.lines()[0] == "lib.process;body 130"
+    assert stacks._pending == {}
+
+
+def test_decorated_calls_aggregate_over_a_run(tmp_path):
+    stacks = CollapsedStacks()
+    with spans.sink(stacks):
+        for _ in range(3):
+            _outer(Molsys())
+
+    outer, inner = f"{__name__}._outer", f"{__name__}._inner"
+    assert stacks._pending == {}
+    assert all(stack.startswith(outer) for stack in stacks.stacks)
+    assert any(stack.startswith(f"{outer};body;{inner}") for stack in stacks.stacks)
+
+    path = stacks.write(tmp_path / "argdigest.folded")
+    for line in open(path).read().splitlines():
+        stack, _, micros = line.rpartition(" ")
+        assert stack and int(micros) > 0
+
+    stacks.clear()
+    assert stacks.lines() == []
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import sys
+from textwrap import dedent
+
+import pytest
+
+from argdigest.cli import main
+from argdigest.core import argument_loader, import_profile
+
+
+def _write_package(root, name="profiledpkg"):
+    pkg_dir = root / name
+    (pkg_dir / "digestion").mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text("", encoding="utf-8")
+    (pkg_dir / "digestion" / "__init__.py").write_text("", encoding="utf-8")
+    (pkg_dir / "digestion" / "count.py").write_text(
+        "def digest_count(count, caller=None):\n    return int(count)\n", encoding="utf-8")
+    (pkg_dir / "standardization.py").write_text(
+        "def standardize(caller, kwargs):\n    return kwargs\n", encoding="utf-8")
+    (pkg_dir / "api.py").write_text(
+        dedent(
+            f"""
+            from argdigest import arg_digest
+
+            @arg_digest(digestion_source="{name}.digestion", digestion_style="package",
+                        standardizer="{name}.standardization:standardize",
+                        strictness="ignore")
+            def scale(count, factor=2):
+                return count * factor
+
+            @arg_digest(digestion_source="{name}.digestion", digestion_style="package",
+                        strictness="ignore")
+            def double(count):
+                return count * 2
+            """
+        ),
+        encoding="utf-8",
+    )
+    return pkg_dir
+
+
+@pytest.fixture
+def profiled_package(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_package(tmp_path)
+    yield "profiledpkg"
+    for module in [m for m in sys.modules if m.startswith("profiledpkg")]:
+        del sys.modules[module]
+    argument_loader._load_from_package.cache_clear()
+
+
+def test_profile_import_attributes_stages_and_imports(profiled_package):
+    report = import_profile.profile_import(profiled_package)
+
+    functions = {record["function"]: record for record in report["functions"]}
+    assert set(functions) == {"profiledpkg.api.scale", "profiledpkg.api.double"}
+
+    scale = functions["profiledpkg.api.scale"]
+    assert {"config", "discovery", "standardizer", "standardizer_check",
+            "declarations", "signature"} <= set(scale["stages"])
+    assert sum(scale["stages"].values()) <= scale["total"]
+    assert "profiledpkg.standardization" in scale["imports"]["standardizer"]
+    assert "beartype" not in scale["stages"]
+
+    discovered = [m for modules in report["argdigest_imports"].values() for m in modules]
+    assert "profiledpkg.digestion.count" in discovered
+    assert report["decoration_time"] <= report["import_time"]
+
+
+def test_stages_are_not_recorded_without_an_active_profiler():
+    assert import_profile._ACTIVE is None
+    assert import_profile.stage("config") is import_profile.stage("signature")
+
+
+def test_profile_import_cli_prints_json_report(profiled_package, capsys, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["argdigest", "profile-import", "--module", profiled_package,
+                                     "--json"])
+    main()
+    report = json.loads(capsys.readouterr().out)
+    assert report["module"] == profiled_package
+    assert len(report["functions"]) == 2
+
+
+def test_profile_import_cli_reports_missing_module(capsys, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["argdigest", "profile-import", "--module",
+                                     "argdigest_missing_pkg_xyz"])
+    with pytest.raises(SystemExit):
+        main()
+    assert "Could not import module" in capsys.readouterr().out
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+import pytest
+
+from argdigest.core import errors_base
+from argdigest.core.context import Context
+from argdigest.core.errors import DigestValueError
+from argdigest.pipelines.validators import is_positive
+
+
+@pytest.fixture()
+def resolutions(monkeypatch):
+    calls = []
+    original = errors_base.ensure_configured
+    monkeypatch.setattr(errors_base, "ensure_configured",
+                        lambda: (calls.append(1), original())[1])
+    return calls
+
+
+def _ctx():
+    return Context(function_name="f", argname="x", value=-1, all_args={})
+
+
+def test_raising_and_catching_does_not_resolve_the_catalog(resolutions):
+    for _ in range(100):
+        try:
+            is_positive(-1, _ctx())
+        except DigestValueError as error:
+            assert error.code == "ARG-ERR-VAL-001"
+    assert resolutions == []
+
+
+def test_rendering_resolves_once(resolutions):
+    formatted = []
+
+    def message():
+        formatted.append(1)
+        return "Value must be positive, got -1"
+
+    error = DigestValueError(message, context=_ctx(), hint="use a positive number")
+    assert formatted == []
+    rendered = str(error)
+    assert "Value must be positive, got -1" in rendered
+    assert str(error) == rendered
+    assert error.raw_message == "Value must be positive, got -1"
+    assert error.hint == "use a positive number"
+    assert formatted == [1]
+    assert len(resolutions) == 1
+
+
+def test_attributes_of_the_catalog_resolve_on_access():
+    error = DigestValueError("bad", context=_ctx(), hint=lambda: "fix this")
+    assert error.hint == "fix this"
+    assert error.raw_message == "bad"
+
+
+def test_a_lazy_error_pickles_as_its_resolved_form():
+    error = DigestValueError(lambda: "bad value", context=None)
+    clone = pickle.loads(pickle.dumps(error))
+    assert str(clone) == str(error)
+    assert clone.code == error.code
+
+
+def test_args_are_set_before_rendering(resolutions):
+    error = DigestValueError("bad", context=_ctx())
+    assert error.args == ("bad",)
+    assert DigestValueError(lambda: "bad", context=None).args == ("ARG-ERR-VAL-001",)
+    assert resolutions == []
+
+
+def test_an_unrendered_error_copies():
+    error = DigestValueError("bad", context=_ctx())
+    clone = copy.copy(error)
+    assert str(clone) == str(error)
+    assert clone.code == error.code
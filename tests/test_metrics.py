@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+
+import argdigest
+from argdigest import FunctionContract, arg_digest, argument_digest
+from argdigest.core import metrics
+from argdigest.core.function_contract import ContractRegistry
+
+
+@pytest.fixture
+def enabled_stats():
+    argdigest.stats.reset()
+    argdigest.stats.enable()
+    yield argdigest.stats
+    argdigest.stats.disable()
+    argdigest.stats.reset()
+
+
+def test_stats_are_off_by_default_and_record_nothing():
+    argdigest.stats.reset()
+
+    @arg_digest(strictness="ignore")
+    def quiet(x):
+        return x
+
+    quiet(1)
+    snapshot = argdigest.stats()
+    assert snapshot["enabled"] is False
+    assert snapshot["callers"] == {}
+
+
+def test_every_stage_of_a_call_is_timed_per_caller(enabled_stats):
+    @argument_digest("metric_value")
+    def digest_metric_value(metric_value, caller=None):
+        return int(metric_value)
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def timed(metric_value):
+        return metric_value * 2
+
+    for _ in range(5):
+        assert timed("3") == 6
+
+    caller = f"{__name__}.timed"
+    record = argdigest.stats()["callers"][caller]
+    assert record["calls"] == 5
+    assert record["errors"] == 0
+    assert record["total"]["count"] == 5
+    assert set(record["stages"]) == set(metrics.STAGES)
+    for name in metrics.STAGES:
+        histogram = record["stages"][name]
+        assert histogram["count"] == 5
+        assert sum(histogram["counts"]) == 5
+        assert len(histogram["counts"]) == len(metrics.BUCKETS) + 1
+    stage_time = sum(h["sum"] for h in record["stages"].values())
+    assert stage_time <= record["total"]["sum"]
+    assert 0.0 < record["overhead_share"] < 1.0
+
+
+def test_a_rejected_call_counts_as_an_error_and_never_reaches_the_body(enabled_stats):
+    @arg_digest(strictness="ignore")
+    def closed(x):
+        return x
+
+    closed.digestion_plan.contracts = ContractRegistry(
+        [FunctionContract(caller=f"{__name__}.closed", requires_any_of=("y",))])
+
+    with pytest.raises(argdigest.MissingArgumentError):
+        closed(1)
+
+    record = argdigest.stats()["callers"][f"{__name__}.closed"]
+    assert record["calls"] == 1
+    assert record["errors"] == 1
+    assert record["stages"]["body"]["count"] == 0
+
+
+def test_reset_and_disable(enabled_stats):
+    @arg_digest(strictness="ignore")
+    def counted(x):
+        return x
+
+    counted(1)
+    enabled_stats.disable()
+    counted(1)
+    assert argdigest.stats()["callers"][f"{__name__}.counted"]["calls"] == 1
+
+    enabled_stats.reset()
+    assert argdigest.stats()["callers"] == {}
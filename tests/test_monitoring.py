@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from argdigest import arg_digest, argument_digest, register_pipeline
+from argdigest.core import monitoring
+
+pytestmark = pytest.mark.skipif(not monitoring.available(),
+                                reason="sys.monitoring needs Python 3.12")
+
+
+@argument_digest("monitored")
+def digest_monitored(monitored, caller=None):
+    return monitored
+
+
+@register_pipeline(kind="monitoring_test", name="positive")
+def _positive(value, ctx):
+    return value
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore",
+            map={"monitored": {"kind": "monitoring_test", "rules": ["positive"]}})
+def _monitored(monitored):
+    return monitored
+
+
+@argument_digest("refused")
+def digest_refused(refused, caller=None):
+    if refused < 0:
+        raise ValueError("negative")
+    return refused
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _refusing(refused):
+    return refused
+
+
+@argument_digest("lazy")
+def digest_lazy(lazy, caller=None):
+    yield lazy
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _lazy(lazy):
+    return next(lazy)
+
+
+def _undecorated(x):
+    return x
+
+
+def test_digesters_and_rules_are_timed():
+    with monitoring.profile() as report:
+        for _ in range(5):
+            _monitored(1)
+    rows = report()
+    digester = f"{__name__}.digest_monitored"
+    assert rows[digester]["kind"] == "digester"
+    assert rows[digester]["calls"] == 5
+    assert rows["monitoring_test.positive"]["calls"] == 5
+    assert rows[digester]["total"] >= 0.0
+
+
+def test_only_known_code_is_instrumented_and_stop_removes_it():
+    monitoring.start()
+    try:
+        assert monitoring.running()
+        tool = monitoring._tool
+        assert sys.monitoring.get_local_events(tool, digest_monitored.__code__)
+        assert not sys.monitoring.get_local_events(tool, _undecorated.__code__)
+    finally:
+        monitoring.stop()
+    assert not monitoring.running()
+    assert sys.monitoring.get_tool(tool) is None
+    assert not sys.monitoring.get_local_events(tool, digest_monitored.__code__)
+
+
+def test_start_twice_is_an_error():
+    with monitoring.profile():
+        with pytest.raises(RuntimeError):
+            monitoring.start()
+
+
+def test_a_raising_digester_is_counted_and_leaves_no_entry_behind():
+    with monitoring.profile() as report:
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                _refusing(-1)
+        _refusing(1)
+        assert not monitoring._local.stack
+    row = report()[f"{__name__}.digest_refused"]
+    assert (row["calls"], row["raised"]) == (4, 3)
+
+
+def test_a_generator_digester_is_timed_up_to_its_first_yield():
+    with monitoring.profile() as report:
+        for _ in range(3):
+            _lazy(1)
+        assert not monitoring._local.stack
+    assert report()[f"{__name__}.digest_lazy"]["calls"] == 3
+
+
+def test_the_stack_of_a_thread_is_bounded(monkeypatch):
+    monkeypatch.setattr(monitoring, "MAX_DEPTH", 4)
+    with monitoring.profile():
+        for _ in range(10):
+            monitoring._on_start(digest_monitored.__code__, 0)
+        assert len(monitoring._local.stack) == 4
+        monitoring._local.stack.clear()
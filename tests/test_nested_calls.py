@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+import argdigest
+from argdigest import arg_digest, argument_digest
+
+
+class Molsys:
+    pass
+
+
+@argument_digest("nested_molsys")
+def digest_nested_molsys(nested_molsys, caller=None):
+    return nested_molsys
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _inner(nested_molsys):
+    return nested_molsys
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _public(nested_molsys):
+    _inner(nested_molsys)
+    return _inner(nested_molsys)
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _shallow(nested_molsys):
+    return _inner(Molsys())
+
+
+@pytest.fixture
+def tracing():
+    argdigest.nested_calls.reset()
+    argdigest.nested_calls.enable()
+    yield argdigest.nested_calls
+    argdigest.nested_calls.disable()
+    argdigest.nested_calls.reset()
+
+
+def test_redigestion_below_a_public_call_is_attributed_to_it(tracing):
+    _public(Molsys())
+    _public(Molsys())
+
+    report = argdigest.nested_calls()
+    public = next(item for item in report["callers"] if item["caller"] == f"{__name__}._public")
+    assert public["calls"] == 2
+    assert public["inner_calls"] == 4
+    assert public["inner"] == {f"{__name__}._inner": 4}
+    assert public["digestions"][f"{__name__}._public:nested_molsys"] == 2
+    assert public["digestions"][f"{__name__}._inner:nested_molsys"] == 4
+    assert public["redigested"] == {f"{__name__}._inner:nested_molsys": 4}
+    assert public["redundant_per_call"] == 2.0
+    assert not any(item["caller"] == f"{__name__}._inner" for item in report["callers"])
+
+
+def test_the_worst_offender_is_ranked_first(tracing):
+    _shallow(Molsys())
+    _public(Molsys())
+
+    callers = argdigest.nested_calls(top=1)["callers"]
+    assert [item["caller"] for item in callers] == [f"{__name__}._public"]
+
+
+def test_a_fresh_value_is_not_redundant(tracing):
+    _shallow(Molsys())
+
+    shallow = argdigest.nested_calls()["callers"][0]
+    assert shallow["inner_calls"] == 1
+    assert shallow["redundant"] == 0
+
+
+def test_nothing_is_traced_unless_enabled():
+    argdigest.nested_calls.reset()
+    _public(Molsys())
+
+    assert argdigest.nested_calls()["callers"] == []
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import copy
+import importlib
+import json
+import pickle
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+from argdigest import arg_digest
+from argdigest.core import argument_loader, compiler
+from argdigest.core.function_contract import ContractRegistry, FunctionContract
+from argdigest.core.normalization import AliasTable, NormalizationRegistry
+
+
+def _write_package(root, name="pickledpkg"):
+    pkg_dir = root / name
+    (pkg_dir / "digestion").mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text("", encoding="utf-8")
+    (pkg_dir / "digestion" / "__init__.py").write_text("", encoding="utf-8")
+    (pkg_dir / "digestion" / "count.py").write_text(
+        dedent(
+            """
+            def digest_count(count, caller=None):
+                return int(count)
+            """
+        ),
+        encoding="utf-8",
+    )
+    (pkg_dir / "_argdigest.py").write_text(
+        dedent(
+            f"""
+            DIGESTION_SOURCE = "{name}.digestion"
+            DIGESTION_STYLE = "package"
+            STRICTNESS = "ignore"
+            """
+        ),
+        encoding="utf-8",
+    )
+    (pkg_dir / "api.py").write_text(
+        dedent(
+            """
+            from argdigest import arg_digest
+
+            @arg_digest(profiling=True)
+            def scale(count, factor=2):
+                return count * factor
+
+            class Counter:
+                @arg_digest()
+                def add(self, count):
+                    return count + 1
+            """
+        ),
+        encoding="utf-8",
+    )
+    return pkg_dir
+
+
+def _purge(name):
+    for module in [m for m in sys.modules if m == name or m.startswith(f"{name}.")]:
+        del sys.modules[module]
+    compiler._COMPILED.pop(name, None)
+    argument_loader._load_from_package.cache_clear()
+    importlib.invalidate_caches()
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_package(tmp_path)
+    yield importlib.import_module("pickledpkg.api")
+    _purge("pickledpkg")
+
+
+def test_decorated_functions_pickle_by_reference(api):
+    api.scale("3")
+    assert api.scale.audit_log is not None
+
+    restored = pickle.loads(pickle.dumps(api.scale))
+    assert restored is api.scale
+    assert restored("3") == 6
+    assert pickle.loads(pickle.dumps(api.Counter.add)) is api.Counter.add
+
+
+def test_importable_plan_pickles_as_its_name(api):
+    plan = api.scale.digestion_plan
+    payload = pickle.dumps(plan)
+
+    assert pickle.loads(payload) is plan
+    assert len(payload) < 200
+    assert pickle.loads(pickle.dumps(api.Counter.add.digestion_plan)) is api.Counter.add.digestion_plan
+
+
+def test_copying_a_plan_still_copies(api):
+    plan = api.scale.digestion_plan
+    clone = copy.copy(plan)
+
+    assert clone is not plan
+    assert clone.digesters == plan.digesters
+
+
+def test_closure_plan_pickles_by_value():
+    contracts = ContractRegistry([FunctionContract(caller="pkg.f", admits="any")])
+    normalization = NormalizationRegistry([AliasTable(aliases={"n": "count"})])
+
+    @arg_digest(strictness="ignore")
+    def local(count):
+        return count
+
+    plan = local.digestion_plan
+    plan.contracts = contracts
+    plan.normalization = normalization
+
+    restored = pickle.loads(pickle.dumps(plan))
+    assert restored is not plan
+    assert restored.qualified_name == plan.qualified_name
+    assert restored.signature == plan.signature
+    assert restored.contracts.resolve("pkg.f").admits == "any"
+    assert restored.normalization.tables() == normalization.tables()
+
+
+def test_manifest_warm_starts_a_fresh_process(api, tmp_path):
+    manifest = compiler.export_manifest(tmp_path / "manifest.json", ["pickledpkg"])
+    payload = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert set(payload["plans"]["pickledpkg"]) == {
+        "pickledpkg.api.scale", "pickledpkg.api.Counter.add"}
+
+    snippet = (
+        "import json, sys;"
+        f"sys.path.insert(0, {str(tmp_path)!r});"
+        "from argdigest.core.compiler import load_manifest;"
+        f"loaded = load_manifest({manifest!r});"
+        "import pickledpkg.api as api;"
+        "print(json.dumps({'loaded': loaded,"
+        " 'compiled': [api.scale.digestion_plan.compiled,"
+        " api.Counter.add.digestion_plan.compiled],"
+        " 'result': api.scale('4')}))"
+    )
+    proc = subprocess.run([sys.executable, "-c", snippet], capture_output=True,
+                          text=True, check=True)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    assert result == {"loaded": 2, "compiled": [True, True], "result": 8}
+
+
+def test_manifest_of_another_format_is_ignored(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"manifest_format": 0, "plans": {"x": {}}}), encoding="utf-8")
+
+    assert compiler.load_manifest(path) == 0
+    assert "x" not in compiler._COMPILED
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from argdigest import arg_digest, argument_digest
+from argdigest.core import argument_loader
+from argdigest.core import decorator as decorator_mod
+
+
+@pytest.fixture
+def build_counter(monkeypatch):
+    calls = {"n": 0}
+    original = decorator_mod._build_plan
+
+    def counting_build(fn, options):
+        calls["n"] += 1
+        return original(fn, options)
+
+    monkeypatch.setattr(decorator_mod, "_build_plan", counting_build)
+    return calls
+
+
+def _make_accessor(offset, strictness="ignore"):
+    def accessor(value, scale=2):
+        return value * scale + offset
+
+    return arg_digest(digestion_style="decorator", strictness=strictness)(accessor)
+
+
+def test_redecorating_the_same_code_object_reuses_the_template(build_counter):
+    @argument_digest("value")
+    def digest_value(value, caller=None):
+        return int(value)
+
+    accessors = [_make_accessor(offset) for offset in range(50)]
+
+    assert build_counter["n"] == 1
+    assert [accessor("3") for accessor in accessors[:3]] == [6, 7, 8]
+    plans = {id(accessor.digestion_plan) for accessor in accessors}
+    assert len(plans) == 50
+    assert accessors[0].digestion_plan.digesters == accessors[-1].digestion_plan.digesters
+
+
+def _make_collector():
+    def collect(value, acc=[], *, seen={}):  # noqa: B006
+        acc.append(value)
+        seen[value] = True
+        return acc, seen
+
+    return arg_digest(digestion_style="decorator", strictness="ignore")(collect)
+
+
+def test_closures_with_mutable_defaults_keep_their_own(build_counter):
+    first = _make_collector()
+    second = _make_collector()
+
+    assert build_counter["n"] == 1
+    assert first(1) == ([1], {1: True})
+    assert second(2) == ([2], {2: True})
+    assert first(3)[0] == [1, 3]
+    assert first.digestion_plan.signature is not second.digestion_plan.signature
+
+
+def test_template_is_not_shared_across_different_options(build_counter):
+    _make_accessor(0, strictness="ignore")
+    _make_accessor(0, strictness="warn")
+    _make_accessor(1, strictness="ignore")
+
+    assert build_counter["n"] == 2
+
+
+def test_registry_changes_and_cache_clears_invalidate_templates(build_counter):
+    first = _make_accessor(0)
+    assert first.digestion_plan.digesters == {}
+
+    @argument_digest("value")
+    def digest_value(value, caller=None):
+        return int(value)
+
+    second = _make_accessor(0)
+    assert build_counter["n"] == 2
+    assert second("4") == 8
+
+    argument_loader._load_from_package.cache_clear()
+    _make_accessor(0)
+    assert build_counter["n"] == 3
+
+
+def test_unhashable_options_skip_the_template(build_counter):
+    class Unhashable:
+        __hash__ = None
+
+    def make():
+        @arg_digest(digestion_style="decorator", strictness="ignore", token=Unhashable())
+        def f(value):
+            return value
+
+        return f
+
+    assert make()(1) == 1
+    assert make()(2) == 2
+    assert build_counter["n"] == 2
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+import argdigest
+from argdigest import DigestConfig, arg_digest, register_pipeline
+from argdigest.core import metrics
+
+
+@register_pipeline(kind="sampled", name="noop")
+def _noop(value, ctx):
+    return value
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    argdigest.stats.reset()
+    yield
+    argdigest.stats.reset()
+
+
+def test_one_call_in_n_is_timed_and_counts_are_extrapolated():
+    @arg_digest.map(profiling=True, profiling_every=4, val={"kind": "sampled", "rules": ["noop"]})
+    def every_fourth(val):
+        return val
+
+    for _ in range(10):
+        every_fourth(1)
+
+    record = argdigest.stats()["callers"][f"{__name__}.every_fourth"]
+    assert record["sampled"] == 2
+    # Calls 9 and 10 are still waiting for the next sample.
+    assert record["calls"] == 8
+    assert record["total"]["count"] == 8
+    assert record["rules"]["sampled.noop"]["count"] == 8
+    assert every_fourth.audit_log[0]["rule"] == "sampled.noop"
+
+
+def test_time_based_sampling(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(metrics.time, "monotonic", lambda: clock[0])
+
+    @arg_digest(profiling=True, profiling_interval=1.0, strictness="ignore")
+    def periodic(x):
+        return x
+
+    periodic(1)           # first call is sampled
+    periodic(1)
+    periodic(1)
+    clock[0] += 1.5
+    periodic(1)           # stands for the three calls since the first sample
+
+    record = argdigest.stats()["callers"][f"{__name__}.periodic"]
+    assert record["sampled"] == 2
+    assert record["calls"] == 4
+
+
+def test_sampling_is_configured_through_digest_config():
+    config = DigestConfig(profiling=True, profiling_every=3, strictness="ignore")
+
+    @arg_digest(config=config)
+    def configured(x):
+        return x
+
+    assert configured.digestion_plan.profiling_every == 3
+    assert configured.digestion_plan.profiling_interval is None
+
+
+def test_an_invalid_sampling_rate_is_refused():
+    with pytest.raises(ValueError, match="profiling_every"):
+        @arg_digest(profiling=True, profiling_every=0)
+        def never(x):
+            return x
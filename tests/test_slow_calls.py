@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+import argdigest
+from argdigest import DigestConfig, arg_digest, argument_digest
+from argdigest.core import slowlog
+
+
+@pytest.fixture(autouse=True)
+def _fresh_log(monkeypatch):
+    # Registered here: the conftest clears the registry before every test.
+    @argument_digest("slow_value")
+    def digest_slow_value(slow_value, caller=None):
+        time.sleep(slow_value)
+        return slow_value
+
+    emitted = []
+    monkeypatch.setattr(slowlog, "_emit", lambda entry, suppressed: emitted.append(suppressed))
+    argdigest.slow_calls.reset()
+    argdigest.stats.reset()
+    yield emitted
+    argdigest.slow_calls.reset()
+    argdigest.stats.reset()
+
+
+def test_a_call_over_budget_is_logged_with_its_breakdown():
+    @arg_digest(digestion_style="decorator", strictness="ignore", latency_budget=0.005)
+    def budgeted(slow_value, items):
+        return slow_value
+
+    budgeted(0.0, [1, 2])
+    assert argdigest.slow_calls() == []
+
+    budgeted(0.02, [1, 2, 3])
+    entry, = argdigest.slow_calls()
+    assert entry["caller"] == f"{__name__}.budgeted"
+    assert entry["budget"] == 0.005
+    assert entry["elapsed"] >= 0.02
+    assert entry["stages"]["digestion"] >= 0.02
+    assert "body" not in entry["stages"]
+    assert entry["arguments"]["slow_value"] == {"type": "float"}
+    assert entry["arguments"]["items"] == {"type": "list", "len": 3}
+    assert entry["thread"]
+    assert argdigest.stats()["counters"]["slow_calls"] == {f"{__name__}.budgeted": 1}
+    # Budgets alone do not feed the call statistics.
+    assert argdigest.stats()["callers"] == {}
+
+
+def test_events_are_rate_limited_per_caller(_fresh_log, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(slowlog.time, "monotonic", lambda: clock[0])
+
+    @arg_digest(digestion_style="decorator", strictness="ignore", latency_budget=0.001)
+    def noisy(slow_value):
+        return slow_value
+
+    for _ in range(3):
+        noisy(0.002)
+    clock[0] += slowlog.EMIT_INTERVAL
+    noisy(0.002)
+
+    assert len(argdigest.slow_calls(f"{__name__}.noisy")) == 4
+    # One event on the first slow call, then one carrying the two left unreported.
+    assert _fresh_log == [0, 2]
+
+
+def test_budgets_by_caller_pattern():
+    config = DigestConfig(digestion_style="decorator", strictness="ignore",
+                          latency_budget={f"{__name__}.*": 0.001, f"{__name__}.lenient": 10.0})
+
+    @arg_digest(config=config)
+    def strict(slow_value):
+        return slow_value
+
+    @arg_digest(config=config)
+    def lenient(slow_value):
+        return slow_value
+
+    strict(0.005)
+    lenient(0.005)
+
+    assert [entry["caller"] for entry in argdigest.slow_calls()] == [f"{__name__}.strict"]
+
+
+@pytest.mark.parametrize("budget", [0, -1.0, "fast", {"x": 0}])
+def test_invalid_budgets_are_rejected(budget):
+    with pytest.raises(ValueError):
+        @arg_digest(strictness="ignore", latency_budget=budget)
+        def f(x):
+            return x
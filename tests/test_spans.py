@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from argdigest import arg_digest, argument_digest
+from argdigest.core import spans
+
+
+class Molsys:
+    pass
+
+
+@argument_digest("span_molsys")
+def digest_span_molsys(span_molsys, caller=None):
+    if span_molsys is None:
+        raise ValueError("span_molsys is required")
+    return span_molsys
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _inner(span_molsys):
+    return span_molsys
+
+
+@arg_digest(digestion_style="decorator", strictness="ignore")
+def _outer(span_molsys):
+    return _inner(span_molsys)
+
+
+@pytest.fixture
+def sink():
+    target = spans.ListSink()
+    with spans.sink(target):
+        yield target
+
+
+def _by_name(collected, name):
+    return [span for span in collected.spans if span.name == name]
+
+
+def test_a_call_produces_one_span_per_stage_under_the_call(sink):
+    _inner(Molsys())
+
+    call, = _by_name(sink, "argdigest.call")
+    assert call.parent_id is None
+    assert call.status == "OK"
+    stages = [span.name for span in sink.spans if span.parent_id == call.span_id]
+    assert stages == [f"argdigest.{stage}" for stage in spans.STAGES]
+    digester, = _by_name(sink, "argdigest.digester")
+    digestion, = _by_name(sink, "argdigest.digestion")
+    assert digester.parent_id == digestion.span_id
+    assert digester.attributes["argname"] == "span_molsys"
+    assert digester.attributes["caller"] == f"{__name__}._inner"
+    assert all(span.trace_id == call.trace_id for span in sink.spans)
+    assert all(span.start_ns <= span.end_ns for span in sink.spans)
+
+
+def test_a_nested_call_is_parented_under_the_outer_body(sink):
+    _outer(Molsys())
+
+    outer, inner = sorted(_by_name(sink, "argdigest.call"), key=lambda span: span.start_ns)
+    body = next(span for span in _by_name(sink, "argdigest.body")
+                if span.parent_id == outer.span_id)
+    assert inner.parent_id == body.span_id
+    assert inner.trace_id == outer.trace_id
+
+
+def test_a_request_id_correlates_separate_calls(sink):
+    with spans.request("req-42") as request_id:
+        assert spans.current_request_id() == "req-42"
+        _inner(Molsys())
+        _inner(Molsys())
+    assert spans.current_request_id() is None
+
+    calls = _by_name(sink, "argdigest.call")
+    assert len(calls) == 2
+    assert {span.trace_id for span in calls} == {request_id}
+
+
+def test_a_failing_digester_marks_its_spans_with_the_error(sink):
+    with pytest.raises(ValueError):
+        _inner(None)
+
+    digester, = _by_name(sink, "argdigest.digester")
+    assert digester.status == "ERROR"
+    assert digester.attributes["error.code"] == "ValueError"
+    call, = _by_name(sink, "argdigest.call")
+    assert call.status == "ERROR"
+    assert call.attributes["error.type"] == "ValueError"
+    failed = next(span for span in sink.spans
+                  if span.parent_id == call.span_id and span.status == "ERROR")
+    assert failed.name == "argdigest.digestion"
+
+
+def test_jsonl_sink_writes_one_object_per_span(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    with spans.sink(spans.JsonlSink(path)):
+        _inner(Molsys())
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[-1]["name"] == "argdigest.call"
+    assert {"trace_id", "span_id", "parent_span_id", "start_time_unix_nano",
+            "end_time_unix_nano", "attributes", "status"} <= set(records[0])
+
+
+def test_a_failing_sink_does_not_fail_the_call():
+    def broken(span):
+        raise RuntimeError("sink down")
+
+    molsys = Molsys()
+    with spans.sink(broken):
+        assert _inner(molsys) is molsys
+
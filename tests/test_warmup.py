@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import gc
+import sys
+import uuid
+
+import argdigest
+from argdigest import Domain, arg_digest, argument_digest
+from argdigest.core.decorator import decorated_functions
+from argdigest.core.function_contract import ContractRegistry
+from argdigest.core.registry import Registry
+
+
+class Shelf:
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def put(self, item):
+        return item
+
+
+def test_decorated_functions_are_tracked_weakly():
+    @arg_digest(strictness="ignore")
+    def transient(x):
+        return x
+
+    assert transient in decorated_functions()
+
+    name = transient.__qualname__
+    del transient
+    gc.collect()
+    assert name not in {fn.__qualname__ for fn in decorated_functions()}
+
+
+def test_warmup_resolves_per_caller_state_of_a_package():
+    report = argdigest.warmup(modules="tests.mock_axis_one")
+
+    from tests.mock_axis_one import api
+
+    assert report["functions"] >= 4
+    assert report["frozen"] is False
+    plan = api.get.digestion_plan
+    assert "tests.mock_axis_one.api.get" in plan.contracts._resolved
+    assert "tests.mock_axis_one.api.get" in plan.normalization._by_caller
+
+
+def test_warmup_builds_domain_indexes_and_loads_pipeline_kinds(tmp_path, monkeypatch):
+    kind = f"warm_kind_{uuid.uuid4().hex}"
+    module = f"warm_pipelines_{uuid.uuid4().hex}"
+    (tmp_path / f"{module}.py").write_text(
+        "from argdigest import register_pipeline\n"
+        f"@register_pipeline({kind!r}, name='upper')\n"
+        "def upper(value, ctx=None):\n"
+        "    return value.upper()\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    Registry.register_lazy(kind, module)
+    colour = Domain(name="colour", members=iter(("red", "blue")))
+
+    @arg_digest(strictness="ignore", map={"name": {"kind": kind, "rules": ["upper"]}})
+    def paint(name):
+        return name
+
+    paint.digestion_plan.domains = {"colour": colour}
+    try:
+        report = argdigest.warmup()
+        assert module in sys.modules
+        assert kind in report["pipeline_kinds"]
+        # Read once, by warmup: an iterator could not be read again.
+        assert colour._index == frozenset({"red", "blue"})
+        assert "red" in colour and "green" not in colour
+        assert paint("x") == "X"
+    finally:
+        sys.modules.pop(module, None)
+
+
+def test_warmup_can_freeze_the_heap(monkeypatch):
+    frozen = []
+    monkeypatch.setattr(gc, "freeze", lambda: frozen.append(True))
+
+    assert argdigest.warmup(freeze=True)["frozen"] is True
+    assert frozen == [True]
+
+
+def test_a_domain_enumerates_static_members_once():
+    members = ("a", "b")
+    domain = Domain(name="letters", members=members)
+
+    assert domain.index() == frozenset({"a", "b"})
+    assert domain.index() is domain.index()
+    assert "a" in domain and "z" not in domain
+    assert domain == Domain(name="letters", members=members)
+
+
+def test_a_domain_reads_callable_members_on_every_lookup():
+    names = ["a", "b"]
+    domain = Domain(name="letters", members=lambda: names)
+
+    assert "c" not in domain
+    names.append("c")
+
+    assert "c" in domain
+    assert domain.index() == frozenset({"a", "b", "c"})
+    assert domain.known_members() == ("a", "b", "c")
+    assert domain.admits("c") is True
+
+
+def test_warmup_resolves_the_callers_a_method_reports():
+    # A class assembled elsewhere reports its own module, as `Shelf.put` does at call time.
+    Annex = type("Annex", (Shelf,), {"__module__": "tests.elsewhere"})
+    plan = Shelf.put.digestion_plan
+    plan.contracts = ContractRegistry()
+
+    argdigest.warmup()
+    assert {f"{__name__}.put", "tests.elsewhere.put"} <= set(plan.contracts._resolved)
+    resolved = dict(plan.contracts._resolved)
+
+    Annex().put(1)
+    Shelf().put(2)
+    assert plan.contracts._resolved == resolved
+
+
+def test_warmup_builds_adapters_for_the_function_parameters_only():
+    @argument_digest("item")
+    def digest_item(item, caller=None):
+        return item
+
+    @argument_digest("unrelated")
+    def digest_unrelated(unrelated, caller=None):
+        return unrelated
+
+    @arg_digest(digestion_style="decorator", strictness="ignore")
+    def stock(item):
+        return item
+
+    stock.digestion_plan.adapters.clear()
+    argdigest.warmup()
+    assert set(stock.digestion_plan.adapters) == {"item"}
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+import warnings
+
+import pytest
+
+import argdigest
+from argdigest import arg_digest
+from argdigest.core import warning_counts
+from argdigest.core.errors import DigestNotDigestedWarning, FunctionContractWarning
+
+
+@pytest.fixture(autouse=True)
+def _interval(monkeypatch):
+    monkeypatch.setattr(warning_counts, "REPEAT_INTERVAL", None)
+
+
+def _raised(fn, *args, **kwargs):
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        fn(*args, **kwargs)
+    return [w for w in record if issubclass(w.category, RuntimeWarning)]
+
+
+def test_missing_digester_warns_once_and_counts_the_rest():
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def undigested(a):
+        return a
+
+    with pytest.warns(DigestNotDigestedWarning):
+        undigested(1)
+    for _ in range(9):
+        assert _raised(undigested, 1) == []
+
+    row, = argdigest.warning_counts(f"{__name__}.undigested")
+    assert row["warning"] == "DigestNotDigestedWarning"
+    assert row["argname"] == "a"
+    assert (row["occurrences"], row["raised"]) == (10, 1)
+
+
+def test_each_function_warns_for_itself():
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def same_name(a):
+        return a
+
+    first = same_name
+
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def same_name(a):  # noqa: F811
+        return a
+
+    with pytest.warns(DigestNotDigestedWarning):
+        first(1)
+    with pytest.warns(DigestNotDigestedWarning):
+        same_name(1)
+
+
+def test_an_interval_repeats_the_warning_with_its_count(monkeypatch):
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def repeated(a):
+        return a
+
+    monkeypatch.setattr(warning_counts, "REPEAT_INTERVAL", 0.0)
+    _raised(repeated, 1)
+    monkeypatch.setattr(warning_counts, "REPEAT_INTERVAL", 3600.0)
+    _raised(repeated, 1)
+    _raised(repeated, 1)
+    monkeypatch.setattr(warning_counts, "REPEAT_INTERVAL", 0.0)
+    warning, = _raised(repeated, 1)
+    assert "2 more occurrences" in str(warning.message)
+
+
+def test_reset_raises_again():
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def reset_me(a):
+        return a
+
+    _raised(reset_me, 1)
+    argdigest.warning_counts.reset()
+    with pytest.warns(DigestNotDigestedWarning):
+        reset_me(1)
+
+
+def test_contract_warnings_are_deduplicated_too():
+    @arg_digest(digestion_style="decorator", strictness="ignore", unknown_argument="warn")
+    def contracted(a):
+        return a
+
+    with pytest.warns(FunctionContractWarning):
+        contracted(1, typo=2)
+    assert _raised(contracted, 1, typo=2) == []
+    row, = [row for row in argdigest.warning_counts(f"{__name__}.contracted")
+            if row["warning"] == "FunctionContractWarning"]
+    assert row["occurrences"] == 2
+
+
+def test_missing_digesters_counter_comes_from_the_plan_counts():
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def counted(a):
+        return a
+
+    argdigest.stats.reset()
+    _raised(counted, 1)
+    _raised(counted, 1)
+    assert argdigest.stats()["counters"]["missing_digesters"] == {f"{__name__}.counted": 2}
+
+    # Each reset starts its own count over, and leaves the other alone.
+    argdigest.stats.reset()
+    _raised(counted, 1)
+    assert argdigest.stats()["counters"]["missing_digesters"] == {f"{__name__}.counted": 1}
+    row, = argdigest.warning_counts(f"{__name__}.counted")
+    assert (row["occurrences"], row["raised"]) == (3, 1)
+
+
+def test_occurrences_from_many_threads_add_up():
+    @arg_digest(digestion_style="decorator", strictness="warn")
+    def threaded(a):
+        return a
+
+    def run():
+        for _ in range(200):
+            threaded(1)
+
+    workers = [threading.Thread(target=run) for _ in range(4)]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    row, = argdigest.warning_counts(f"{__name__}.threaded")
+    assert (row["occurrences"], row["raised"]) == (800, 1)